@@ -1,14 +1,20 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Depends
+from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Request, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..services.pipeline import process_pdf
-from backend.app.modules.models.schemas import FamilySchema, DocumentSchema, DocumentListItemSchema, MonthlySummarySchema, TransactionSchema, GoalDeleteResponseSchema, DefaultFamilyResponseSchema
+from ..services.ingest_queue import ingest_queue
+from ..services.retention_sweeper import retention_sweeper
+from backend.app.modules.models.schemas import FamilySchema, DocumentSchema, DocumentListItemSchema, DocumentStatusSchema, MonthlySummarySchema, BudgetHealthSchema, TransactionSchema, GoalDeleteResponseSchema, DocumentDeleteResponseSchema, DefaultFamilyResponseSchema
+from .uploads import receive_pdf_upload
 from backend.app.auth.deps import get_current_user
 from backend.app.db.models import User
 from backend.app.db.session import get_async_session
-from backend.app.db.repositories.document_repo import create_document, list_documents
+from backend.app.db.repositories.document_repo import create_document, list_documents, get_document, delete_document
+from backend.app.db.repositories.job_repo import create_job, get_latest_job_for_document
+from backend.app.db.repositories.retention_repo import schedule_deletion
 import backend.app.db.repositories.membership_repo as membership_repo
 from backend.app.db.repositories.transaction_repo import bulk_create_transactions, list_transactions, top_expense_categories
-from backend.app.db.repositories.summary_repo import upsert_monthly_summaries, list_monthly_summaries
+from backend.app.db.repositories.summary_repo import list_monthly_summaries, list_category_summaries
+from backend.app.modules.budget.analyzer import analyze_budget_series
 from ..api.authz import assert_family_access
 from backend.app.db.repositories.goal_repo import create_goal as repo_create_goal, list_goals as repo_list_goals, delete_goal as repo_delete_goal
 from backend.app.modules.models.schemas import GoalCreateSchema, GoalWithProjectionSchema
@@ -31,14 +37,87 @@ async def create_family(family: FamilySchema):
 # Document upload (PDF)
 # -----------------------------------------------------------------
 @router.post("/documents/upload", response_model=DocumentSchema)
-async def upload_document_placeholder():
+async def upload_document(
+    request: Request,
+    family_id: str | None = None,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user),
+):
     """
-    Placeholder endpoint – actual file upload functionality requires
-    the optional 'python-multipart' package, which is not installed in
-    this test environment. This stub satisfies route registration without
-    triggering multipart validation.
+    Accept a statement PDF (multipart field "file") and queue it for
+    asynchronous processing. The body is streamed to disk chunk by chunk
+    and rejected as soon as it exceeds the size limit or is not a PDF.
+    Returns the Document with status "queued"; poll
+    /documents/{family_id}/{document_id}/status for progress.
     """
-    return {"detail": "Upload endpoint placeholder – multipart support not available."}
+    if family_id is None:
+        family_id = await membership_repo.get_default_family_id_for_user(session, current_user.id)
+        if family_id is None:
+            raise HTTPException(status_code=400, detail="No family found for user")
+    await assert_family_access(session, current_user.id, family_id)
+
+    upload = await receive_pdf_upload(request)
+    upload.sink.close()  # the queue reopens the file by path
+
+    doc = await create_document(
+        session,
+        family_id,
+        upload.filename,
+        status="queued",
+        content_sha256=upload.sink.sha256,
+    )
+    job = await create_job(session, doc.id, family_id, upload.sink.path)
+    # Backstop: the upload is deleted after AUTO_DELETE_DELAY even if the
+    # job never finishes (the queue normally removes it sooner)
+    delete_after = retention_sweeper.deadline()
+    await schedule_deletion(session, upload.sink.path, delete_after)
+    await session.commit()
+    retention_sweeper.track(upload.sink.path, delete_after)
+    ingest_queue.submit(job.id)
+    return DocumentSchema(
+        id=doc.id,
+        family_id=doc.family_id,
+        filename=doc.filename,
+        uploaded_at=doc.uploaded_at,
+        status=doc.status,
+    )
+
+@router.get("/documents/{family_id}/{document_id}/status", response_model=DocumentStatusSchema)
+async def get_document_status(
+    family_id: str,
+    document_id: str,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user),
+):
+    await assert_family_access(session, current_user.id, family_id)
+    doc = await get_document(session, family_id, document_id)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Document not found")
+    job = await get_latest_job_for_document(session, document_id)
+    return DocumentStatusSchema(
+        id=doc.id,
+        family_id=doc.family_id,
+        status=doc.status,
+        error=job.error if job else None,
+    )
+
+@router.delete("/documents/{family_id}/{document_id}", response_model=DocumentDeleteResponseSchema)
+async def remove_document(
+    family_id: str,
+    document_id: str,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user),
+):
+    await assert_family_access(session, current_user.id, family_id)
+    doc = await get_document(session, family_id, document_id)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Document not found")
+    if doc.status in ("queued", "processing"):
+        # The worker would persist its transactions after the delete
+        raise HTTPException(status_code=409, detail="Document is still being processed")
+    months = await delete_document(session, family_id, document_id)
+    await session.commit()
+    return DocumentDeleteResponseSchema(deleted=True, months_updated=months)
 
 # -----------------------------------------------------------------
 # Summary endpoint – uses normalization layer
@@ -53,6 +132,40 @@ async def get_summary(
     rows = await list_monthly_summaries(session, family_id)
     return rows
 
+# "YYYY-MM", as stored in MonthlySummary.month
+MONTH_PATTERN = r"^\d{4}-\d{2}$"
+
+@router.get("/summary/{family_id}/health", response_model=list[BudgetHealthSchema])
+async def get_budget_health(
+    family_id: str,
+    start: str | None = Query(None, alias="from", pattern=MONTH_PATTERN),
+    end: str | None = Query(None, alias="to", pattern=MONTH_PATTERN),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Budget health (`analyze_budget` metrics) for every month in the
+    inclusive from/to range, oldest first. Only the requested months'
+    summaries and category rollups are read, and all months are analysed
+    in one pass.
+    """
+    await assert_family_access(session, current_user.id, family_id)
+    summaries = await list_monthly_summaries(session, family_id, start=start, end=end)
+    categories: dict = {}
+    for row in await list_category_summaries(session, family_id, start=start, end=end):
+        categories.setdefault(row.month, {})[row.category] = row.total
+    months = [
+        {"month": s.month, "income": s.income, "expenses": s.expenses,
+         "categories": categories.get(s.month, {})}
+        for s in reversed(summaries)
+    ]
+    return [
+        BudgetHealthSchema(
+            month=month["month"], income=month["income"], expenses=month["expenses"], **health
+        )
+        for month, health in zip(months, analyze_budget_series(months))
+    ]
+
 @router.get("/documents/{family_id}", response_model=list[DocumentListItemSchema])
 async def get_documents(
     family_id: str,
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from ..modules.security.config import SecurityConfig
+from ..modules.security.upload import UploadSink, UploadTooLarge
+
+# Allowance for multipart boundaries and part headers on top of the file itself
+_MULTIPART_OVERHEAD = 16 * 1024
+
+
+@dataclass
+class StreamedUpload:
+    """
+    A PDF received by `receive_pdf_upload`: the finished sink (open file,
+    size, SHA-256) plus the client-supplied filename.
+    """
+    sink: UploadSink
+    filename: str
+
+
+class _PartCollector:
+    """
+    MultipartParser callbacks that route the bytes of one form field into
+    an UploadSink as they arrive and ignore every other part.
+    """
+
+    def __init__(self, field_name: str, sink: UploadSink):
+        self.field_name = field_name
+        self.sink = sink
+        self.filename = ""
+        self.found = False
+        self._headers: dict = {}
+        self._field = b""
+        self._value = b""
+        self._active = False
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self._part_begin,
+            "on_header_field": lambda data, start, end: self._append("_field", data[start:end]),
+            "on_header_value": lambda data, start, end: self._append("_value", data[start:end]),
+            "on_header_end": self._header_end,
+            "on_headers_finished": self._headers_finished,
+            "on_part_data": self._part_data,
+        }
+
+    def _append(self, attr: str, data: bytes) -> None:
+        setattr(self, attr, getattr(self, attr) + data)
+
+    def _part_begin(self) -> None:
+        self._headers = {}
+        self._active = False
+
+    def _header_end(self) -> None:
+        self._headers[self._field.lower()] = self._value
+        self._field, self._value = b"", b""
+
+    def _headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if options.get(b"name", b"").decode("latin-1") != self.field_name or self.found:
+            return
+        mime_type = self._headers.get(b"content-type", b"").decode("latin-1").strip()
+        if mime_type not in SecurityConfig.ALLOWED_MIME_TYPES:
+            raise ValueError(f"Disallowed MIME type: {mime_type}")
+        self.filename = options.get(b"filename", b"").decode("utf-8", "replace")
+        self.found = True
+        self._active = True
+
+    def _part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._active:
+            self.sink.write(data[start:end])
+
+
+async def receive_pdf_upload(request: Request, field_name: str = "file") -> StreamedUpload:
+    """
+    Stream a multipart/form-data request body chunk by chunk into an
+    UploadSink. Nothing beyond the current network chunk is held in memory.
+    - 413 as soon as the declared or received size crosses MAX_UPLOAD_SIZE.
+    - 400 for a malformed body, a missing field, a disallowed MIME type or
+      content that is not a PDF.
+    The temp file is deleted on any rejection.
+    """
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and (
+        int(declared) > SecurityConfig.MAX_UPLOAD_SIZE + _MULTIPART_OVERHEAD
+    ):
+        raise HTTPException(
+            status_code=413,
+            detail=f"File exceeds maximum size of {SecurityConfig.MAX_UPLOAD_SIZE} bytes",
+        )
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    boundary = options.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail="Expected multipart/form-data")
+
+    sink = UploadSink()
+    collector = _PartCollector(field_name, sink)
+    parser = MultipartParser(boundary, collector.callbacks())
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+        parser.finalize()
+        if not collector.found:
+            raise ValueError(f"Missing form field: {field_name}")
+        sink.finish()
+    except UploadTooLarge as exc:
+        sink.discard()
+        raise HTTPException(status_code=413, detail=str(exc))
+    except Exception as exc:
+        sink.discard()
+        detail = str(exc) if isinstance(exc, ValueError) else "Malformed upload"
+        raise HTTPException(status_code=400, detail=detail)
+    return StreamedUpload(sink=sink, filename=collector.filename or "upload.pdf")
@@ -0,0 +1,96 @@
+"""
+Bounded, thread-safe LRU shared by the in-process caches (extraction
+results, layout column maps, categorizations).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class BoundedLRU(Generic[V]):
+    """
+    Least-recently-used map bounded by entry count and, optionally, by the
+    total of the sizes given to `put`, with an optional TTL per entry.
+    Counts hits, misses and evictions (capacity or expiry). Subclasses add
+    their own counters under `self._lock` and extend `stats`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (value, size, expiry time or None)
+        self._entries: "OrderedDict[Hashable, Tuple[V, int, Optional[float]]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the live entry for `key` (marking it most recently used) or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= self._clock():
+                self._discard(key)
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: V, size: int = 0) -> None:
+        """
+        Store an entry, evicting least recently used entries until both
+        bounds hold. An entry larger than `max_size` on its own is not stored.
+        """
+        if self.max_size is not None and size > self.max_size:
+            return
+        expires = self._clock() + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (value, size, expires)
+            self._size += size
+            while len(self._entries) > self.max_entries or (
+                self.max_size is not None and self._size > self.max_size
+            ):
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
@@ -7,8 +7,13 @@ from .document import Document
 from .transaction import Transaction
 from .goal import Goal
 from .monthly_summary import MonthlySummary
+from .monthly_category_summary import MonthlyCategorySummary
 from .user import User
 from .membership import Membership
+from .ingest_job import IngestJob
+from .retention_entry import RetentionEntry
+from .merchant import Merchant
+from .category_limit_breach import CategoryLimitBreach
 
 __all__ = [
     "Family",
@@ -17,6 +22,11 @@ __all__ = [
     "Transaction",
     "Goal",
     "MonthlySummary",
+    "MonthlyCategorySummary",
     "User",
     "Membership",
+    "IngestJob",
+    "RetentionEntry",
+    "Merchant",
+    "CategoryLimitBreach",
 ]
@@ -0,0 +1,24 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, UniqueConstraint
+from ..base import Base
+
+class CategoryLimitBreach(Base):
+    """
+    A family month whose spend in a limited category (see
+    `budget.thresholds.CATEGORY_LIMITS`) exceeded its share of income.
+    Rewritten for each family every time the limits are evaluated.
+    """
+    __tablename__ = "category_limit_breach"
+    __table_args__ = (
+        UniqueConstraint('family_id', 'month', 'category', name='uq_breach_family_month_category'),
+    )
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    family_id = Column(String(36), ForeignKey("family.id"), nullable=False)
+    month = Column(String, nullable=False)  # format YYYY‑MM
+    category = Column(String, nullable=False)
+    spend = Column(Float, nullable=False)
+    income = Column(Float, nullable=False)
+    limit_share = Column(Float, nullable=False)  # e.g. 0.35 of income
+    share = Column(Float, nullable=True)  # spend / income; None without income
+    evaluated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
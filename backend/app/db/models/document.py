@@ -18,6 +18,7 @@ class Document(Base):
     uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     status = Column(String, nullable=False, default="processed")
     source_type = Column(String, nullable=False, default="bank_statement_v1")
+    content_sha256 = Column(String(64), nullable=True, index=True)  # hash of the uploaded bytes
     # owner_id and owner relationship removed to simplify ownership model
     family = relationship("Family", back_populates="documents")
     transactions = relationship("Transaction", back_populates="document", cascade="all, delete-orphan")
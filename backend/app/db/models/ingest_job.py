@@ -0,0 +1,30 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+
+from ..base import Base
+
+class IngestJob(Base):
+    """
+    Durable work item for asynchronous document ingestion.
+    status: queued → processing → done | failed
+    A worker claims a queued job by moving it to processing; claimed_at
+    identifies that claim and updated_at is its heartbeat. Queued jobs,
+    and processing jobs whose heartbeat has gone stale, are resumed.
+    """
+    __tablename__ = "ingest_job"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    document_id = Column(String(36), ForeignKey("document.id"), nullable=False, index=True)
+    family_id = Column(String(36), ForeignKey("family.id"), nullable=False)
+    file_path = Column(String, nullable=False)  # temp upload, deleted once processed
+    status = Column(String, nullable=False, default="queued", index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(String, nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    document = relationship("Document")
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime, Float
+
+from ..base import Base
+
+class Merchant(Base):
+    """
+    Merchant dimension: one row per canonical merchant key (see
+    `normalize.merchants.merchant_key`) with its resolved category.
+    Transactions reference it by the compact integer id. The row is
+    re-resolved when the category rules it was resolved under
+    (`rules_fingerprint`) change.
+    """
+    __tablename__ = "merchant"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    key = Column(String, nullable=False, unique=True)
+    category = Column(String, nullable=False)
+    confidence = Column(Float, nullable=False)  # base confidence, before amount adjustment
+    rules_fingerprint = Column(String(16), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
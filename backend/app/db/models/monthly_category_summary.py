@@ -0,0 +1,24 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Integer, UniqueConstraint
+from ..base import Base
+
+class MonthlyCategorySummary(Base):
+    """
+    Per-category rollup of a family's month: the absolute amounts of its
+    transactions in that category, as in `aggregate_by_month` "categories",
+    and of its expenses alone (refunds and credits excluded).
+    Maintained incrementally alongside MonthlySummary.
+    """
+    __tablename__ = "monthly_category_summary"
+    __table_args__ = (
+        UniqueConstraint('family_id', 'month', 'category', name='uq_family_month_category'),
+    )
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    family_id = Column(String(36), ForeignKey("family.id"), nullable=False)
+    month = Column(String, nullable=False)  # format YYYY‑MM
+    category = Column(String, nullable=False)
+    total = Column(Float, nullable=False)
+    expense_total = Column(Float, nullable=False, default=0.0, server_default="0")
+    transaction_count = Column(Integer, nullable=False, default=0, server_default="0")
+    generated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
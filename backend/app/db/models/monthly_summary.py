@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Float, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 from ..base import Base
 
@@ -14,6 +14,8 @@ class MonthlySummary(Base):
     expenses = Column(Float, nullable=False)
     savings = Column(Float, nullable=False)
     savings_rate = Column(Float, nullable=False)  # ratio or percent
+    # Transactions behind the totals; the row is dropped when it reaches 0
+    transaction_count = Column(Integer, nullable=False, default=0, server_default="0")
     generated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     family = relationship("Family", backref="monthly_summaries")
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import Column, String, DateTime
+
+from ..base import Base
+
+class RetentionEntry(Base):
+    """
+    A temp file scheduled for deletion once `delete_after` (UTC) has passed.
+    Rows are removed by the retention sweeper after the file is deleted, so
+    deletions still pending at shutdown are carried out after a restart.
+    """
+    __tablename__ = "retention_entry"
+
+    file_path = Column(String, primary_key=True)
+    delete_after = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Enum, Integer
 from sqlalchemy.orm import relationship
 
 from ..base import Base
@@ -22,8 +22,10 @@ class Transaction(Base):
     category = Column(String, nullable=False)
     subcategory = Column(String, nullable=True)
     confidence = Column(Float, nullable=False)
+    merchant_id = Column(Integer, ForeignKey("merchant.id"), nullable=True, index=True)
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     document = relationship("Document", back_populates="transactions")
     family = relationship("Family", back_populates="transactions")
+    merchant = relationship("Merchant")
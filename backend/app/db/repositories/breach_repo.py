@@ -0,0 +1,94 @@
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import and_, case, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.category_limit_breach import CategoryLimitBreach
+from ..models.monthly_category_summary import MonthlyCategorySummary
+from ..models.monthly_summary import MonthlySummary
+
+async def find_breaches(
+    session: AsyncSession,
+    first_family_id: str,
+    last_family_id: str,
+    limits: Dict[str, float],
+) -> List[Dict]:
+    """
+    Return every (family, month, category) in the family id range
+    [first_family_id, last_family_id] whose category spend (expenses
+    only; refunds and credits do not count) exceeds its `limits` share of
+    the month's income, with one query over the category
+    rollups joined to the monthly summaries. Only breaching rows leave the
+    database.
+    """
+    if not limits:
+        return []
+    category = MonthlyCategorySummary
+    summary = MonthlySummary
+    limit_share = case(limits, value=category.category)
+    stmt = select(
+        category.family_id,
+        category.month,
+        category.category,
+        category.expense_total.label("spend"),
+        summary.income,
+        limit_share.label("limit_share"),
+    ).join(
+        summary,
+        and_(summary.family_id == category.family_id, summary.month == category.month),
+    ).where(
+        category.family_id >= first_family_id,
+        category.family_id <= last_family_id,
+        category.category.in_(list(limits)),
+        category.expense_total > summary.income * limit_share,
+    )
+    result = await session.execute(stmt)
+    return [
+        {
+            "family_id": row.family_id,
+            "month": row.month,
+            "category": row.category,
+            "spend": row.spend,
+            "income": row.income,
+            "limit_share": row.limit_share,
+            "share": row.spend / row.income if row.income > 0 else None,
+        }
+        for row in result.all()
+    ]
+
+async def replace_breaches(
+    session: AsyncSession,
+    first_family_id: str,
+    last_family_id: str,
+    breaches: List[Dict],
+) -> int:
+    """
+    Replace the stored breaches of the family id range with `breaches`
+    (from `find_breaches`): one DELETE and one multi-row INSERT.
+    Does NOT commit; caller must manage the transaction.
+    Returns the number of breaches stored.
+    """
+    await session.execute(
+        delete(CategoryLimitBreach).where(
+            CategoryLimitBreach.family_id >= first_family_id,
+            CategoryLimitBreach.family_id <= last_family_id,
+        )
+    )
+    if breaches:
+        now = datetime.utcnow()
+        await session.execute(
+            insert(CategoryLimitBreach.__table__),
+            [dict(breach, evaluated_at=now) for breach in breaches],
+        )
+    return len(breaches)
+
+async def list_breaches(session: AsyncSession, family_id: str):
+    """
+    Return the stored CategoryLimitBreach rows of a family, ordered by
+    month descending, then category.
+    """
+    stmt = select(CategoryLimitBreach).where(
+        CategoryLimitBreach.family_id == family_id
+    ).order_by(CategoryLimitBreach.month.desc(), CategoryLimitBreach.category)
+    result = await session.execute(stmt)
+    return result.scalars().all()
@@ -1,14 +1,19 @@
 import uuid
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from ..models.document import Document
+from ..models.ingest_job import IngestJob
+from ..models.transaction import Transaction
+from .summary_repo import remove_documents_from_summaries
 
 async def create_document(
     session: AsyncSession,
     family_id: str,
     filename: str,
     source_type: str = "bank_statement_v1",
+    status: str = "processed",
+    content_sha256: str | None = None,
 ) -> Document:
     """
     Create a Document row with default status "processed".
@@ -19,8 +24,9 @@ async def create_document(
         family_id=family_id,
         filename=filename,
         uploaded_at=datetime.utcnow(),
-        status="processed",
+        status=status,
         source_type=source_type,
+        content_sha256=content_sha256,
     )
     session.add(doc)
     await session.flush()
@@ -36,3 +42,42 @@ async def list_documents(session: AsyncSession, family_id: str):
     ).order_by(Document.uploaded_at.desc())
     result = await session.execute(stmt)
     return result.scalars().all()
+
+async def get_document(session: AsyncSession, family_id: str, document_id: str):
+    """
+    Return the Document row with the given id in the given family, or None.
+    """
+    stmt = select(Document).where(
+        Document.family_id == family_id,
+        Document.id == document_id,
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
+
+async def set_document_status(session: AsyncSession, document_id: str, status: str) -> None:
+    """
+    Update the status of a Document row (queued, processing, processed, failed).
+    Does NOT commit; caller must manage the transaction.
+    """
+    result = await session.execute(select(Document).where(Document.id == document_id))
+    doc = result.scalar_one_or_none()
+    if doc is not None:
+        doc.status = status
+        await session.flush()
+
+async def delete_document(session: AsyncSession, family_id: str, document_id: str) -> int | None:
+    """
+    Delete a Document with its transactions and ingest jobs, first taking
+    its transactions out of the family's monthly summaries.
+    Return the number of summary months updated, or None if not found.
+    Does NOT commit; caller must manage the transaction.
+    """
+    doc = await get_document(session, family_id, document_id)
+    if doc is None:
+        return None
+    months = await remove_documents_from_summaries(session, family_id, [document_id])
+    await session.execute(delete(Transaction).where(Transaction.document_id == document_id))
+    await session.execute(delete(IngestJob).where(IngestJob.document_id == document_id))
+    await session.delete(doc)
+    await session.flush()
+    return months
@@ -15,3 +15,14 @@ async def create_family(session, name: str = "My Family") -> Family:
 async def get_family_by_id(session, family_id: str):
     result = await session.execute(select(Family).where(Family.id == family_id))
     return result.scalar_one_or_none()
+
+async def list_family_ids(session, after: str | None = None, limit: int = 1000) -> list[str]:
+    """
+    Return up to `limit` family ids in id order, starting after `after` –
+    keyset pagination for jobs that walk every family.
+    """
+    stmt = select(Family.id).order_by(Family.id).limit(limit)
+    if after is not None:
+        stmt = stmt.where(Family.id > after)
+    result = await session.execute(stmt)
+    return list(result.scalars())
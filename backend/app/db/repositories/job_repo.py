@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from ..models.ingest_job import IngestJob
+
+async def create_job(
+    session: AsyncSession,
+    document_id: str,
+    family_id: str,
+    file_path: str,
+) -> IngestJob:
+    """
+    Create a queued IngestJob row.
+    Does NOT commit; caller must manage the transaction.
+    """
+    job = IngestJob(
+        document_id=document_id,
+        family_id=family_id,
+        file_path=file_path,
+        status="queued",
+        attempts=0,
+    )
+    session.add(job)
+    await session.flush()
+    return job
+
+async def get_job(session: AsyncSession, job_id: str) -> Optional[IngestJob]:
+    result = await session.execute(select(IngestJob).where(IngestJob.id == job_id))
+    return result.scalar_one_or_none()
+
+async def list_queued_jobs(session: AsyncSession) -> List[IngestJob]:
+    """Return jobs waiting to be claimed, oldest first."""
+    stmt = (
+        select(IngestJob)
+        .where(IngestJob.status == "queued")
+        .order_by(IngestJob.created_at.asc())
+    )
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+async def requeue_stale_jobs(session: AsyncSession, stale_before: datetime) -> int:
+    """
+    Put processing jobs whose heartbeat (updated_at) is older than
+    `stale_before` back to queued, e.g. after their worker's process died.
+    Returns the number of jobs requeued; does NOT commit.
+    """
+    result = await session.execute(
+        update(IngestJob)
+        .where(IngestJob.status == "processing", IngestJob.updated_at < stale_before)
+        .values(status="queued", updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+async def claim_job(session: AsyncSession, job_id: str) -> Optional[datetime]:
+    """
+    Move a queued job to processing and count the attempt in one
+    conditional UPDATE, so only one worker (in any process) can win it.
+    Returns the claim time – the caller's token for `heartbeat_job` and
+    `release_job` – or None if the job was not queued. Does NOT commit.
+    """
+    claimed_at = datetime.utcnow()
+    result = await session.execute(
+        update(IngestJob)
+        .where(IngestJob.id == job_id, IngestJob.status == "queued")
+        .values(
+            status="processing",
+            attempts=IngestJob.attempts + 1,
+            claimed_at=claimed_at,
+            updated_at=claimed_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return claimed_at if result.rowcount == 1 else None
+
+def _claimed(job_id: str, claimed_at: datetime):
+    return (
+        IngestJob.id == job_id,
+        IngestJob.status == "processing",
+        IngestJob.claimed_at == claimed_at,
+    )
+
+async def heartbeat_job(session: AsyncSession, job_id: str, claimed_at: datetime) -> bool:
+    """
+    Refresh the heartbeat of a job still held under `claimed_at`.
+    Returns False if the claim was lost; does NOT commit.
+    """
+    result = await session.execute(
+        update(IngestJob)
+        .where(*_claimed(job_id, claimed_at))
+        .values(updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+async def release_job(
+    session: AsyncSession,
+    job_id: str,
+    claimed_at: datetime,
+    status: str,
+    error: str | None = None,
+) -> bool:
+    """
+    Move a job held under `claimed_at` out of processing (to done, failed
+    or back to queued). Returns False, changing nothing, if the job has
+    since been requeued or claimed by another worker. Does NOT commit.
+    """
+    result = await session.execute(
+        update(IngestJob)
+        .where(*_claimed(job_id, claimed_at))
+        .values(status=status, error=error, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+async def get_latest_job_for_document(session: AsyncSession, document_id: str) -> Optional[IngestJob]:
+    """Return the most recent job for a document, or None."""
+    stmt = (
+        select(IngestJob)
+        .where(IngestJob.document_id == document_id)
+        .order_by(IngestJob.created_at.desc())
+        .limit(1)
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
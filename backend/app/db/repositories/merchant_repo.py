@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.merchant import Merchant
+from ..upsert import dialect_insert
+from ...modules.normalize.category_rules import CategoryMatcher, categorize, get_category_matcher
+
+# Keys per SELECT ... IN (...), well under SQLite's bound-parameter limit
+LOOKUP_CHUNK = 500
+
+async def get_merchants(session: AsyncSession, keys: List[str]) -> Dict[str, Merchant]:
+    """Return the existing Merchant rows for `keys`, by key."""
+    found: Dict[str, Merchant] = {}
+    for start in range(0, len(keys), LOOKUP_CHUNK):
+        chunk = keys[start:start + LOOKUP_CHUNK]
+        result = await session.execute(select(Merchant).where(Merchant.key.in_(chunk)))
+        for merchant in result.scalars():
+            found[merchant.key] = merchant
+    return found
+
+async def resolve_merchants(
+    session: AsyncSession,
+    descriptions: Dict[str, str],
+    matcher: Optional[CategoryMatcher] = None,
+) -> Dict[str, Merchant]:
+    """
+    Return a Merchant for every key of `descriptions` (merchant key → one
+    description carrying it, keyed with `matcher`) with a single bulk
+    lookup. Known merchants keep their stored category; only new keys, and
+    merchants resolved under different CATEGORY_RULES, are categorized
+    (from the given description) and inserted or updated.
+    New keys are inserted with ON CONFLICT DO NOTHING and then read back,
+    so a concurrent transaction inserting the same merchant wins the row
+    instead of failing this one.
+    Does NOT commit; caller must manage the transaction.
+    """
+    if not descriptions:
+        return {}
+    matcher = matcher or get_category_matcher()
+    merchants = await get_merchants(session, list(descriptions))
+    new_rows = []
+    for key, description in descriptions.items():
+        merchant = merchants.get(key)
+        if merchant is not None and merchant.rules_fingerprint == matcher.fingerprint:
+            continue
+        category, confidence = categorize(description, matcher)
+        if merchant is None:
+            new_rows.append({
+                "key": key,
+                "category": category,
+                "confidence": confidence,
+                "rules_fingerprint": matcher.fingerprint,
+            })
+        else:
+            merchant.category = category
+            merchant.confidence = confidence
+            merchant.rules_fingerprint = matcher.fingerprint
+            merchant.updated_at = datetime.utcnow()
+    if new_rows:
+        stmt = dialect_insert(session, Merchant.__table__).on_conflict_do_nothing(
+            index_elements=["key"]
+        )
+        await session.execute(stmt, new_rows)
+        merchants.update(await get_merchants(session, [row["key"] for row in new_rows]))
+    await session.flush()
+    return merchants
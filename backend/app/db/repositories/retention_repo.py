@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Iterable, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.retention_entry import RetentionEntry
+
+async def schedule_deletion(
+    session: AsyncSession,
+    file_path: str,
+    delete_after: datetime,
+) -> RetentionEntry:
+    """
+    Record (or move) the deletion deadline of a temp file.
+    Does NOT commit; caller must manage the transaction.
+    """
+    entry = await session.get(RetentionEntry, file_path)
+    if entry is None:
+        entry = RetentionEntry(file_path=file_path, delete_after=delete_after)
+        session.add(entry)
+    else:
+        entry.delete_after = delete_after
+    await session.flush()
+    return entry
+
+async def list_pending_deletions(session: AsyncSession) -> List[RetentionEntry]:
+    """Return every scheduled deletion, earliest deadline first."""
+    stmt = select(RetentionEntry).order_by(RetentionEntry.delete_after.asc())
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+async def delete_entries(session: AsyncSession, file_paths: Iterable[str]) -> None:
+    """Remove the rows of the given paths in one statement; does NOT commit."""
+    paths = list(file_paths)
+    if paths:
+        await session.execute(delete(RetentionEntry).where(RetentionEntry.file_path.in_(paths)))
@@ -1,63 +1,234 @@
 import uuid
 from datetime import datetime
+from typing import Dict, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import case, delete, func, select, update
+from ..models.monthly_category_summary import MonthlyCategorySummary
 from ..models.monthly_summary import MonthlySummary
+from ..models.transaction import Transaction
+from ..upsert import dialect_insert
 
-async def upsert_monthly_summaries(
+async def list_monthly_summaries(
     session: AsyncSession,
     family_id: str,
-    monthly: dict,
-) -> int:
+    start: str | None = None,
+    end: str | None = None,
+):
+    """
+    Return a list of MonthlySummary rows for the given family,
+    ordered by month descending. `start`/`end` ("YYYY-MM", inclusive)
+    bound the months read.
+    """
+    stmt = select(MonthlySummary).where(
+        MonthlySummary.family_id == family_id
+    )
+    if start:
+        stmt = stmt.where(MonthlySummary.month >= start)
+    if end:
+        stmt = stmt.where(MonthlySummary.month <= end)
+    stmt = stmt.order_by(MonthlySummary.month.desc())
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+async def document_deltas(
+    session: AsyncSession,
+    family_id: str,
+    document_ids: List[str],
+) -> Dict[str, Dict]:
     """
-    Upsert MonthlySummary rows for each month in the provided dict.
-    Input format:
+    Per-month totals of the stored transactions of `document_ids`, read
+    with one grouped query – the amounts these documents add to (or, when
+    removed, take from) the family's summaries. Months and categories are
+    counted as in `aggregate_by_month`:
         {
-            "2023-01": {"income": ..., "expenses": ..., "savings": ..., "savings_rate": ...},
+            "2024-01": {
+                "income": ..., "expenses": ..., "transactions": n,
+                "categories": {
+                    "Food": {"total": ..., "expenses": ..., "transactions": n}, ...
+                },
+            },
             ...
         }
-    Returns the number of rows upserted/created.
     """
-    count = 0
-    for month, data in monthly.items():
-        stmt = select(MonthlySummary).where(
-            MonthlySummary.family_id == family_id,
-            MonthlySummary.month == month,
+    if not document_ids:
+        return {}
+    month = func.substr(Transaction.date, 1, 7)
+    stmt = select(
+        month.label("month"),
+        Transaction.direction,
+        Transaction.category,
+        func.sum(Transaction.amount).label("amount"),
+        func.sum(func.abs(Transaction.amount)).label("magnitude"),
+        func.count().label("transactions"),
+    ).where(
+        Transaction.family_id == family_id,
+        Transaction.document_id.in_(document_ids),
+    ).group_by(month, Transaction.direction, Transaction.category)
+    result = await session.execute(stmt)
+
+    deltas: Dict[str, Dict] = {}
+    for row in result.all():
+        data = deltas.setdefault(
+            row.month, {"income": 0.0, "expenses": 0.0, "transactions": 0, "categories": {}}
         )
-        result = await session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            existing.income = data.get("income", 0.0)
-            existing.expenses = data.get("expenses", 0.0)
-            existing.savings = data.get("savings", 0.0)
-            existing.savings_rate = data.get("savings_rate", 0.0)
-            existing.generated_at = datetime.utcnow()
+        if row.direction == "income":
+            data["income"] += row.amount
         else:
-            new = MonthlySummary(
-                id=str(uuid.uuid4()),
-                family_id=family_id,
-                month=month,
-                income=data.get("income", 0.0),
-                expenses=data.get("expenses", 0.0),
-                savings=data.get("savings", 0.0),
-                savings_rate=data.get("savings_rate", 0.0),
-                generated_at=datetime.utcnow(),
-            )
-            session.add(new)
+            data["expenses"] += row.magnitude
+        data["transactions"] += row.transactions
+        category = data["categories"].setdefault(
+            row.category, {"total": 0.0, "expenses": 0.0, "transactions": 0}
+        )
+        category["total"] += row.magnitude
+        if row.direction != "income":
+            category["expenses"] += row.magnitude
+        category["transactions"] += row.transactions
+    return deltas
 
-        count += 1
+async def _increment(session: AsyncSession, model, keys, counters, rows: List[Dict]) -> None:
+    """
+    Insert `rows` into `model`'s table, or add their `counters` to the row
+    already holding the same `keys`, with one INSERT ... ON CONFLICT DO
+    UPDATE. Concurrent writers of the same row add up in the database
+    instead of racing to insert it.
+    """
+    if not rows:
+        return
+    table = model.__table__
+    stmt = dialect_insert(session, table)
+    values = {name: table.c[name] + stmt.excluded[name] for name in counters}
+    values["generated_at"] = stmt.excluded.generated_at
+    await session.execute(stmt.on_conflict_do_update(index_elements=keys, set_=values), rows)
+
+async def apply_monthly_deltas(
+    session: AsyncSession,
+    family_id: str,
+    deltas: Dict[str, Dict],
+    sign: int = 1,
+) -> int:
+    """
+    Add `deltas` (from `document_deltas`) to the family's MonthlySummary and
+    MonthlyCategorySummary rows, or subtract them with `sign=-1`. Rows are
+    upserted with the totals incremented in SQL (`income = income +
+    excluded.income`), so concurrent ingests for the same month neither
+    overwrite each other nor collide inserting it; savings and
+    savings_rate are then recomputed, and rows left with no transactions
+    are dropped. Run it in the same transaction as the insert or delete
+    of the transactions so summaries and rows change together.
+    Does NOT commit; caller must manage the transaction.
+    Returns the number of months touched.
+    """
+    if not deltas:
+        return 0
+    now = datetime.utcnow()
+    summary_rows, category_rows = [], []
+    for month, data in deltas.items():
+        summary_rows.append({
+            "id": str(uuid.uuid4()),
+            "family_id": family_id,
+            "month": month,
+            "income": sign * data["income"],
+            "expenses": sign * data["expenses"],
+            "savings": 0.0,
+            "savings_rate": 0.0,
+            "transaction_count": sign * data["transactions"],
+            "generated_at": now,
+        })
+        for category, totals in data["categories"].items():
+            category_rows.append({
+                "id": str(uuid.uuid4()),
+                "family_id": family_id,
+                "month": month,
+                "category": category,
+                "total": sign * totals["total"],
+                "expense_total": sign * totals["expenses"],
+                "transaction_count": sign * totals["transactions"],
+                "generated_at": now,
+            })
+    await _increment(
+        session, MonthlySummary, ["family_id", "month"],
+        ("income", "expenses", "transaction_count"), summary_rows,
+    )
+    await _increment(
+        session, MonthlyCategorySummary, ["family_id", "month", "category"],
+        ("total", "expense_total", "transaction_count"), category_rows,
+    )
+    await session.flush()
 
+    months = list(deltas)
+    savings = MonthlySummary.income - MonthlySummary.expenses
+    await session.execute(
+        update(MonthlySummary)
+        .where(MonthlySummary.family_id == family_id, MonthlySummary.month.in_(months))
+        .values(
+            savings=savings,
+            savings_rate=case(
+                (MonthlySummary.income > 0, savings / MonthlySummary.income), else_=0.0
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    for model in (MonthlySummary, MonthlyCategorySummary):
+        await session.execute(
+            delete(model)
+            .where(
+                model.family_id == family_id,
+                model.month.in_(months),
+                model.transaction_count <= 0,
+            )
+            .execution_options(synchronize_session=False)
+        )
     await session.flush()
-    return count
+    return len(months)
 
-async def list_monthly_summaries(session: AsyncSession, family_id: str):
+async def add_documents_to_summaries(
+    session: AsyncSession,
+    family_id: str,
+    document_ids: List[str],
+) -> int:
     """
-    Return a list of MonthlySummary rows for the given family,
-    ordered by month descending.
+    Fold the just-inserted transactions of `document_ids` into the family's
+    summaries. Does NOT commit. Returns the number of months touched.
     """
-    stmt = select(MonthlySummary).where(
-        MonthlySummary.family_id == family_id
-    ).order_by(MonthlySummary.month.desc())
+    deltas = await document_deltas(session, family_id, document_ids)
+    return await apply_monthly_deltas(session, family_id, deltas)
+
+async def remove_documents_from_summaries(
+    session: AsyncSession,
+    family_id: str,
+    document_ids: List[str],
+) -> int:
+    """
+    Reverse `add_documents_to_summaries`: subtract the documents'
+    transactions from the summaries. Call it before the transactions are
+    deleted. Does NOT commit. Returns the number of months touched.
+    """
+    deltas = await document_deltas(session, family_id, document_ids)
+    return await apply_monthly_deltas(session, family_id, deltas, sign=-1)
+
+async def list_category_summaries(
+    session: AsyncSession,
+    family_id: str,
+    month: str | None = None,
+    start: str | None = None,
+    end: str | None = None,
+):
+    """
+    Return the MonthlyCategorySummary rows for the given family (one
+    `month`, or the inclusive `start`/`end` range), ordered by month
+    descending, then by total descending and category name.
+    """
+    stmt = select(MonthlyCategorySummary).where(MonthlyCategorySummary.family_id == family_id)
+    if month:
+        stmt = stmt.where(MonthlyCategorySummary.month == month)
+    if start:
+        stmt = stmt.where(MonthlyCategorySummary.month >= start)
+    if end:
+        stmt = stmt.where(MonthlyCategorySummary.month <= end)
+    stmt = stmt.order_by(
+        MonthlyCategorySummary.month.desc(),
+        MonthlyCategorySummary.total.desc(),
+        MonthlyCategorySummary.category,
+    )
     result = await session.execute(stmt)
     return result.scalars().all()
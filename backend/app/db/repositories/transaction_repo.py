@@ -1,44 +1,79 @@
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.transaction import Transaction
+from .merchant_repo import resolve_merchants
+from ...modules.normalize.batch import TransactionBatch
+from ...modules.normalize.category_rules import get_category_matcher
+from ...modules.normalize.confidence import adjust_confidence
+from ...modules.normalize.merchants import merchant_key
+from ...modules.privacy.guardrails import find_unsafe
+from ...modules.privacy.redactor import redact_text
 
 async def bulk_create_transactions(
     session: AsyncSession,
     document_id: str,
     family_id: str,
-    txns: list[dict],
+    txns: list[dict] | TransactionBatch,
 ) -> int:
     """
     Bulk insert Transaction rows linked to a Document.
+    `txns` is a list of transaction dicts or a TransactionBatch, whose
+    columns are read directly.
     - Guarantees a non‑null date (defaults to "1970-01-01").
     - Guarantees amount is a float.
     - Guarantees direction is "income" or "expense"; if missing, infer from amount sign.
+    - Guarantees no description carries unredacted sensitive data: all
+      descriptions are verified in one batch and any offender is redacted.
+    - Links every row to its Merchant, resolved for the whole batch with one
+      bulk lookup; the merchant's category replaces per-row matching.
     Returns the number of rows inserted.
     """
     if not txns:
         return 0
 
+    if isinstance(txns, TransactionBatch):
+        dates, amounts = txns.dates, txns.amounts
+        directions, subcategories = txns.directions, txns.subcategories
+        descriptions = [description or "" for description in txns.descriptions]
+    else:
+        dates = [tx.get("date") for tx in txns]
+        amounts = [tx.get("amount", 0.0) for tx in txns]
+        directions = [tx.get("direction") for tx in txns]
+        subcategories = [tx.get("subcategory") for tx in txns]
+        descriptions = [tx.get("description") or "" for tx in txns]
+    for index in find_unsafe(descriptions):
+        descriptions[index] = redact_text(descriptions[index])[0]
+
+    matcher = get_category_matcher()
+    keys = [merchant_key(description, matcher) for description in descriptions]
+    representatives = {}
+    for key, description in zip(keys, descriptions):
+        representatives.setdefault(key, description)
+    merchants = await resolve_merchants(session, representatives, matcher)
+
     objs = []
-    for tx in txns:
+    rows = zip(dates, amounts, directions, subcategories, descriptions, keys)
+    for tx_date, tx_amount, tx_direction, subcategory, description, key in rows:
         # Ensure required fields have safe defaults
-        tx_date = tx.get("date") or "1970-01-01"
-        tx_amount = float(tx.get("amount", 0.0))
-        tx_direction = tx.get("direction")
+        tx_date = tx_date or "1970-01-01"
+        tx_amount = float(tx_amount)
         if tx_direction not in ("income", "expense"):
             # Infer direction from amount sign
             tx_direction = "income" if tx_amount >= 0 else "expense"
+        merchant = merchants[key]
 
         obj = Transaction(
             id=str(uuid.uuid4()),
             document_id=document_id,
             family_id=family_id,
             date=tx_date,
-            description=tx.get("description", ""),
+            description=description,
             amount=tx_amount,
             direction=tx_direction,
-            category=tx.get("category", ""),
-            subcategory=tx.get("subcategory"),
-            confidence=tx.get("confidence", 0.0),
+            category=merchant.category,
+            subcategory=subcategory,
+            confidence=adjust_confidence(merchant.category, merchant.confidence, tx_amount),
+            merchant_id=merchant.id,
         )
         objs.append(obj)
 
@@ -0,0 +1,22 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Dialects whose INSERT supports ON CONFLICT (production PostgreSQL, test SQLite)
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+def dialect_insert(session: AsyncSession, model):
+    """
+    Return an INSERT for `model` in the session's dialect, so that
+    `on_conflict_do_nothing` / `on_conflict_do_update` are available.
+    Concurrent writers of the same unique key then resolve in the
+    database instead of failing with an IntegrityError.
+    """
+    name = session.get_bind().dialect.name
+    try:
+        insert = _INSERTS[name]
+    except KeyError:
+        raise NotImplementedError(f"No ON CONFLICT insert for dialect {name!r}") from None
+    return insert(model)
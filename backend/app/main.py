@@ -1,13 +1,28 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .api import router as api_router
 from .core.config import Config
+from .services.extraction_cache import default_cache
+from .services.ingest_queue import ingest_queue
+from .services.retention_sweeper import retention_sweeper
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Resume ingestion jobs interrupted by a previous shutdown or crash
+    await ingest_queue.start()
+    # Reload temp-file deletions still pending from before the restart
+    await retention_sweeper.start()
+    yield
+    await retention_sweeper.stop()
+    await ingest_queue.stop()
 
 def create_app() -> FastAPI:
     app = FastAPI(
         title="Family Finance Intelligence API",
         version="0.1.0",
         description="Privacy‑first backend for family financial analysis",
+        lifespan=lifespan,
     )
     app.include_router(api_router)
 
@@ -25,7 +40,12 @@ def create_app() -> FastAPI:
     app.include_router(auth_router)
     @app.get("/health")
     async def health():
-        return {"status": "ok"}
+        return {
+            "status": "ok",
+            "ingest_queue_depth": ingest_queue.depth(),
+            "retention": retention_sweeper.stats(),
+            "extraction_cache": default_cache.stats(),
+        }
 
     return app
 
@@ -1,11 +1,135 @@
-from collections import defaultdict
-from datetime import date
-from typing import List, Mapping, Dict, Any
+import heapq
+import os
+import re
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from operator import attrgetter, itemgetter
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 
 from ..normalize.schemas import NormalizedTransaction
 from .constants import FIXED_EXPENSE_KEYWORDS, CHILD_SPEND_KEYWORDS
 
 
+def _keyword_pattern(keywords) -> "re.Pattern":
+    # One alternation: `search` finds any of the keywords in a single scan
+    if not keywords:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(re.escape(word) for word in sorted(keywords)))
+
+
+# Transaction attributes the analysis reads, in `_analyze_indexed` order
+_FIELDS = ("member", "date", "amount", "description")
+
+_FIXED_PATTERN = _keyword_pattern(FIXED_EXPENSE_KEYWORDS)
+_CHILD_PATTERN = _keyword_pattern(CHILD_SPEND_KEYWORDS)
+
+
+class _MonthTotals:
+    """
+    Amounts of one (family, month) group, bucketed in a single pass. The
+    buckets are summed with `sum()` at the end, so the totals are exactly
+    those of summing each filtered sequence separately.
+    """
+
+    __slots__ = ("first", "income", "expenses", "fixed", "child")
+
+    def __init__(self, first: int):
+        self.first = first  # input position of the group's first transaction
+        self.income: List[float] = []
+        self.expenses: List[float] = []
+        self.fixed: List[float] = []
+        self.child: List[float] = []
+
+
+def _columns(transactions: Iterable[NormalizedTransaction]) -> Tuple[Iterable, ...]:
+    return tuple(map(attrgetter(field), transactions) for field in _FIELDS)
+
+
+def _analyze_indexed(
+    positions: Iterable[int],
+    members: Iterable[str],
+    dates: Iterable,
+    amounts: Iterable[float],
+    descriptions: Iterable[Optional[str]],
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Summaries of the transactions given column by column (at input
+    `positions`) as (position of the group's first transaction, summary)
+    pairs, in first-seen order.
+    """
+    groups: Dict[tuple, _MonthTotals] = {}
+    months: Dict[tuple, str] = {}
+    flags: Dict[str, Tuple[bool, bool]] = {}
+    fixed_search, child_search = _FIXED_PATTERN.search, _CHILD_PATTERN.search
+
+    for position, member, tx_date, amount, description in zip(
+        positions, members, dates, amounts, descriptions
+    ):
+        # "%Y-%m" depends on the year and month only
+        period = (tx_date.year, tx_date.month)
+        month_key = months.get(period)
+        if month_key is None:
+            month_key = months[period] = tx_date.strftime("%Y-%m")
+        key = (member, month_key)
+        totals = groups.get(key)
+        if totals is None:
+            totals = groups[key] = _MonthTotals(position)
+
+        if amount > 0:
+            totals.income.append(amount)
+        elif amount < 0:
+            totals.expenses.append(amount)
+            description = description or ""
+            # Keyword flags are computed once per distinct description
+            flagged = flags.get(description)
+            if flagged is None:
+                lowered = description.lower()
+                flagged = flags[description] = (
+                    fixed_search(lowered) is not None,
+                    child_search(lowered) is not None,
+                )
+            if flagged[0]:
+                totals.fixed.append(-amount)
+            if flagged[1]:
+                totals.child.append(-amount)
+
+    summaries: List[Tuple[int, Dict[str, Any]]] = []
+    for (family, month), totals in groups.items():
+        income = sum(totals.income)
+        expenses = -sum(totals.expenses)  # make positive
+
+        fixed = sum(totals.fixed)
+        variable = expenses - fixed
+
+        surplus = income - expenses
+        savings_rate = (surplus / income * 100) if income else 0.0
+
+        child_spend = sum(totals.child)
+        child_spend_pct = (child_spend / expenses * 100) if expenses else 0.0
+
+        summaries.append(
+            (
+                totals.first,
+                {
+                    "family": family,
+                    "month": month,
+                    "income": round(income, 2),
+                    "fixed_expenses": round(fixed, 2),
+                    "variable_expenses": round(variable, 2),
+                    "surplus": round(surplus, 2),
+                    "savings_rate": round(savings_rate, 2),
+                    "child_spend_pct": round(child_spend_pct, 2),
+                },
+            )
+        )
+    return summaries
+
+
+def _analyze_shard(positions: array, *columns: list) -> List[Tuple[int, Dict[str, Any]]]:
+    """Process-pool entry point for `analyze_many`."""
+    return _analyze_indexed(positions, *columns)
+
+
 class FamilyFinanceAnalyzer:
     """
     Service that aggregates a list of NormalizedTransaction objects
@@ -14,13 +138,11 @@ class FamilyFinanceAnalyzer:
 
     @staticmethod
     def _is_fixed(description: str) -> bool:
-        lowered = description.lower()
-        return any(word in lowered for word in FIXED_EXPENSE_KEYWORDS)
+        return _FIXED_PATTERN.search(description.lower()) is not None
 
     @staticmethod
     def _is_child_related(description: str) -> bool:
-        lowered = description.lower()
-        return any(word in lowered for word in CHILD_SPEND_KEYWORDS)
+        return _CHILD_PATTERN.search(description.lower()) is not None
 
     @classmethod
     def analyze(
@@ -37,45 +159,59 @@ class FamilyFinanceAnalyzer:
             - surplus (float)
             - savings_rate (float, 0‑100)
             - child_spend_pct (float, 0‑100)
+        Transactions are read once; the keyword checks run once per
+        distinct description.
         """
-        # Group by (family, month)
-        groups: Dict[tuple, List[NormalizedTransaction]] = defaultdict(list)
-        for tx in transactions:
-            month_key = tx.date.strftime("%Y-%m")
-            groups[(tx.member, month_key)].append(tx)
-
-        summaries: List[Dict[str, Any]] = []
-        for (family, month), txs in groups.items():
-            income = sum(tx.amount for tx in txs if tx.amount > 0)
-            expenses = -sum(tx.amount for tx in txs if tx.amount < 0)  # make positive
-
-            fixed = sum(
-                -tx.amount
-                for tx in txs
-                if tx.amount < 0 and cls._is_fixed(tx.description or "")
-            )
-            variable = expenses - fixed
+        summaries = _analyze_indexed(range(len(transactions)), *_columns(transactions))
+        return [summary for _, summary in summaries]
 
-            surplus = income - expenses
-            savings_rate = (surplus / income * 100) if income else 0.0
+    @classmethod
+    def analyze_many(
+        cls,
+        transactions: List[NormalizedTransaction],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Same result as `analyze`, computed across a process pool: families
+        are dealt to `workers` shards (default: CPU count) in order of
+        first appearance, so every (family, month) group is summed whole by
+        one worker, and the shard results are merged back into input order.
+        Shards travel as plain column lists rather than transaction objects.
+        Pass `executor` to reuse a pool; otherwise one is created for the
+        call.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            return cls.analyze(transactions)
+        shard_of: Dict[str, int] = {}
+        shards = [(array("Q"), [], [], [], []) for _ in range(workers)]
+        # One date object per month: only year and month are read, and
+        # repeated objects pickle once
+        month_dates: Dict[tuple, Any] = {}
+        for position, tx in enumerate(transactions):
+            member, tx_date = tx.member, tx.date
+            shard = shard_of.get(member)
+            if shard is None:
+                shard = shard_of[member] = len(shard_of) % workers
+            positions, members, dates, amounts, descriptions = shards[shard]
+            positions.append(position)
+            members.append(member)
+            dates.append(month_dates.setdefault((tx_date.year, tx_date.month), tx_date))
+            amounts.append(tx.amount)
+            descriptions.append(tx.description)
 
-            child_spend = sum(
-                -tx.amount
-                for tx in txs
-                if tx.amount < 0 and cls._is_child_related(tx.description or "")
-            )
-            child_spend_pct = (child_spend / expenses * 100) if expenses else 0.0
+        if len(shard_of) <= 1:
+            return cls.analyze(transactions)
 
-            summaries.append(
-                {
-                    "family": family,
-                    "month": month,
-                    "income": round(income, 2),
-                    "fixed_expenses": round(fixed, 2),
-                    "variable_expenses": round(variable, 2),
-                    "surplus": round(surplus, 2),
-                    "savings_rate": round(savings_rate, 2),
-                    "child_spend_pct": round(child_spend_pct, 2),
-                }
-            )
-        return summaries
+        own_executor = executor is None
+        executor = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(_analyze_shard, *columns) for columns in shards if columns[0]
+            ]
+            results = [future.result() for future in futures]
+        finally:
+            if own_executor:
+                executor.shutdown()
+        return [summary for _, summary in heapq.merge(*results, key=itemgetter(0))]
@@ -1,12 +1,31 @@
 from collections import defaultdict
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
+from ..normalize.batch import TransactionBatch
 from ..normalize.schema import NormalizedTransaction
+from ..normalize.vectorized import available as vectorized_available, month_keys
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency – the scalar path is used instead
+    np = None
+
+# From about this many rows the NumPy group-by beats the per-row loop; a
+# list of row objects needs more, as its columns are gathered in Python first
+AGGREGATE_VECTORIZE_MIN_ROWS = 128
+AGGREGATE_VECTORIZE_MIN_OBJECTS = 512
+
 
 def aggregate_by_month(
-    transactions: List[NormalizedTransaction],
+    transactions: Union[List[NormalizedTransaction], TransactionBatch],
+    vectorized: Optional[bool] = None,
 ) -> Dict[str, Dict]:
     """
     Produce a month‑level aggregation.
+    A TransactionBatch is read column by column, without building rows.
+    With NumPy installed, batches of AGGREGATE_VECTORIZE_MIN_ROWS or more
+    (lists of AGGREGATE_VECTORIZE_MIN_OBJECTS) are grouped with `bincount`
+    (`vectorized=None`); pass True/False to force a path. Both give the
+    exact same result, sums included.
     Output example:
     {
         "2024-01": {
@@ -21,24 +40,44 @@ def aggregate_by_month(
         ...
     }
     """
+    if vectorized is None:
+        crossover = (
+            AGGREGATE_VECTORIZE_MIN_ROWS
+            if isinstance(transactions, TransactionBatch)
+            else AGGREGATE_VECTORIZE_MIN_OBJECTS
+        )
+        vectorized = vectorized_available() and len(transactions) >= crossover
+    if vectorized:
+        return _aggregate_vectorized(transactions)
+
     monthly: Dict[str, Dict] = defaultdict(
         lambda: {"income": 0.0, "expenses": 0.0, "categories": defaultdict(float)}
     )
 
-    for txn in transactions:
+    if isinstance(transactions, TransactionBatch):
+        rows = zip(
+            transactions.dates,
+            transactions.directions,
+            transactions.amounts,
+            transactions.categories,
+        )
+    else:
+        rows = ((t.date, t.direction, t.amount, t.category) for t in transactions)
+
+    for date, direction, amount, category in rows:
         # Guard against malformed dates – skip if we cannot extract YYYY‑MM
         try:
-            month_key = txn.date[:7]  # expects "YYYY-MM-DD" or similar
+            month_key = date[:7]  # expects "YYYY-MM-DD" or similar
         except Exception:
             continue
 
-        if txn.direction == "income":
-            monthly[month_key]["income"] += txn.amount
+        if direction == "income":
+            monthly[month_key]["income"] += amount
         else:
-            monthly[month_key]["expenses"] += abs(txn.amount)
+            monthly[month_key]["expenses"] += abs(amount)
 
         # Category aggregation (use the category already assigned by normalizer)
-        monthly[month_key]["categories"][txn.category] += abs(txn.amount)
+        monthly[month_key]["categories"][category] += abs(amount)
 
     # Convert inner defaultdicts to plain dicts for a clean JSON‑serialisable shape
     result: Dict[str, Dict] = {}
@@ -49,3 +88,71 @@ def aggregate_by_month(
             "categories": dict(data["categories"]),
         }
     return result
+
+
+def _codes(column):
+    return np.frombuffer(column.codes, dtype=f"u{column.codes.itemsize}")
+
+
+def _factorize(values) -> tuple:
+    index: Dict = {}
+    codes = np.fromiter(
+        (index.setdefault(v, len(index)) for v in values), dtype=np.intp, count=len(values)
+    )
+    return codes, list(index)
+
+
+def _aggregate_vectorized(
+    transactions: Union[List[NormalizedTransaction], TransactionBatch],
+) -> Dict[str, Dict]:
+    """
+    `aggregate_by_month` as a group-by: factorize months and categories,
+    then sum each group with `bincount`, which adds its weights in row
+    order – the same additions as the loop, so the floats match exactly.
+    Months and categories keep their first-seen order.
+    """
+    if isinstance(transactions, TransactionBatch):
+        dates = transactions.dates
+        amounts = np.frombuffer(transactions.amounts, dtype=np.float64)
+        category_codes = _codes(transactions.categories).astype(np.intp)
+        categories = transactions.categories.values
+        income_code = transactions.directions._index.get("income", -1)
+        income = _codes(transactions.directions).astype(np.intp) == income_code
+    else:
+        count = len(transactions)
+        dates = [t.date for t in transactions]
+        amounts = np.fromiter((t.amount for t in transactions), dtype=np.float64, count=count)
+        category_codes, categories = _factorize([t.category for t in transactions])
+        income = np.fromiter(
+            (t.direction == "income" for t in transactions), dtype=bool, count=count
+        )
+
+    month_codes, months = month_keys(dates)
+    keep = month_codes >= 0
+    if not keep.all():
+        month_codes, amounts = month_codes[keep], amounts[keep]
+        category_codes, income = category_codes[keep], income[keep]
+
+    month_count = len(months)
+    magnitudes = np.abs(amounts)
+    income_sums = np.bincount(month_codes[income], weights=amounts[income], minlength=month_count)
+    expense_sums = np.bincount(
+        month_codes[~income], weights=magnitudes[~income], minlength=month_count
+    )
+
+    result: Dict[str, Dict] = {}
+    for month, income_sum, expense_sum in zip(months, income_sums.tolist(), expense_sums.tolist()):
+        result[month] = {"income": income_sum, "expenses": expense_sum, "categories": {}}
+
+    # One group per (month, category) pair, listed in order of first row
+    pairs = month_codes * max(len(categories), 1) + category_codes
+    groups, first_rows, group_codes = np.unique(pairs, return_index=True, return_inverse=True)
+    group_sums = np.bincount(group_codes.ravel(), weights=magnitudes, minlength=len(groups))
+    order = np.argsort(first_rows, kind="stable")
+    for month_code, category_code, total in zip(
+        month_codes[first_rows[order]].tolist(),
+        category_codes[first_rows[order]].tolist(),
+        group_sums[order].tolist(),
+    ):
+        result[months[month_code]]["categories"][categories[category_code]] = total
+    return result
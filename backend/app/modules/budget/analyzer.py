@@ -1,4 +1,12 @@
-from typing import Dict
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency – the scalar path is used instead
+    np = None
+
+# From about this many months the array pass beats calling analyze_budget per month
+SERIES_VECTORIZE_MIN_MONTHS = 240
 
 def analyze_budget(monthly_summary: Dict) -> Dict:
     """
@@ -45,3 +53,51 @@ def analyze_budget(monthly_summary: Dict) -> Dict:
         "status": status,
         "health_score": health_score,
     }
+
+
+def analyze_budget_series(
+    monthly_summaries: Sequence[Dict],
+    vectorized: Optional[bool] = None,
+) -> List[Dict]:
+    """
+    `analyze_budget` for many month summaries at once, e.g. a family's
+    whole history. With NumPy installed, series of SERIES_VECTORIZE_MIN_MONTHS
+    or more compute the rates and statuses over arrays (`vectorized=None`);
+    pass True/False to force a path. Results are identical to calling
+    `analyze_budget` on each summary, in order.
+    """
+    if vectorized is None:
+        vectorized = np is not None and len(monthly_summaries) >= SERIES_VECTORIZE_MIN_MONTHS
+    if not vectorized:
+        return [analyze_budget(summary) for summary in monthly_summaries]
+
+    count = len(monthly_summaries)
+    income = np.fromiter(
+        (float(s.get("income", 0)) for s in monthly_summaries), dtype=np.float64, count=count
+    )
+    expenses = np.fromiter(
+        (float(s.get("expenses", 0)) for s in monthly_summaries), dtype=np.float64, count=count
+    )
+    has_income = income > 0
+    divisor = np.where(has_income, income, 1.0)
+    with np.errstate(invalid="ignore"):
+        savings_rate = np.where(has_income, np.maximum(income - expenses, 0) / divisor, 0.0)
+        expense_ratio = np.where(has_income, expenses / divisor, 0.0)
+        status = np.select(
+            [savings_rate >= 0.30, savings_rate >= 0.10], ["healthy", "warning"], "risky"
+        )
+
+    results: List[Dict] = []
+    for summary, rate, ratio, state in zip(
+        monthly_summaries, savings_rate.tolist(), expense_ratio.tolist(), status.tolist()
+    ):
+        categories = summary.get("categories", {})
+        results.append({
+            "savings_rate": rate,
+            "largest_category": max(categories, key=categories.get) if categories else None,
+            "expense_ratio": ratio,
+            "status": state,
+            # Python's min/max/round, not np.clip/np.round: both differ on NaN and rounding
+            "health_score": round(max(0.0, min(100.0, rate * 100.0)), 2),
+        })
+    return results
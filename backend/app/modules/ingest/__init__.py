@@ -1,4 +1,11 @@
 from .base import BaseDocumentParser
 from .bank_statement_parser_v1 import BankStatementParserV1
+from .csv_statement_parser import CsvStatementParser
+from .ofx_statement_parser import OfxStatementParser
 
-__all__ = ["BaseDocumentParser", "BankStatementParserV1"]
+__all__ = [
+    "BaseDocumentParser",
+    "BankStatementParserV1",
+    "CsvStatementParser",
+    "OfxStatementParser",
+]
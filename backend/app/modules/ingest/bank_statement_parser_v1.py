@@ -1,7 +1,10 @@
 import re
-from typing import List, Dict
+from typing import Dict, Iterator, List
 from .base import BaseDocumentParser
 
+# Every character `str.splitlines()` treats as a line boundary
+_LINE_BREAKS = "\\n\\r\\x0b\\x0c\\x1c\\x1d\\x1e\\x85\\u2028\\u2029"
+
 class BankStatementParserV1(BaseDocumentParser):
     """
     Very simple, defensive bank‑statement parser.
@@ -12,35 +15,39 @@ class BankStatementParserV1(BaseDocumentParser):
 
     KEYWORDS = {"balance", "transaction", "debit", "credit"}
 
+    # Compiled once and applied to the whole buffer. The lookbehind anchors
+    # each match to the start of a line (like `^` in MULTILINE mode, but for
+    # every boundary `splitlines()` recognises) and no part of the pattern
+    # can cross a line break, so at most one transaction is taken per line.
+    LINE_REGEX = re.compile(
+        rf"""(?<![^{_LINE_BREAKS}])[^{_LINE_BREAKS}]*?                 # line start, skip prefix
+            (?P<date>\d{{4}}[-/]\d{{2}}[-/]\d{{2}})[^\S{_LINE_BREAKS}]+   # date
+            (?P<description>[^{_LINE_BREAKS}]+?)[^\S{_LINE_BREAKS}]+       # description
+            (?P<amount>-?\d+(?:\.\d{{2}})?)                                # amount, optional minus
+        """,
+        re.VERBOSE,
+    )
+
     def can_parse(self, text: str) -> bool:
         lowered = text.lower()
         return any(keyword in lowered for keyword in self.KEYWORDS)
 
+    def iter_extract(self, text: str) -> Iterator[Dict]:
+        """
+        Lazily yield transaction dicts (date, description, amount) in
+        document order, scanning the text in a single pass.
+        """
+        for match in self.LINE_REGEX.finditer(text):
+            date, description, amount = match.groups()
+            yield {
+                "date": date,
+                "description": description.strip(),
+                "amount": float(amount),
+            }
+
     def extract(self, text: str) -> List[Dict]:
         """
         Extract minimal transaction data.
         Returns a list of dicts with keys: date, description, amount.
         """
-        results: List[Dict] = []
-        # Simple line‑by‑line regex: date (YYYY‑MM‑DD or similar) then description then amount
-        line_regex = re.compile(
-            r"""(?P<date>\d{4}[-/]\d{2}[-/]\d{2})\s+   # date
-                (?P<description>.+?)\s+                # description
-                (?P<amount>-?\d+(?:\.\d{2})?)          # amount, optional minus
-            """,
-            re.VERBOSE,
-        )
-        for line in text.splitlines():
-            match = line_regex.search(line)
-            if match:
-                date = match.group("date")
-                description = match.group("description").strip()
-                amount = float(match.group("amount"))
-                results.append(
-                    {
-                        "date": date,
-                        "description": description,
-                        "amount": amount,
-                    }
-                )
-        return results
+        return list(self.iter_extract(text))
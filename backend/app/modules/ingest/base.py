@@ -1,12 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Set, Tuple
 
 class BaseDocumentParser(ABC):
     """
     Abstract base class for document parsers.
     Implementations must provide `can_parse` and `extract` methods.
+
+    Parsers may also declare a signature used by the registry dispatcher:
+    - KEYWORDS: lower-case substrings that identify the document type.
+    - FINGERPRINTS: regex patterns (matched case-insensitively).
+    Parsers without a signature are dispatched through `can_parse`.
+    SOURCE_TYPES lists the file formats ("pdf", "csv", "ofx") whose text
+    the parser understands; it is only offered documents of those types.
     """
 
+    KEYWORDS: Set[str] = set()
+    FINGERPRINTS: Tuple[str, ...] = ()
+    SOURCE_TYPES: Set[str] = {"pdf"}
+
     @abstractmethod
     def can_parse(self, text: str) -> bool:
         """Return True if this parser can handle the given text."""
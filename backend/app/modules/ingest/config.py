@@ -0,0 +1,19 @@
+import os
+
+
+class IngestConfig:
+    # Worker processes for parallel page extraction (0 = one per CPU core)
+    PDF_WORKERS: int = int(os.getenv("PDF_WORKERS", "0"))
+
+    # Documents with fewer pages than this are always extracted serially,
+    # as process start-up costs more than it saves on short statements
+    PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+
+    # Characters at the start of a document inspected by the parser
+    # dispatcher before it falls back to scanning the whole text
+    DISPATCH_HEAD_CHARS: int = int(os.getenv("DISPATCH_HEAD_CHARS", "4096"))
+
+    # Pre-screen (opt-in): a page whose content stream shows no date and has
+    # at least this share of digits is still extracted, as it may use a date
+    # format the probe does not recognise
+    PRESCREEN_DIGIT_RATIO: float = float(os.getenv("PRESCREEN_DIGIT_RATIO", "0.15"))
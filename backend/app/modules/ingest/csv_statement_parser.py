@@ -0,0 +1,123 @@
+import csv
+import io
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .base import BaseDocumentParser
+from .fields import parse_amount, parse_date
+
+# Header aliases seen in common bank CSV exports (compared lower-cased)
+DATE_COLUMNS = {"date", "transaction date", "posted date", "posting date", "value date"}
+DESCRIPTION_COLUMNS = {"description", "narrative", "details", "transaction details", "memo", "payee"}
+AMOUNT_COLUMNS = {"amount", "transaction amount", "value"}
+DEBIT_COLUMNS = {"debit", "debit amount", "withdrawal", "withdrawals", "money out"}
+CREDIT_COLUMNS = {"credit", "credit amount", "deposit", "deposits", "money in"}
+
+DELIMITERS = ",;\t|"
+HEADER_SEARCH_ROWS = 20
+
+
+class CsvStatementParser(BaseDocumentParser):
+    """
+    Parser for CSV statement exports.
+    Finds the header row (date column plus an amount or debit/credit pair),
+    then streams the remaining rows through the `csv` module.
+    Rows without a readable date or amount are skipped. Semicolon-delimited
+    exports usually come from decimal-comma locales, so "1,234" there reads
+    as 1.234 (unambiguous amounts like "1,234.56" are read as written).
+    Dispatched through `can_parse` (no regex signature): the header check
+    splits at most HEADER_SEARCH_ROWS lines into cells, linear in their
+    length whatever they contain.
+    """
+
+    SOURCE_TYPES = {"csv"}
+    DAYFIRST = True
+
+    def can_parse(self, text: str) -> bool:
+        lines = islice(io.StringIO(text), HEADER_SEARCH_ROWS)
+        return self._find_header([line.rstrip("\r\n") for line in lines]) is not None
+
+    @staticmethod
+    def _delimiter(line: str) -> str:
+        return max(DELIMITERS, key=line.count)
+
+    @staticmethod
+    def _columns(cells: List[str]) -> Optional[Dict[str, int]]:
+        """Map logical fields to column indexes, or None if not a header row."""
+        columns: Dict[str, int] = {}
+        for index, cell in enumerate(cells):
+            name = cell.strip().lower()
+            for field, aliases in (
+                ("date", DATE_COLUMNS),
+                ("description", DESCRIPTION_COLUMNS),
+                ("amount", AMOUNT_COLUMNS),
+                ("debit", DEBIT_COLUMNS),
+                ("credit", CREDIT_COLUMNS),
+            ):
+                if name in aliases and field not in columns:
+                    columns[field] = index
+        has_amount = "amount" in columns or "debit" in columns or "credit" in columns
+        return columns if "date" in columns and has_amount else None
+
+    def _find_header(self, lines: List[str]):
+        for position, line in enumerate(lines):
+            delimiter = self._delimiter(line)
+            cells = next(csv.reader([line], delimiter=delimiter), [])
+            columns = self._columns(cells)
+            if columns is not None:
+                return position, delimiter, columns
+        return None
+
+    def iter_rows(self, lines: Iterable[str]) -> Iterator[Dict]:
+        """
+        Lazily yield raw transaction dicts (date, description, amount) from
+        an iterable of CSV lines, e.g. an open text file.
+        """
+        lines = iter(lines)
+        preamble: List[str] = []
+        header = None
+        for line in lines:
+            preamble.append(line)
+            header = self._find_header([line])
+            if header is not None or len(preamble) >= HEADER_SEARCH_ROWS:
+                break
+        if header is None:
+            return
+        _, delimiter, columns = header
+        decimal = "," if delimiter == ";" else "."
+
+        def _cell(row: List[str], field: str) -> str:
+            index = columns.get(field)
+            return row[index] if index is not None and index < len(row) else ""
+
+        for row in csv.reader(lines, delimiter=delimiter):
+            date = parse_date(_cell(row, "date"), dayfirst=self.DAYFIRST)
+            if date is None:
+                continue
+            if "amount" in columns:
+                amount = parse_amount(_cell(row, "amount"), decimal)
+            else:
+                debit = parse_amount(_cell(row, "debit"), decimal)
+                credit = parse_amount(_cell(row, "credit"), decimal)
+                if debit is None and credit is None:
+                    amount = None
+                else:
+                    amount = (credit or 0.0) - abs(debit or 0.0)
+            if amount is None:
+                continue
+            yield {
+                "date": date,
+                "description": _cell(row, "description").strip(),
+                "amount": amount,
+            }
+
+    def iter_extract(self, text: str) -> Iterator[Dict]:
+        """Lazily yield transaction dicts from CSV text."""
+        return self.iter_rows(io.StringIO(text, newline=""))
+
+    def extract(self, text: str) -> List[Dict]:
+        """
+        Extract transactions from CSV text.
+        Returns a list of dicts with keys: date, description, amount.
+        """
+        return list(self.iter_extract(text))
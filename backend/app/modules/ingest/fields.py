@@ -0,0 +1,94 @@
+import re
+from typing import Optional
+
+_ISO_DATE = re.compile(r"^(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})")
+_COMPACT_DATE = re.compile(r"^(\d{4})(\d{2})(\d{2})")
+_NUMERIC_DATE = re.compile(r"^(\d{1,2})[-/.](\d{1,2})[-/.](\d{2}|\d{4})\b")
+_NOT_NUMERIC = re.compile(r"[^\d.,]")
+_GROUP = re.compile(r"^\d{1,3}$")
+
+
+def _iso(year: int, month: int, day: int) -> Optional[str]:
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def parse_date(raw: str, dayfirst: bool = True) -> Optional[str]:
+    """
+    Normalise a statement date to "YYYY-MM-DD", or return None.
+    Accepts ISO-like (2024-01-15, 2024/01/15), compact (20240115, with any
+    OFX time suffix) and numeric day/month forms (15/01/2024). Numeric forms
+    are read day-first unless `dayfirst` is False or the order is unambiguous.
+    """
+    value = (raw or "").strip()
+    match = _ISO_DATE.match(value) or _COMPACT_DATE.match(value)
+    if match:
+        year, month, day = (int(part) for part in match.groups())
+        return _iso(year, month, day)
+    match = _NUMERIC_DATE.match(value)
+    if not match:
+        return None
+    first, second, year = (int(part) for part in match.groups())
+    if year < 100:
+        year += 2000
+    if first > 12 or (dayfirst and second <= 12):
+        return _iso(year, second, first)
+    return _iso(year, first, second)
+
+
+def _decimal_mark(body: str, decimal: str) -> Optional[str]:
+    """
+    Pick the decimal mark used in `body` (digits, "," and "." only), "" for
+    an integer, or None if the separators cannot be read consistently.
+    With both marks present the last one is the decimal mark. A single mark
+    followed by exactly three digits ("1,234" / "1.234") could be either,
+    and is read as `decimal` when it matches, else as a thousands separator.
+    """
+    marks = {mark for mark in ",." if mark in body}
+    if len(marks) == 2:
+        mark = max(marks, key=body.rindex)
+        return mark if body.count(mark) == 1 else None
+    if not marks:
+        return ""
+    (mark,) = marks
+    if body.count(mark) > 1:
+        return ""
+    if len(body) - body.index(mark) - 1 == 3 and mark != decimal:
+        return ""
+    return mark
+
+
+def parse_amount(raw: str, decimal: str = ".") -> Optional[float]:
+    """
+    Parse a statement amount such as "-1,234.50", "$12.00", "(45.10)",
+    "12.00-", "99.95 DR" or "-1.234,50". The decimal mark is read from each
+    value; `decimal` only settles "1,234"-style values (see `_decimal_mark`).
+    Returns None if no number is present or the separators are inconsistent,
+    e.g. "1.234.56" or "1,23,4".
+    """
+    value = (raw or "").strip()
+    if not value:
+        return None
+    upper = value.upper()
+    negative = (
+        value.startswith("-")
+        or value.endswith("-")
+        or (value.startswith("(") and value.endswith(")"))
+        or upper.endswith("DR")
+    )
+    body = _NOT_NUMERIC.sub("", value)
+    mark = _decimal_mark(body, decimal)
+    if mark is None:
+        return None
+    whole, _, fraction = body.partition(mark) if mark else (body, "", "")
+    groups = re.split(r"[.,]", whole)
+    if len(groups) > 1 and not (
+        _GROUP.match(groups[0]) and all(len(group) == 3 for group in groups[1:])
+    ):
+        return None
+    digits = "".join(groups)
+    if not digits and not fraction:
+        return None
+    amount = float(f"{digits or 0}.{fraction or 0}")
+    return -amount if negative else amount
@@ -0,0 +1,346 @@
+"""
+Layout-aware table extraction for multi-column PDF statements.
+
+Instead of regex-parsing extracted text lines, words are read with their
+pdfplumber coordinates, grouped into visual lines and assigned to columns
+(date, description, amount or debit/credit, balance) by x position.
+
+Finding the column boundaries – measuring the numeric columns with
+pdfplumber's full word extraction – is done once per bank template. The
+resulting ColumnMap is cached under a layout fingerprint (page size plus
+the table header row's words and positions, hashed), so it is shared by
+every customer of the same bank. Pages are first read with a lightweight
+pdfminer device (`read_words`) that yields positioned words straight from
+the content stream; only a page whose header is not cached yet goes
+through the full extraction. Pages without a header row carry no table
+and are skipped without analysis.
+"""
+
+import bisect
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import pdfplumber
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdffont import PDFUnicodeNotDefined
+from pdfminer.pdfinterp import PDFPageInterpreter
+from pdfminer.utils import apply_matrix_rect
+
+from backend.app.core.lru import BoundedLRU
+
+from .fields import parse_amount, parse_date
+from .pdf_reader import PageScreenStats, PdfSource, should_skip_page
+
+# Header words (lower-cased, trailing punctuation removed) naming each column
+HEADER_ALIASES = {
+    "date": {"date"},
+    "description": {"description", "details", "narrative", "particulars", "transaction", "payee"},
+    "amount": {"amount"},
+    "debit": {"debit", "debits", "withdrawal", "withdrawals"},
+    "credit": {"credit", "credits", "deposit", "deposits"},
+    "balance": {"balance"},
+}
+NUMERIC_FIELDS = ("amount", "debit", "credit", "balance")
+
+# Words whose tops differ by at most this many points share a line
+LINE_TOLERANCE = 3.0
+# Gap kept between a text column and the widest value of the next column
+COLUMN_GAP = 2.0
+# Horizontal gap (points) that ends a word, as in pdfplumber's extract_words
+WORD_GAP = 3.0
+
+_NUMBER = re.compile(r"^\(?-?[$£€]?\d[\d,]*(?:\.\d+)?\)?-?(?:CR|DR)?$", re.IGNORECASE)
+_DIGITS = re.compile(r"\d+")
+
+Word = Dict  # a pdfplumber word: text, x0, x1, top, bottom, ...
+Line = List[Word]
+
+
+def group_lines(words: List[Word]) -> List[Line]:
+    """Group words into visual lines (top to bottom), each sorted left to right."""
+    lines: List[Line] = []
+    current: Line = []
+    current_top = None
+    for word in sorted(words, key=lambda w: (w["top"], w["x0"])):
+        if current and word["top"] - current_top > LINE_TOLERANCE:
+            lines.append(sorted(current, key=lambda w: w["x0"]))
+            current = []
+        if not current:
+            current_top = word["top"]
+        current.append(word)
+    if current:
+        lines.append(sorted(current, key=lambda w: w["x0"]))
+    return lines
+
+
+def find_header(lines: List[Line]) -> Optional[int]:
+    """Return the index of the table header row among `lines`, or None."""
+    for position, line in enumerate(lines):
+        if _header_spans(line) is not None:
+            return position
+    return None
+
+
+def layout_fingerprint(width: float, height: float, header: Line) -> str:
+    """
+    Identify a statement template from the page size and its table header
+    row: the normalised header words and their rounded x positions. Nothing
+    customer-specific is part of it, and only the hash is kept.
+    """
+    cells = " ".join(
+        f"{_DIGITS.sub('#', w['text'].lower().rstrip(':.'))}@{round(w['x0'])}" for w in header
+    )
+    raw = f"{round(width)}x{round(height)}|{cells}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class _WordDevice(PDFTextDevice):
+    """
+    pdfminer device that records words (split on spaces and gaps wider
+    than WORD_GAP) with pdfplumber-style coordinates, without building the
+    per-character layout objects `page.extract_words()` goes through.
+    Words are assembled in content-stream order.
+    """
+
+    def __init__(self, rsrcmgr, page):
+        super().__init__(rsrcmgr)
+        self._x_offset = page.mediabox[0]
+        self._top_edge = page.height + page.mediabox[1]
+        self.words: List[Word] = []
+        self._word: Optional[Word] = None
+        self.vertical = False
+
+    def _flush(self) -> None:
+        if self._word is not None:
+            self.words.append(self._word)
+            self._word = None
+
+    def render_char(self, matrix, font, fontsize, scaling, rise, cid, ncs, graphicstate):
+        if font.is_vertical():
+            self.vertical = True
+            return 0
+        try:
+            text = font.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = ""
+        adv = font.char_width(cid) * fontsize * scaling
+        descent = font.get_descent() * fontsize
+        bbox = (0, descent + rise, adv, descent + rise + fontsize)
+        x0, y0, x1, y1 = apply_matrix_rect(matrix, bbox)
+        x0, x1 = sorted((x0 + self._x_offset, x1 + self._x_offset))
+        top = self._top_edge - max(y0, y1)
+        word = self._word
+        if word is not None and (
+            abs(top - word["top"]) > LINE_TOLERANCE
+            or x0 > word["x1"] + WORD_GAP
+            or x0 < word["x0"]
+        ):
+            self._flush()
+            word = None
+        if not text.strip():
+            self._flush()
+        elif word is None:
+            self._word = {"text": text, "x0": x0, "x1": x1, "top": top}
+        else:
+            word["text"] += text
+            word["x1"] = max(word["x1"], x1)
+        return adv
+
+    def end_page(self, page) -> None:
+        self._flush()
+
+
+def read_words(page) -> Optional[List[Word]]:
+    """
+    Read the words of a pdfplumber page through `_WordDevice`. Returns None
+    for vertical writing, which only the full extraction handles.
+    """
+    device = _WordDevice(page.pdf.rsrcmgr, page)
+    PDFPageInterpreter(page.pdf.rsrcmgr, device).process_page(page.page_obj)
+    return None if device.vertical else device.words
+
+
+@dataclass(frozen=True)
+class ColumnMap:
+    """
+    Column layout of one statement template: (field, left boundary) pairs
+    in left-to-right order. Column i spans from its boundary up to the
+    next one; words are assigned by their horizontal centre.
+    """
+    columns: Tuple[Tuple[str, float], ...]
+
+    def assign(self, line: Line) -> Dict[str, List[str]]:
+        """Return the words of a line grouped by column field."""
+        lefts = [left for _, left in self.columns]
+        cells: Dict[str, List[str]] = {}
+        for word in line:
+            index = bisect.bisect_right(lefts, (word["x0"] + word["x1"]) / 2) - 1
+            if index >= 0:
+                cells.setdefault(self.columns[index][0], []).append(word["text"])
+        return cells
+
+    def rows(self, lines: List[Line]) -> List[Dict]:
+        """
+        Return raw transaction dicts (date, description, amount) for every
+        line with a readable date and amount. Debit/credit layouts yield
+        `credit - debit`; the balance column is ignored.
+        """
+        fields = {field for field, _ in self.columns}
+        results: List[Dict] = []
+        for line in lines:
+            cells = self.assign(line)
+            date = parse_date(" ".join(cells.get("date", ())))
+            if date is None:
+                continue
+            if "amount" in fields:
+                amount = parse_amount(" ".join(cells.get("amount", ())))
+            else:
+                debit = parse_amount(" ".join(cells.get("debit", ())))
+                credit = parse_amount(" ".join(cells.get("credit", ())))
+                if debit is None and credit is None:
+                    amount = None
+                else:
+                    amount = (credit or 0.0) - abs(debit or 0.0)
+            if amount is None:
+                continue
+            results.append(
+                {
+                    "date": date,
+                    "description": " ".join(cells.get("description", ())),
+                    "amount": amount,
+                }
+            )
+        return results
+
+
+def _header_spans(line: Line) -> Optional[Dict[str, List[float]]]:
+    """Return {field: [x0, x1]} if the line is a statement table header."""
+    spans: Dict[str, List[float]] = {}
+    for word in line:
+        name = word["text"].lower().rstrip(":.")
+        for field, aliases in HEADER_ALIASES.items():
+            if name in aliases and field not in spans:
+                spans[field] = [word["x0"], word["x1"]]
+    has_amount = "amount" in spans or "debit" in spans or "credit" in spans
+    return spans if "date" in spans and has_amount else None
+
+
+def detect_column_map(lines: List[Line]) -> Optional[ColumnMap]:
+    """
+    Derive a ColumnMap from one page: find the header row, widen each
+    numeric column to cover the (right-aligned) values printed under it,
+    then place boundaries between neighbouring columns. Returns None if
+    the page has no recognisable table header.
+    """
+    position = find_header(lines)
+    if position is None:
+        return None
+    spans = _header_spans(lines[position])
+
+    numeric = [field for field in NUMERIC_FIELDS if field in spans]
+    for line in lines[position + 1:]:
+        for word in line:
+            if not _NUMBER.match(word["text"]):
+                continue
+            for field in numeric:
+                span = spans[field]
+                if word["x0"] < span[1] and word["x1"] > span[0]:
+                    span[0] = min(span[0], word["x0"])
+                    span[1] = max(span[1], word["x1"])
+                    break
+
+    ordered = sorted(spans.items(), key=lambda item: item[1][0])
+    columns = [(ordered[0][0], float("-inf"))]
+    for (prev_field, prev_span), (field, span) in zip(ordered, ordered[1:]):
+        if prev_field in NUMERIC_FIELDS:
+            left = (prev_span[1] + span[0]) / 2
+        else:
+            left = span[0] - COLUMN_GAP
+        columns.append((field, left))
+    return ColumnMap(tuple(columns))
+
+
+class ColumnMapCache(BoundedLRU[ColumnMap]):
+    """
+    LRU of ColumnMaps keyed by layout fingerprint. Besides the BoundedLRU
+    counters, counts how many layout analyses were run.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        super().__init__(max_entries)
+        self.detections = 0
+
+    def record_detection(self) -> None:
+        """Count one layout analysis run on behalf of this cache."""
+        with self._lock:
+            self.detections += 1
+
+    def stats(self) -> Dict[str, int]:
+        stats = super().stats()
+        stats["detections"] = self.detections
+        return stats
+
+
+# Process-wide cache, shared by every document handled in this process
+column_map_cache = ColumnMapCache()
+
+
+def _full_lines(page) -> List[Line]:
+    return group_lines(page.extract_words())
+
+
+def extract_table_transactions(
+    file_path: PdfSource,
+    cache: Optional[ColumnMapCache] = column_map_cache,
+    prescreen: bool = False,
+    stats: Optional[PageScreenStats] = None,
+) -> Optional[List[Dict]]:
+    """
+    Extract raw transactions from a tabular PDF statement page by page.
+
+    Each page is read with `read_words`. A page without a table header
+    (a summary or terms page) yields nothing and is not analysed. If the
+    header's layout fingerprint is cached, that map is applied directly –
+    even when it finds no rows – otherwise the page is re-read with full
+    word extraction and analysed, and the map cached. Pass `cache=None` to
+    read and analyse every page in full. `prescreen`
+    and `stats` behave as in `pdf_reader.iter_pdf_pages`.
+
+    Returns None when no page carries a recognisable table, so callers can
+    fall back to text parsing. Raises whatever pdfplumber raises.
+    """
+    transactions: List[Dict] = []
+    found = False
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages:
+            if stats is not None:
+                stats.pages += 1
+            if prescreen and should_skip_page(page, stats):
+                page.close()
+                continue
+            started = time.perf_counter()
+            words = read_words(page) if cache is not None else None
+            lines = _full_lines(page) if words is None else group_lines(words)
+            header = find_header(lines)
+            column_map = None
+            if header is not None:
+                key = layout_fingerprint(page.width, page.height, lines[header])
+                column_map = cache.get(key) if cache is not None else None
+                if column_map is None:
+                    if words is not None:
+                        lines = _full_lines(page)
+                    if cache is not None:
+                        cache.record_detection()
+                    column_map = detect_column_map(lines)
+                    if column_map is not None and cache is not None:
+                        cache.put(key, column_map)
+            page.close()
+            if stats is not None:
+                stats.extract_seconds += time.perf_counter() - started
+            if column_map is not None:
+                found = True
+                transactions.extend(column_map.rows(lines))
+    return transactions if found else None
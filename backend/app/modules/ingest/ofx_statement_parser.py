@@ -0,0 +1,62 @@
+import html
+import re
+from typing import Dict, Iterator, List, Optional
+
+from .base import BaseDocumentParser
+from .fields import parse_amount, parse_date
+
+# Matches OFX tags in both SGML (OFX 1.x, leaf tags unclosed) and XML (OFX 2.x)
+_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+
+
+class OfxStatementParser(BaseDocumentParser):
+    """
+    Parser for OFX/QFX statement exports (SGML 1.x and XML 2.x).
+    A single incremental pass over the tags collects the fields of each
+    <STMTTRN> block and yields a transaction when the block closes.
+    Identifiers such as ACCTID or FITID are never extracted.
+    """
+
+    SOURCE_TYPES = {"ofx"}
+    KEYWORDS = {"<ofx>", "ofxheader", "<stmttrn>"}
+
+    def can_parse(self, text: str) -> bool:
+        lowered = text.lower()
+        return "<ofx>" in lowered or "ofxheader" in lowered
+
+    @staticmethod
+    def _transaction(fields: Dict[str, str]) -> Optional[Dict]:
+        date = parse_date(fields.get("DTPOSTED", ""))
+        amount = parse_amount(fields.get("TRNAMT", ""))
+        if date is None or amount is None:
+            return None
+        description = html.unescape(fields.get("NAME") or fields.get("MEMO") or "")
+        return {"date": date, "description": description.strip(), "amount": amount}
+
+    def iter_extract(self, text: str) -> Iterator[Dict]:
+        """Lazily yield transaction dicts (date, description, amount)."""
+        fields: Optional[Dict[str, str]] = None
+        for match in _TAG.finditer(text):
+            closing, tag, value = match.groups()
+            tag = tag.upper()
+            if tag == "STMTTRN":
+                if fields is not None:
+                    txn = self._transaction(fields)
+                    if txn is not None:
+                        yield txn
+                fields = None if closing else {}
+            elif fields is not None and not closing and tag in (
+                "DTPOSTED", "TRNAMT", "NAME", "MEMO"
+            ):
+                fields[tag] = value.strip()
+        if fields is not None:
+            txn = self._transaction(fields)
+            if txn is not None:
+                yield txn
+
+    def extract(self, text: str) -> List[Dict]:
+        """
+        Extract transactions from OFX text.
+        Returns a list of dicts with keys: date, description, amount.
+        """
+        return list(self.iter_extract(text))
@@ -1,13 +1,239 @@
+import os
+import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
 import pdfplumber
+from pdfminer.pdftypes import resolve1
+
+from .config import IngestConfig
+
+# A filesystem path or an open binary file object (e.g. a streamed upload)
+PdfSource = Union[str, BinaryIO]
+
+# Page classes assigned by `classify_page`; only SKIPPED_PAGE_CLASSES are dropped
+PAGE_TRANSACTIONS = "transactions"
+PAGE_PROSE = "prose"
+PAGE_EMPTY = "empty"
+PAGE_UNKNOWN = "unknown"
+SKIPPED_PAGE_CLASSES = {PAGE_PROSE, PAGE_EMPTY}
+
+_LITERAL = re.compile(rb"\((?:[^()\\]|\\.)*\)", re.DOTALL)
+_DATE_PROBE = re.compile(
+    rb"\d{4}[-/.]\d{1,2}[-/.]\d{1,2}"
+    rb"|\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4}"
+    rb"|\d{1,2} ?(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)",
+    re.IGNORECASE,
+)
+_TEXT_OBJECT = re.compile(rb"\bBT\b")
+_XOBJECT = re.compile(rb"\bDo\b")
+
+
+@dataclass
+class PageScreenStats:
+    """
+    Per-document pre-screen counters: pages seen, pages skipped without
+    text extraction, and the time spent classifying and extracting.
+    """
+    pages: int = 0
+    skipped: int = 0
+    screen_seconds: float = 0.0
+    extract_seconds: float = 0.0
+
+    def merge(self, other: "PageScreenStats") -> None:
+        self.pages += other.pages
+        self.skipped += other.skipped
+        self.screen_seconds += other.screen_seconds
+        self.extract_seconds += other.extract_seconds
+
+
+def classify_page(page) -> str:
+    """
+    Cheaply classify a pdfplumber page from its raw content stream, without
+    running pdfminer's layout interpreter (which costs as much as full text
+    extraction). String literals shown on the page are probed for dates and
+    their digit density:
+    - PAGE_EMPTY: no text objects and no XObjects (nothing to extract).
+    - PAGE_TRANSACTIONS: a date-like run appears in the shown text.
+    - PAGE_PROSE: readable text with no date and few digits (T&Cs, marketing).
+    - PAGE_UNKNOWN: text in hex strings, custom encodings or form XObjects,
+      or digit-heavy text without a recognised date – extracted to be safe.
+    """
+    try:
+        data = b"".join(resolve1(stream).get_data() for stream in page.page_obj.contents)
+    except Exception:
+        return PAGE_UNKNOWN
+    has_text = _TEXT_OBJECT.search(data) is not None
+    if not has_text:
+        return PAGE_UNKNOWN if _XOBJECT.search(data) else PAGE_EMPTY
+    shown = b"".join(match.group()[1:-1] for match in _LITERAL.finditer(data))
+    if not shown or _XOBJECT.search(data):
+        return PAGE_UNKNOWN
+    printable = sum(1 for byte in shown if 32 <= byte < 127)
+    if printable < 0.9 * len(shown):
+        return PAGE_UNKNOWN
+    if _DATE_PROBE.search(shown):
+        return PAGE_TRANSACTIONS
+    digits = sum(1 for byte in shown if 48 <= byte <= 57)
+    if digits >= IngestConfig.PRESCREEN_DIGIT_RATIO * len(shown):
+        return PAGE_UNKNOWN
+    return PAGE_PROSE
+
+
+def should_skip_page(page, stats: Optional[PageScreenStats] = None) -> bool:
+    """
+    Pre-screen one page: True if it can be skipped without text extraction.
+    Records the classification time (and the skip) in `stats`, if given.
+    """
+    started = time.perf_counter()
+    skip = classify_page(page) in SKIPPED_PAGE_CLASSES
+    if stats is not None:
+        stats.screen_seconds += time.perf_counter() - started
+        stats.skipped += skip
+    return skip
+
 
-def extract_text_from_pdf(file_path: str) -> str:
+def _iter_page_text(
+    pdf,
+    prescreen: bool = False,
+    stats: Optional[PageScreenStats] = None,
+) -> Iterator[str]:
+    """
+    Yield the text of each page of an open pdfplumber document in order.
+    Each page's cached layout objects are released as soon as its text
+    has been extracted, so only one page is held in memory at a time.
+    With `prescreen`, pages classified as prose or empty are skipped
+    without extraction; `stats`, if given, is updated as pages go by.
+    """
+    for page in pdf.pages:
+        if stats is not None:
+            stats.pages += 1
+        if prescreen and should_skip_page(page, stats):
+            page.close()
+            continue
+        started = time.perf_counter()
+        text = page.extract_text() or ""
+        page.close()
+        if stats is not None:
+            stats.extract_seconds += time.perf_counter() - started
+        yield text
+
+
+def iter_pdf_pages(
+    file_path: PdfSource,
+    prescreen: bool = False,
+    stats: Optional[PageScreenStats] = None,
+) -> Iterator[str]:
+    """
+    Lazily yield the raw text of each page of a PDF file, in page order.
+    Pages without extractable text yield an empty string; with `prescreen`,
+    pages that `classify_page` deems transaction-free are not yielded.
+    Any error (file not found, corrupted PDF, etc.) ends the iteration
+    early instead of raising.
+    """
+    try:
+        with pdfplumber.open(file_path) as pdf:
+            yield from _iter_page_text(pdf, prescreen, stats)
+    except Exception:
+        return
+
+
+def _extract_page_range(
+    file_path: str,
+    start: int,
+    stop: int,
+    prescreen: bool = False,
+) -> Tuple[List[str], PageScreenStats]:
+    """
+    Worker entry point: extract pages [start, stop) (0-based) of a PDF.
+    Runs in a child process, so it opens its own handle on the file.
+    Returns the page texts and the range's pre-screen stats.
+    """
+    stats = PageScreenStats()
+    page_numbers = list(range(start + 1, stop + 1))  # pdfplumber is 1-based
+    with pdfplumber.open(file_path, pages=page_numbers) as pdf:
+        return list(_iter_page_text(pdf, prescreen, stats)), stats
+
+
+def _page_ranges(page_count: int, chunks: int) -> List[Tuple[int, int]]:
+    """Split [0, page_count) into at most `chunks` contiguous, ordered ranges."""
+    size = -(-page_count // chunks)  # ceiling division
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def extract_pages_parallel(
+    file_path: PdfSource,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    prescreen: bool = False,
+    stats: Optional[PageScreenStats] = None,
+) -> List[str]:
+    """
+    Extract the text of every page, splitting page ranges across worker
+    processes and reassembling the results in page order.
+
+    - `max_workers` defaults to IngestConfig.PDF_WORKERS (0 = CPU count).
+    - An existing `executor` may be supplied to reuse a long-lived pool.
+    - Documents shorter than IngestConfig.PDF_PARALLEL_MIN_PAGES, a single
+      worker, or a file object (which child processes cannot reopen) fall
+      back to serial extraction in this process.
+    - `prescreen` and `stats` behave as in `iter_pdf_pages`; worker stats
+      are merged into `stats`.
+
+    Raises whatever pdfplumber raises; callers wanting the defensive
+    behaviour should use `extract_text_from_pdf(..., parallel=True)`.
+    """
+    workers = max_workers or IngestConfig.PDF_WORKERS or os.cpu_count() or 1
+    with pdfplumber.open(file_path) as pdf:
+        page_count = len(pdf.pages)
+        serial = not isinstance(file_path, str) or workers <= 1
+        if serial or page_count < IngestConfig.PDF_PARALLEL_MIN_PAGES:
+            return list(_iter_page_text(pdf, prescreen, stats))
+
+    ranges = _page_ranges(page_count, workers)
+    pool = executor or ProcessPoolExecutor(max_workers=min(workers, len(ranges)))
+    try:
+        futures = [
+            pool.submit(_extract_page_range, file_path, start, stop, prescreen)
+            for start, stop in ranges
+        ]
+        pages: List[str] = []
+        for future in futures:  # submission order == page order
+            range_pages, range_stats = future.result()
+            pages.extend(range_pages)
+            if stats is not None:
+                stats.merge(range_stats)
+        return pages
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+
+def extract_text_from_pdf(
+    file_path: PdfSource,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    prescreen: bool = False,
+    stats: Optional[PageScreenStats] = None,
+) -> str:
     """
     Extract raw text from a PDF file using pdfplumber.
     Returns an empty string if no text can be extracted.
+    With `parallel=True`, pages are extracted by a process pool
+    (see `extract_pages_parallel`); the returned text is identical.
+    With `prescreen=True`, transaction-free pages are left out (see
+    `classify_page`) and `stats`, if given, records what was skipped.
     """
     try:
-        with pdfplumber.open(file_path) as pdf:
-            pages_text = [page.extract_text() or "" for page in pdf.pages]
+        if parallel:
+            pages_text = extract_pages_parallel(
+                file_path, max_workers=max_workers, prescreen=prescreen, stats=stats
+            )
+        else:
+            with pdfplumber.open(file_path) as pdf:
+                pages_text = list(_iter_page_text(pdf, prescreen, stats))
         return "\n".join(pages_text).strip()
     except Exception:
         # Any error (file not found, corrupted PDF, etc.) results in empty string
@@ -1,16 +1,138 @@
-from typing import Optional
+import os
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
 from .base import BaseDocumentParser
 from .bank_statement_parser_v1 import BankStatementParserV1
+from .config import IngestConfig
+from .csv_statement_parser import CsvStatementParser
+from .ofx_statement_parser import OfxStatementParser
+
+# List of available parsers – order matters (breaks ties between equal scores)
+PARSERS = [BankStatementParserV1(), CsvStatementParser(), OfxStatementParser()]
+
+# File extension → source type; anything else is treated as a PDF
+SOURCE_TYPE_BY_EXTENSION = {
+    ".csv": "csv",
+    ".ofx": "ofx",
+    ".qfx": "ofx",
+}
+
+
+def source_type_for_path(file_path: str) -> str:
+    """Return the source type ("pdf", "csv" or "ofx") implied by a file name."""
+    return SOURCE_TYPE_BY_EXTENSION.get(os.path.splitext(file_path)[1].lower(), "pdf")
+
+
+class SignatureIndex:
+    """
+    Combined signature index over a fixed list of parsers.
+
+    Every parser keyword is folded into a single alternation that is scanned
+    once per document; each hit credits all parsers declaring that keyword.
+    Regex fingerprints are compiled once and score two points each.
+    """
+
+    def __init__(self, parsers: List[BaseDocumentParser]):
+        self.parsers = list(parsers)
+        self._owners: Dict[str, List[int]] = {}
+        self._fingerprints: List[Tuple[int, re.Pattern]] = []
+        self._unsigned: List[int] = []
+
+        for index, parser in enumerate(self.parsers):
+            keywords = {kw.lower() for kw in parser.KEYWORDS if kw}
+            for kw in keywords:
+                self._owners.setdefault(kw, []).append(index)
+            for pattern in parser.FINGERPRINTS:
+                self._fingerprints.append((index, re.compile(pattern, re.IGNORECASE)))
+            if not keywords and not parser.FINGERPRINTS:
+                self._unsigned.append(index)
+
+        # At each position the lookahead reports the longest keyword starting
+        # there; shorter keywords starting at the same position are prefixes
+        # of it and are credited through `_implied`.
+        ordered = sorted(self._owners, key=len, reverse=True)
+        self._keyword_re = (
+            re.compile("(?=(" + "|".join(re.escape(kw) for kw in ordered) + "))")
+            if ordered
+            else None
+        )
+        self._implied: Dict[str, Set[str]] = {
+            kw: {other for other in self._owners if kw.startswith(other)}
+            for kw in self._owners
+        }
+
+    def scores(self, text: str) -> List[int]:
+        """Return one score per parser for the given text."""
+        scores = [0] * len(self.parsers)
+        if self._keyword_re is not None:
+            lowered = text.lower()
+            found: Set[str] = set()
+            for match in self._keyword_re.finditer(lowered):
+                kw = match.group(1)
+                if kw not in found:
+                    found |= self._implied[kw]
+            for kw in found:
+                for index in self._owners[kw]:
+                    scores[index] += 1
+        for index, regex in self._fingerprints:
+            if regex.search(text):
+                scores[index] += 2
+        for index in self._unsigned:
+            if self.parsers[index].can_parse(text):
+                scores[index] += 1
+        return scores
+
+    def best(self, text: str) -> Optional[BaseDocumentParser]:
+        """
+        Return the highest-scoring parser, or None if nothing scored.
+        Ties go to the parser registered first.
+        """
+        best_index, best_score = None, 0
+        for index, score in enumerate(self.scores(text)):
+            if score > best_score:
+                best_index, best_score = index, score
+        return self.parsers[best_index] if best_index is not None else None
+
+
+_indexes: Dict[str, Tuple[Tuple[int, ...], SignatureIndex]] = {}
+
+
+def get_signature_index(source_type: str = "pdf") -> SignatureIndex:
+    """
+    Return the index over the PARSERS accepting `source_type`, rebuilding it
+    only when the PARSERS list has changed since the last call.
+    """
+    key = tuple(id(parser) for parser in PARSERS)
+    cached = _indexes.get(source_type)
+    if cached is None or cached[0] != key:
+        parsers = [p for p in PARSERS if source_type in p.SOURCE_TYPES]
+        cached = (key, SignatureIndex(parsers))
+        _indexes[source_type] = cached
+    return cached[1]
+
+
+def register_parser(parser: BaseDocumentParser) -> None:
+    """Append a parser to PARSERS; the index is rebuilt on next dispatch."""
+    PARSERS.append(parser)
+
+
+def get_parser_for_head(text: str, source_type: str = "pdf") -> Optional[BaseDocumentParser]:
+    """
+    Return the best-scoring parser using only the first
+    IngestConfig.DISPATCH_HEAD_CHARS characters of the text, or None.
+    """
+    return get_signature_index(source_type).best(text[: IngestConfig.DISPATCH_HEAD_CHARS])
 
-# List of available parsers – order matters (first match wins)
-PARSERS = [BankStatementParserV1()]
 
-def get_parser_for_text(text: str) -> Optional[BaseDocumentParser]:
+def get_parser_for_text(text: str, source_type: str = "pdf") -> Optional[BaseDocumentParser]:
     """
-    Return the first parser that reports it can handle the given text,
-    or None if no parser matches.
+    Return the parser best suited to the given text, or None if no parser
+    matches. Only parsers accepting `source_type` are considered. The
+    document head is checked first; the whole text is scanned (still in a
+    single pass) only when the head carries no signature.
     """
-    for parser in PARSERS:
-        if parser.can_parse(text):
-            return parser
-    return None
+    return (
+        get_parser_for_head(text, source_type)
+        or get_signature_index(source_type).best(text)
+    )
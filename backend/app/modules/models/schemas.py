@@ -23,6 +23,7 @@ class DocumentSchema(BaseModel):
     family_id: str
     filename: str
     uploaded_at: datetime
+    status: str | None = None          # queued → processing → processed | failed
 
     # Additional fields for persistence feedback
     transactions_inserted: int | None = None
@@ -47,6 +48,18 @@ class DocumentListItemSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class DocumentStatusSchema(BaseModel):
+    """
+    Processing status of an uploaded document, for client polling.
+    """
+    id: str
+    family_id: str
+    status: str
+    error: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class TransactionSchema(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     family_id: str
@@ -104,6 +117,22 @@ class MonthlySummarySchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BudgetHealthSchema(BaseModel):
+    """
+    `analyze_budget` metrics of one month, as returned by the health timeline.
+    """
+    month: str
+    income: float
+    expenses: float
+    savings_rate: float
+    expense_ratio: float
+    largest_category: str | None = None
+    status: str
+    health_score: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class GoalDeleteResponseSchema(BaseModel):
     """
     Simple response for a successful delete operation.
@@ -113,6 +142,16 @@ class GoalDeleteResponseSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class DocumentDeleteResponseSchema(BaseModel):
+    """
+    Response for a deleted document: the months whose summaries changed.
+    """
+    deleted: bool
+    months_updated: int = 0
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class DefaultFamilyResponseSchema(BaseModel):
     """
     Typed response for the /me/default-family endpoint.
@@ -1,7 +1,8 @@
 from .schema import NormalizedTransaction
 from .category_rules import CATEGORY_RULES, categorize
 from .confidence import adjust_confidence
-from .normalizer import normalize_transactions
+from .batch import TransactionBatch
+from .normalizer import normalize_batch, normalize_transactions
 
 __all__ = [
     "NormalizedTransaction",
@@ -9,4 +10,6 @@ __all__ = [
     "categorize",
     "adjust_confidence",
     "normalize_transactions",
+    "normalize_batch",
+    "TransactionBatch",
 ]
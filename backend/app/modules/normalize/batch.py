@@ -0,0 +1,157 @@
+"""
+Columnar container for normalized transactions.
+
+A TransactionBatch keeps one column per NormalizedTransaction field
+instead of one object (and later one dict) per row: amounts and
+confidences live in `array('d')`, direction, category and subcategory are
+dictionary-encoded (a small code per row plus the distinct strings), and
+dates and descriptions are interned so repeated values share storage. A
+batch pickles to a few flat buffers, which keeps the hand-off from
+executor workers cheap.
+
+It also behaves as a read-only sequence of NormalizedTransaction, built on
+access, for code that wants rows.
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .schema import NormalizedTransaction
+
+FIELDS = (
+    "id", "date", "description", "amount", "direction", "category", "subcategory", "confidence",
+)
+
+
+class EncodedColumn:
+    """Dictionary-encoded column of (optional) strings."""
+
+    __slots__ = ("values", "codes", "_index")
+
+    def __init__(self):
+        self.values: List[Optional[str]] = []
+        self.codes = array("I")
+        self._index: Dict[Optional[str], int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        """Return the code of `value`, registering it if new."""
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value: Optional[str]) -> None:
+        self.codes.append(self.code(value))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.values[self.codes[index]]
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return map(self.values.__getitem__, self.codes)
+
+    def __getstate__(self):
+        return self.values, self.codes
+
+    def __setstate__(self, state) -> None:
+        self.values, self.codes = state
+        self._index = {value: code for code, value in enumerate(self.values)}
+
+    def copy(self) -> "EncodedColumn":
+        column = EncodedColumn()
+        column.values = list(self.values)
+        column.codes = array(self.codes.typecode, self.codes)
+        column._index = dict(self._index)
+        return column
+
+
+class TransactionBatch:
+    """
+    Column-oriented batch of normalized transactions. Rows are only
+    appended; the columns are exposed for vectorised consumers
+    (aggregation, persistence).
+    """
+
+    __slots__ = (
+        "ids", "dates", "descriptions", "amounts", "directions",
+        "categories", "subcategories", "confidences",
+    )
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.dates: List[str] = []
+        self.descriptions: List[str] = []
+        self.amounts = array("d")
+        self.directions = EncodedColumn()
+        self.categories = EncodedColumn()
+        self.subcategories = EncodedColumn()
+        self.confidences = array("d")
+
+    def append(
+        self,
+        id: str,
+        date: str,
+        description: str,
+        amount: float,
+        direction: str,
+        category: str,
+        subcategory: Optional[str] = None,
+        confidence: float = 0.0,
+    ) -> None:
+        self.ids.append(id)
+        self.dates.append(sys.intern(date) if type(date) is str else date)
+        self.descriptions.append(
+            sys.intern(description) if type(description) is str else description
+        )
+        self.amounts.append(amount)
+        self.directions.append(direction)
+        self.categories.append(category)
+        self.subcategories.append(subcategory)
+        self.confidences.append(confidence)
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[NormalizedTransaction]) -> "TransactionBatch":
+        batch = cls()
+        for t in transactions:
+            batch.append(
+                t.id, t.date, t.description, t.amount, t.direction,
+                t.category, t.subcategory, t.confidence,
+            )
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _columns(self):
+        return (
+            self.ids, self.dates, self.descriptions, self.amounts, self.directions,
+            self.categories, self.subcategories, self.confidences,
+        )
+
+    def __getitem__(self, index: int) -> NormalizedTransaction:
+        return NormalizedTransaction(*(column[index] for column in self._columns()))
+
+    def __iter__(self) -> Iterator[NormalizedTransaction]:
+        return map(NormalizedTransaction, *self._columns())
+
+    def __getstate__(self):
+        return self._columns()
+
+    def __setstate__(self, state) -> None:
+        for name, column in zip(self.__slots__, state):
+            setattr(self, name, column)
+
+    def copy(self) -> "TransactionBatch":
+        """Independent copy: appending to or editing either batch leaves the other as is."""
+        batch = TransactionBatch.__new__(TransactionBatch)
+        for name, column in zip(self.__slots__, self._columns()):
+            setattr(batch, name, column.copy() if isinstance(column, EncodedColumn) else column[:])
+        return batch
+
+    def to_dicts(self) -> List[Dict]:
+        """Rows as plain dicts, the same as `dataclasses.asdict` of each row."""
+        return [dict(zip(FIELDS, row)) for row in zip(*self._columns())]
@@ -0,0 +1,57 @@
+"""
+Memo of categorization results for recurring descriptions.
+
+The same merchant descriptions come back every month for every family, so
+`categorize` results are kept in a bounded LRU with an optional TTL, keyed
+on the canonical description (see `CategoryMatcher.canonical`). The cache
+is tied to the matcher that produced its entries: when CATEGORY_RULES
+change and a new matcher is built, the cache empties itself on next use.
+"""
+
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from backend.app.core.lru import BoundedLRU
+
+# Default bounds of the process-wide cache
+CATEGORY_CACHE_SIZE = 50_000
+CATEGORY_CACHE_TTL = 24 * 60 * 60  # seconds
+
+Result = Tuple[str, float]
+
+
+class CategorizationCache(BoundedLRU[Result]):
+    """
+    LRU/TTL memo of (category, base confidence) by canonical description.
+    Besides the BoundedLRU counters, counts invalidations (rule changes).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CATEGORY_CACHE_SIZE,
+        ttl_seconds: Optional[float] = CATEGORY_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(max_entries, ttl_seconds=ttl_seconds, clock=clock)
+        self._owner = None
+        self.invalidations = 0
+
+    def bind(self, matcher) -> None:
+        """Drop every entry if they were produced by a different matcher."""
+        if self._owner is matcher:
+            return
+        with self._lock:
+            if self._owner is not None and self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._size = 0
+            self._owner = matcher
+
+    def stats(self) -> Dict[str, int]:
+        stats = super().stats()
+        stats["invalidations"] = self.invalidations
+        return stats
+
+
+# Process-wide cache, shared by every batch normalized in this process
+categorization_cache = CategorizationCache()
@@ -1,4 +1,9 @@
-from typing import Tuple
+import hashlib
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .category_cache import CategorizationCache, categorization_cache
+from .keyword_matcher import KeywordAutomaton
 
 # Simple keyword‑to‑category mapping (all lower‑case)
 CATEGORY_RULES = {
@@ -10,17 +15,120 @@ CATEGORY_RULES = {
     "Healthcare": ["pharmacy", "hospital", "clinic", "dentist"],
 }
 
-def categorize(description: str) -> Tuple[str, float]:
+# Below this many keywords testing each one with `in` (a C-level substring
+# search) is faster than walking the automaton character by character
+AUTOMATON_MIN_KEYWORDS = 64
+
+# Digit runs (store numbers, references) collapse to this mark in canonical
+# descriptions, so "WOOLWORTHS 1234" and "WOOLWORTHS 0042" share a cache entry
+_DIGIT_RUN = re.compile(r"\d+")
+_DIGIT_MARK = "#"
+
+
+class CategoryMatcher:
+    """
+    Compiled form of a category → keywords mapping.
+
+    Categories are ranked in mapping order and all their keywords are folded
+    into one Aho–Corasick automaton, so a description is scanned once
+    whatever the number of keywords. The category of the first rule (in
+    mapping order) with any keyword in the description wins, exactly as in
+    a loop over the rules. Rule sets with fewer than `min_automaton_keywords`
+    keywords keep the plain loop.
+    """
+
+    def __init__(
+        self,
+        rules: Dict[str, List[str]],
+        min_automaton_keywords: int = AUTOMATON_MIN_KEYWORDS,
+    ):
+        self.categories: Tuple[str, ...] = tuple(rules)
+        self._rules = tuple((category, tuple(keywords)) for category, keywords in rules.items())
+        keyword_count = sum(len(keywords) for _, keywords in self._rules)
+        self.automaton = (
+            KeywordAutomaton(
+                (kw, rank)
+                for rank, (_, keywords) in enumerate(self._rules)
+                for kw in keywords
+            )
+            if keyword_count >= min_automaton_keywords
+            else None
+        )
+        # Identifies the rule set, e.g. to spot merchants resolved under older rules
+        self.fingerprint = hashlib.sha256(repr(self._rules).encode("utf-8")).hexdigest()[:16]
+        # Masking digit runs cannot change a match unless a keyword
+        # contains a digit or the mark itself
+        self._mask_digits = not any(
+            _DIGIT_MARK in kw or _DIGIT_RUN.search(kw)
+            for _, keywords in self._rules
+            for kw in keywords
+        )
+
+    def canonical(self, description: str) -> str:
+        """
+        Lower-cased description with digit runs masked where that is safe;
+        `match` gives the same result for it as for the description.
+        """
+        lowered = description.lower()
+        return _DIGIT_RUN.sub(_DIGIT_MARK, lowered) if self._mask_digits else lowered
+
+    def match(self, lowered: str) -> Optional[str]:
+        """Return the winning category for a lower-cased description, or None."""
+        if self.automaton is None:
+            for category, keywords in self._rules:
+                for kw in keywords:
+                    if kw in lowered:
+                        return category
+            return None
+        rank = self.automaton.best_rank(lowered)
+        return None if rank is None else self.categories[rank]
+
+
+def _rules_key(rules: Dict[str, List[str]]) -> Tuple:
+    # The rule contents themselves (the table is small), so any change is
+    # seen – including a keyword edited in place
+    return tuple((category, tuple(keywords)) for category, keywords in rules.items())
+
+
+_matcher: Optional[Tuple[Tuple, CategoryMatcher]] = None
+
+
+def get_category_matcher() -> CategoryMatcher:
+    """
+    Return the matcher for the current CATEGORY_RULES, rebuilding it only
+    when the rules have changed since the last call (see `_rules_key`).
+    """
+    global _matcher
+    key = _rules_key(CATEGORY_RULES)
+    if _matcher is None or _matcher[0] != key:
+        _matcher = (key, CategoryMatcher(CATEGORY_RULES))
+    return _matcher[1]
+
+
+def categorize(
+    description: str,
+    matcher: Optional[CategoryMatcher] = None,
+    cache: Optional[CategorizationCache] = categorization_cache,
+) -> Tuple[str, float]:
     """
     Return a (category, confidence) pair based on keyword matching.
     - Matching is case‑insensitive.
     - First matching keyword wins.
     - If no keyword matches, category = "Other" and confidence = 0.3.
+    Pass `matcher` (from `get_category_matcher`) to skip the per-call
+    check for changed rules when categorizing a batch. Results are memoized
+    in `cache` by canonical description; pass `cache=None` to bypass it.
     """
-    lowered = description.lower()
-    for category, keywords in CATEGORY_RULES.items():
-        for kw in keywords:
-            if kw in lowered:
-                # Confidence is modest for simple keyword match
-                return category, 0.6
-    return "Other", 0.3
+    matcher = matcher or get_category_matcher()
+    key = matcher.canonical(description)
+    if cache is not None:
+        cache.bind(matcher)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    category = matcher.match(key)
+    # Confidence is modest for simple keyword match
+    result = (category, 0.6) if category is not None else ("Other", 0.3)
+    if cache is not None:
+        cache.put(key, result)
+    return result
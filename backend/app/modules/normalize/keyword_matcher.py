@@ -0,0 +1,88 @@
+"""
+Aho–Corasick multi-keyword matching.
+
+The automaton is built once from a ranked keyword list and then finds, in
+a single left-to-right pass over a text, the best-ranked keyword that
+occurs anywhere in it as a substring – the same answer as testing
+`kw in text` for every keyword in rank order, without the cost growing
+with the number of keywords.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_NO_MATCH = float("inf")
+
+
+class KeywordAutomaton:
+    """
+    Aho–Corasick automaton over (keyword, rank) pairs; lower ranks win.
+
+    Every state records the best rank of any keyword ending there,
+    including keywords that are suffixes of it (folded in along the
+    failure links at build time), so a scan only reads one value per
+    character.
+    """
+
+    def __init__(self, ranked_keywords: Iterable[Tuple[str, int]]):
+        goto: List[Dict[str, int]] = [{}]
+        best: List[float] = [_NO_MATCH]
+        for keyword, rank in ranked_keywords:
+            node = 0
+            for ch in keyword:
+                child = goto[node].get(ch)
+                if child is None:
+                    child = len(goto)
+                    goto[node][ch] = child
+                    goto.append({})
+                    best.append(_NO_MATCH)
+                node = child
+            best[node] = min(best[node], rank)
+
+        fail = [0] * len(goto)
+        queue = deque()
+        for child in goto[0].values():
+            best[child] = min(best[child], best[0])
+            queue.append(child)
+        # Breadth first, so a state's failure target is final before the state
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                target = fail[node]
+                while target and ch not in goto[target]:
+                    target = fail[target]
+                fail[child] = goto[target].get(ch, 0)
+                best[child] = min(best[child], best[fail[child]])
+                queue.append(child)
+
+        self._goto = goto
+        self._fail = fail
+        self._best = best
+        self.states = len(goto)
+
+    def best_rank(self, text: str, floor: int = 0) -> Optional[int]:
+        """
+        Return the lowest rank of any keyword occurring in `text`, or None.
+        The scan stops early once a keyword of rank `floor` (the best
+        possible) is seen.
+        """
+        goto, fail, ranks = self._goto, self._fail, self._best
+        node = 0
+        best = ranks[0]
+        if best <= floor:
+            return best
+        for ch in text:
+            while True:
+                child = goto[node].get(ch)
+                if child is not None:
+                    node = child
+                    break
+                if not node:
+                    break
+                node = fail[node]
+            rank = ranks[node]
+            if rank < best:
+                best = rank
+                if best <= floor:
+                    break
+        return None if best == _NO_MATCH else best
@@ -0,0 +1,24 @@
+import hashlib
+from typing import Optional
+
+from .category_rules import CategoryMatcher, get_category_matcher
+
+# Longest merchant key kept; statement descriptions rarely name a merchant
+# beyond this and the rest is usually reference noise
+MERCHANT_KEY_LENGTH = 128
+
+
+def merchant_key(description: str, matcher: Optional[CategoryMatcher] = None) -> str:
+    """
+    Canonical merchant key of a transaction description: the matcher's
+    canonical form (lower-cased, digit runs such as store numbers masked
+    to "#" where no keyword contains digits), so descriptions sharing a key
+    always get the same category. "WOOLWORTHS 1234 SYDNEY" and "Woolworths
+    0042 Sydney" both become "woolworths # sydney". Longer keys keep their
+    head plus a hash of the whole, so distinct descriptions never merge.
+    """
+    key = (matcher or get_category_matcher()).canonical(description)
+    if len(key) > MERCHANT_KEY_LENGTH:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        key = f"{key[:MERCHANT_KEY_LENGTH - 17]}~{digest}"
+    return key
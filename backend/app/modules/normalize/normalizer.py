@@ -1,9 +1,14 @@
 import hashlib
-from typing import List, Dict
+from typing import List, Dict, Optional
 
+from .batch import TransactionBatch
 from .schema import NormalizedTransaction
-from .category_rules import categorize
+from .category_rules import categorize, get_category_matcher
 from .confidence import adjust_confidence
+from .vectorized import available as vectorized_available, normalize_batch_vectorized
+
+# From about this many rows the NumPy path beats the per-row loop
+VECTORIZE_MIN_ROWS = 32
 
 def _deterministic_id(date: str, description: str, amount: float) -> str:
     """
@@ -12,16 +17,29 @@ def _deterministic_id(date: str, description: str, amount: float) -> str:
     raw = f"{date}|{description}|{amount}"
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
 
-def normalize_transactions(raw_transactions: List[Dict]) -> List[NormalizedTransaction]:
+def normalize_batch(
+    raw_transactions: List[Dict],
+    batch: Optional[TransactionBatch] = None,
+    vectorized: Optional[bool] = None,
+) -> TransactionBatch:
     """
-    Convert a list of raw transaction dicts (as produced by parsers)
-    into a list of NormalizedTransaction objects.
+    Normalise raw transaction dicts (as produced by parsers) straight into
+    the columns of a TransactionBatch – appended to `batch` if given –
+    without creating an object per row.
     - Direction is inferred from sign of amount.
     - Category is obtained via static keyword rules.
     - Confidence is adjusted based on amount.
     - Subcategory is left as None (placeholder for future extensions).
+    Batches of VECTORIZE_MIN_ROWS or more go through the NumPy path when
+    it is installed (`vectorized=None`); pass True/False to force a path.
+    The loop below is the reference: both give identical output.
     """
-    normalized: List[NormalizedTransaction] = []
+    if vectorized is None:
+        vectorized = vectorized_available() and len(raw_transactions) >= VECTORIZE_MIN_ROWS
+    if vectorized:
+        return normalize_batch_vectorized(raw_transactions, batch)
+    batch = TransactionBatch() if batch is None else batch
+    matcher = get_category_matcher()
     for raw in raw_transactions:
         date = raw.get("date", "")
         description = raw.get("description", "")
@@ -29,21 +47,17 @@ def normalize_transactions(raw_transactions: List[Dict]) -> List[NormalizedTrans
 
         direction = "income" if amount > 0 else "expense"
 
-        category, base_conf = categorize(description)
+        category, base_conf = categorize(description, matcher)
         confidence = adjust_confidence(category, base_conf, amount)
 
         txn_id = _deterministic_id(date, description, amount)
 
-        normalized.append(
-            NormalizedTransaction(
-                id=txn_id,
-                date=date,
-                description=description,
-                amount=amount,
-                direction=direction,
-                category=category,
-                subcategory=None,
-                confidence=confidence,
-            )
-        )
-    return normalized
+        batch.append(txn_id, date, description, amount, direction, category, None, confidence)
+    return batch
+
+def normalize_transactions(raw_transactions: List[Dict]) -> List[NormalizedTransaction]:
+    """
+    Convert a list of raw transaction dicts (as produced by parsers)
+    into a list of NormalizedTransaction objects (see `normalize_batch`).
+    """
+    return list(normalize_batch(raw_transactions))
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Literal, Optional
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedTransaction:
     """
     Deterministic, schema‑only representation of a transaction.
@@ -1,12 +1,15 @@
-from datetime import date
+import datetime
+from typing import Optional
 from pydantic import BaseModel, Field
 
 class NormalizedTransaction(BaseModel):
-    date: date = Field(..., description="Transaction date in YYYY-MM-DD")
+    # Annotated via the module: a field named `date` cannot also be its type
+    date: datetime.date = Field(..., description="Transaction date in YYYY-MM-DD")
     amount: float = Field(..., description="Signed amount, negative for debits")
     category: str = Field(..., description="Rule‑based category")
     member: str = Field(..., description="Family member associated")
     recurring: bool = Field(..., description="True if recurring transaction")
+    description: Optional[str] = Field(None, description="Statement description")
 
     class Config:
         orm_mode = True
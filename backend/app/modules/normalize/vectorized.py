@@ -0,0 +1,145 @@
+"""
+NumPy-vectorized normalisation for bulk imports and backfills.
+
+`normalize_batch_vectorized` produces exactly the TransactionBatch that
+the scalar reference loop in `normalizer.normalize_batch` builds, but:
+- parses amounts once into a float64 array and derives direction and the
+  `adjust_confidence` scaling with array operations,
+- categorizes each distinct description once and broadcasts the result,
+- builds the SHA-256 ids in one tight pass and fills the encoded columns
+  from code arrays instead of appending row by row.
+
+NumPy is optional: `available()` is False without it and callers keep the
+scalar path.
+"""
+
+import hashlib
+import sys
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency – the scalar path is used instead
+    np = None
+
+from .batch import EncodedColumn, TransactionBatch
+from .category_rules import categorize, get_category_matcher
+
+
+def available() -> bool:
+    """True if NumPy is installed and the vectorized path can run."""
+    return np is not None
+
+
+def _intern(values: List) -> List:
+    return [sys.intern(v) if type(v) is str else v for v in values]
+
+
+def _extend_codes(column: EncodedColumn, codes) -> None:
+    column.codes.frombytes(
+        np.asarray(codes, dtype=np.dtype(f"u{column.codes.itemsize}")).tobytes()
+    )
+
+
+def confidences(categories_other, base_confidences, amounts):
+    """
+    Array form of `adjust_confidence`: "Other" rows cap the base at 0.5,
+    the rest add 0.1 per $1000 of absolute amount (at most 0.4), capped
+    at 1.0. NaN and infinite amounts propagate exactly as in the scalar
+    arithmetic.
+    """
+    with np.errstate(invalid="ignore"):
+        extra = np.minimum(np.floor_divide(np.abs(amounts), 1000) * 0.1, 0.4)
+    return np.where(
+        categories_other,
+        np.minimum(base_confidences, 0.5),
+        np.minimum(base_confidences + extra, 1.0),
+    )
+
+
+def month_keys(dates: List) -> Tuple["np.ndarray", List[str]]:
+    """
+    Factorize the "YYYY-MM" month (`date[:7]`) of every date: return a code
+    per row and the months in first-seen order. Each distinct date is only
+    sliced once; rows whose date cannot be sliced get code -1, the rows
+    `aggregate_by_month` skips.
+    """
+    date_codes: Dict = {}
+    row_codes = np.fromiter(
+        (date_codes.setdefault(d, len(date_codes)) for d in dates),
+        dtype=np.intp,
+        count=len(dates),
+    )
+    months: Dict[str, int] = {}
+    codes = []
+    for date in date_codes:
+        try:
+            month = date[:7]
+        except Exception:
+            codes.append(-1)
+            continue
+        codes.append(months.setdefault(month, len(months)))
+    return np.array(codes, dtype=np.intp)[row_codes], list(months)
+
+
+def normalize_batch_vectorized(
+    raw_transactions: List[Dict],
+    batch: Optional[TransactionBatch] = None,
+) -> TransactionBatch:
+    """
+    Vectorized equivalent of `normalize_batch`; appends to `batch` if given.
+    Raises RuntimeError if NumPy is not installed.
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required for vectorized normalisation")
+    batch = TransactionBatch() if batch is None else batch
+    if not raw_transactions:
+        return batch
+
+    dates = [raw.get("date", "") for raw in raw_transactions]
+    descriptions = [raw.get("description", "") for raw in raw_transactions]
+    amount_values = [float(raw.get("amount", 0.0)) for raw in raw_transactions]
+    amounts = np.array(amount_values, dtype=np.float64)
+
+    # Categorize each distinct description once, in first-seen order
+    distinct: Dict[str, int] = {}
+    row_distinct = np.fromiter(
+        (distinct.setdefault(d, len(distinct)) for d in descriptions),
+        dtype=np.intp,
+        count=len(descriptions),
+    )
+    matcher = get_category_matcher()
+    results = [categorize(d, matcher) for d in distinct]
+    category_codes = np.array([batch.categories.code(c) for c, _ in results], dtype=np.int64)
+    base = np.array([b for _, b in results], dtype=np.float64)[row_distinct]
+    other = np.array([c == "Other" for c, _ in results], dtype=bool)[row_distinct]
+
+    income = amounts > 0
+    # Register directions in first-seen order, as row-by-row appends would
+    first_income = bool(income[0])
+    for is_income in (first_income, not first_income):
+        if (income == is_income).any():
+            batch.directions.code("income" if is_income else "expense")
+    direction_codes = np.where(
+        income,
+        batch.directions._index.get("income", 0),
+        batch.directions._index.get("expense", 0),
+    )
+
+    sha256 = hashlib.sha256
+    batch.ids.extend(
+        [
+            sha256(f"{d}|{s}|{a}".encode("utf-8")).hexdigest()[:16]
+            for d, s, a in zip(dates, descriptions, amount_values)
+        ]
+    )
+    batch.dates.extend(_intern(dates))
+    batch.descriptions.extend(_intern(descriptions))
+    batch.amounts.frombytes(amounts.tobytes())
+    _extend_codes(batch.directions, direction_codes)
+    _extend_codes(batch.categories, category_codes[row_distinct])
+    _extend_codes(
+        batch.subcategories, np.full(len(amounts), batch.subcategories.code(None))
+    )
+    batch.confidences.frombytes(confidences(other, base, amounts).astype(np.float64).tobytes())
+    return batch
@@ -1,13 +1,22 @@
-import re
-from .patterns import SENSITIVE_PATTERNS
+from typing import Iterable, List
+
+from .redactor import default_engine
 
 def assert_safe_for_processing(data: str) -> bool:
     """
     Quick check that the supplied string does NOT contain any unredacted
     sensitive patterns. Returns True if safe, False otherwise.
     No exceptions are raised – callers can decide how to handle a False result.
+    Uses the linear-time redaction engine and stops at the first match.
+    """
+    return not default_engine.contains(data)
+
+
+def find_unsafe(items: Iterable[str]) -> List[int]:
+    """
+    Batch form of `assert_safe_for_processing`: return the indices (in
+    order) of the items that are NOT safe. An empty list means every item
+    passed. The items are checked in one combined scan that moves on to
+    the next item at the first hit.
     """
-    for pattern in SENSITIVE_PATTERNS.values():
-        if re.search(pattern, data):
-            return False
-    return True
+    return default_engine.offending_indices(items)
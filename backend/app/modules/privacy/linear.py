@@ -0,0 +1,91 @@
+"""
+Linear-time matching for the stock email pattern.
+
+`\\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\\.[A-Z]{2,}\\b` (case-insensitive) is
+quadratic under a backtracking engine: every word boundary inside a long
+run such as "a.a.a.a..." restarts an O(n) scan for the "@". EmailScanner
+finds exactly the same matches by anchoring on each "@" instead: the
+local part is walked leftwards once, the domain rightwards once, so every
+character is visited a bounded number of times.
+"""
+
+import bisect
+import string
+from typing import List, Optional, Tuple
+
+# Non-ASCII characters that `(?i:[A-Z])` also matches (they case-fold into
+# ASCII letters): İ, ı, ſ and the Kelvin sign
+_FOLDED = "İıſK"
+_LETTERS = frozenset(string.ascii_letters + _FOLDED)
+_LOCAL = frozenset(string.ascii_letters + string.digits + "._%+-" + _FOLDED)
+_DOMAIN = frozenset(string.ascii_letters + string.digits + ".-" + _FOLDED)
+
+
+def _is_word(ch: str) -> bool:
+    """Python `re`'s \\w for str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+class EmailScanner:
+    """
+    Yields email matches of one text in increasing start order, as
+    `next_match(pos)` queries with non-decreasing `pos` arrive. Every
+    boundary inside an address's local part is a valid start with the same
+    end, as with the regex.
+    """
+
+    def __init__(self, text: str, start: int = 0):
+        self.text = text
+        self._search_from = start
+        self._starts: List[int] = []
+        self._end = -1
+
+    def _domain_end(self, at: int) -> int:
+        """End of the domain + TLD following the "@" at `at`, or -1."""
+        text, n = self.text, len(self.text)
+        domain_start = at + 1
+        run_end = domain_start
+        while run_end < n and text[run_end] in _DOMAIN:
+            run_end += 1
+        # The greedy domain backtracks to the rightmost "." that is followed
+        # by 2+ letters ending on a word boundary
+        letters = 0
+        for i in range(run_end - 1, domain_start, -1):
+            ch = text[i]
+            if ch == "." and letters >= 2:
+                after = i + 1 + letters
+                if after >= n or not _is_word(text[after]):
+                    return after
+            letters = letters + 1 if ch in _LETTERS else 0
+        return -1
+
+    def _local_starts(self, at: int) -> List[int]:
+        """Word-boundary positions of the local-part run ending at `at`."""
+        text = self.text
+        start = at
+        while start > 0 and text[start - 1] in _LOCAL:
+            start -= 1
+        starts = []
+        previous = _is_word(text[start - 1]) if start > 0 else False
+        for i in range(start, at):
+            current = _is_word(text[i])
+            if current != previous:
+                starts.append(i)
+            previous = current
+        return starts
+
+    def next_match(self, pos: int) -> Optional[Tuple[int, int]]:
+        """Return (start, end) of the first email starting at or after `pos`."""
+        while True:
+            if self._starts and self._starts[-1] >= pos:
+                index = bisect.bisect_left(self._starts, pos)
+                return self._starts[index], self._end
+            at = self.text.find("@", max(self._search_from, pos))
+            if at < 0:
+                self._starts = []
+                self._search_from = len(self.text)
+                return None
+            self._search_from = at + 1
+            end = self._domain_end(at)
+            self._starts = self._local_starts(at) if end >= 0 else []
+            self._end = end
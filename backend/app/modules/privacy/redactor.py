@@ -1,6 +1,301 @@
+import bisect
 import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .linear import EmailScanner
 from .patterns import SENSITIVE_PATTERNS
 
+# Pattern types matched case-insensitively
+CASE_INSENSITIVE = {"email"}
+
+# Necessary-condition lookaheads tried before the stock SENSITIVE_PATTERNS
+# entry of a type. They never change what matches, but let the scanner
+# reject most positions in linear time instead of backtracking through the
+# full pattern.
+PREFILTERS = {
+    "card_number": r"(?=(?:\d[ -]*+){13})",  # at least 13 digits ahead
+    "email": r"(?=(?i:[A-Z0-9._%+-]*+@))",   # an @ after the local part
+}
+
+# Stock types matched by a dedicated linear-time scanner instead of the
+# regex (see privacy.linear). The remaining stock patterns are linear under
+# `re` as they are: account, BSB and IBAN match a bounded number of
+# characters per start, and the card pattern walks at most 19 digits (plus
+# the separators between them) from each start, so each separator run is
+# visited by at most 19 starts.
+LINEAR_SCANNERS = {"email": EmailScanner}
+
+# Items checked by `offending_indices` are scanned as one text, this many at
+# a time, joined by a separator that no pattern can match across
+BATCH_SIZE = 4096
+BATCH_SEPARATOR = "\n"
+
+# Characters of look-ahead kept between streamed chunks; a match is only
+# committed once this much text follows it, so any match shorter than the
+# overlap is found exactly as in a one-shot scan
+DEFAULT_STREAM_OVERLAP = 1024
+
+
+@dataclass(frozen=True)
+class RedactionSpan:
+    """A redacted region of the original text: [start, end) and its type."""
+    start: int
+    end: int
+    type: str
+
+
+class RedactionEngine:
+    """
+    Precompiled single-pass redactor.
+
+    All patterns are combined into one alternation with a named group per
+    type, so a document is scanned once and rebuilt with a single join.
+    Where matches overlap, the leftmost wins; at the same position the
+    type listed first in `patterns` wins.
+
+    With `linear=True` (the default) stock types listed in LINEAR_SCANNERS
+    are matched by their scanner rather than the regex and merged into the
+    same leftmost-first order, so matching time is linear in the input.
+    `linear=False` keeps everything in the regex (the reference behaviour).
+    """
+
+    def __init__(self, patterns: Optional[Dict[str, str]] = None, linear: bool = True):
+        patterns = SENSITIVE_PATTERNS if patterns is None else patterns
+        self.types: Tuple[str, ...] = tuple(patterns)
+        self.tokens = {name: f"[REDACTED_{name.upper()}]" for name in patterns}
+        self._priority = {name: index for index, name in enumerate(patterns)}
+        self._scanners = {
+            name: LINEAR_SCANNERS[name]
+            for name, pattern in patterns.items()
+            if linear and name in LINEAR_SCANNERS and pattern == SENSITIVE_PATTERNS.get(name)
+        }
+        regex_patterns = {
+            name: pattern for name, pattern in patterns.items() if name not in self._scanners
+        }
+        self.regex = re.compile(self._combine(regex_patterns)) if regex_patterns else None
+
+    @staticmethod
+    def _combine(patterns: Dict[str, str]) -> str:
+        # A shared leading word boundary is hoisted out of the alternation,
+        # so positions inside words are rejected by a single check
+        bounded = all(pattern.startswith(r"\b") for pattern in patterns.values())
+        shared = r"\b" if patterns and bounded else ""
+        branches = []
+        for name, pattern in patterns.items():
+            body = pattern[len(shared):]
+            if name in CASE_INSENSITIVE:
+                body = f"(?i:{body})"
+            prefilter = PREFILTERS.get(name, "") if pattern == SENSITIVE_PATTERNS.get(name) else ""
+            branches.append(f"{prefilter}(?P<{name}>{body})")
+        return f"{shared}(?:{'|'.join(branches)})"
+
+    def ordered_types(self, found: Iterable[str]) -> List[str]:
+        """Return the distinct types in `found`, in pattern order."""
+        found = set(found)
+        return [name for name in self.types if name in found]
+
+    def iter_matches(self, text: str, pos: int = 0) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield non-overlapping (start, end, type) matches from `pos` onwards,
+        leftmost first, exactly as a single combined alternation would.
+        """
+        cursor = _MatchCursor(self, text, pos)
+        while True:
+            found = cursor.first(pos)
+            if found is None:
+                return
+            yield found
+            pos = found[1]
+
+    def contains(self, text: str) -> bool:
+        """True if `text` holds any sensitive match (stops at the first)."""
+        return next(self.iter_matches(text), None) is not None
+
+    def offending_indices(self, items: Iterable[str], batch_size: int = BATCH_SIZE) -> List[int]:
+        """
+        Return the indices of the items holding any sensitive match.
+
+        Items are joined with BATCH_SEPARATOR, up to `batch_size` at a time,
+        and scanned by one cursor: after the first hit in an item the scan
+        jumps straight to the next item, so each item is read at most once.
+        No pattern matches across the separator and it is a word boundary
+        like the ends of a string, so the result equals calling `contains`
+        on every item. None is treated as an empty string.
+        """
+        offending: List[int] = []
+        batch: List[str] = []
+        base = 0
+        for item in items:
+            batch.append(item or "")
+            if len(batch) >= batch_size:
+                offending.extend(base + i for i in self._offending_in_batch(batch))
+                base += len(batch)
+                batch = []
+        if batch:
+            offending.extend(base + i for i in self._offending_in_batch(batch))
+        return offending
+
+    def _offending_in_batch(self, batch: List[str]) -> List[int]:
+        text = BATCH_SEPARATOR.join(batch)
+        starts = []
+        offset = 0
+        for item in batch:
+            starts.append(offset)
+            offset += len(item) + len(BATCH_SEPARATOR)
+        cursor = _MatchCursor(self, text)
+        offending: List[int] = []
+        pos = 0
+        while True:
+            found = cursor.first(pos)
+            if found is None:
+                return offending
+            index = bisect.bisect_right(starts, found[0]) - 1
+            offending.append(index)
+            if index + 1 == len(starts):
+                return offending
+            pos = starts[index + 1]
+
+    def scan(self, text: str) -> List[RedactionSpan]:
+        """Return every region that would be redacted, in text order."""
+        return [RedactionSpan(start, end, name) for start, end, name in self.iter_matches(text)]
+
+    def redact_with_spans(self, text: str) -> Tuple[str, List[str], List[RedactionSpan]]:
+        """
+        Redact `text` in one scan.
+        Returns (redacted_text, applied_types, spans); span offsets refer
+        to the original text.
+        """
+        pieces: List[str] = []
+        spans: List[RedactionSpan] = []
+        last = 0
+        for start, end, name in self.iter_matches(text):
+            pieces.append(text[last:start])
+            pieces.append(self.tokens[name])
+            spans.append(RedactionSpan(start, end, name))
+            last = end
+        if not spans:
+            return text, [], []
+        pieces.append(text[last:])
+        return "".join(pieces), self.ordered_types(s.type for s in spans), spans
+
+    def redact(self, text: str) -> Tuple[str, List[str]]:
+        """Redact `text`; returns (redacted_text, applied_types)."""
+        redacted, applied, _ = self.redact_with_spans(text)
+        return redacted, applied
+
+    def redact_stream(
+        self,
+        chunks: Iterable[str],
+        overlap: int = DEFAULT_STREAM_OVERLAP,
+    ) -> "StreamRedaction":
+        """
+        Redact an iterable of text chunks without joining them. Iterate the
+        returned StreamRedaction for the redacted pieces; its `spans` and
+        `types` are complete once iteration has finished.
+        """
+        return StreamRedaction(self, chunks, overlap)
+
+
+class _MatchCursor:
+    """
+    Leftmost-match lookups over one text for non-decreasing positions.
+    The pending regex match and each linear scanner are kept between
+    calls, so a run of lookups reads the text once.
+    """
+
+    def __init__(self, engine: RedactionEngine, text: str, pos: int = 0):
+        self.engine = engine
+        self.text = text
+        self.scanners = [(name, scanner(text, pos)) for name, scanner in engine._scanners.items()]
+        regex = engine.regex
+        self.match = regex.search(text, pos) if regex is not None else None
+
+    def first(self, pos: int) -> Optional[Tuple[int, int, str]]:
+        """Return (start, end, type) of the leftmost match starting at or after `pos`."""
+        priority = self.engine._priority
+        match = self.match
+        if match is not None and match.start() < pos:
+            match = self.match = self.engine.regex.search(self.text, pos)
+        best = None
+        if match is not None:
+            name = match.lastgroup
+            best = (match.start(), priority[name], match.end(), name)
+        for name, scanner in self.scanners:
+            found = scanner.next_match(pos)
+            if found is not None:
+                candidate = (found[0], priority[name], found[1], name)
+                if best is None or candidate < best:
+                    best = candidate
+        if best is None:
+            return None
+        start, _, end, name = best
+        return start, end, name
+
+
+class StreamRedaction:
+    """
+    Incremental redaction of chunked input.
+
+    Only the unemitted tail of the input (at most one chunk plus `overlap`
+    characters) is held at a time. The concatenated output equals
+    `engine.redact(...)` on the joined input for every match no longer
+    than `overlap`; longer matches may be split at a chunk boundary.
+    """
+
+    def __init__(self, engine: RedactionEngine, chunks: Iterable[str], overlap: int):
+        self.engine = engine
+        self.chunks = chunks
+        self.overlap = overlap
+        self.spans: List[RedactionSpan] = []
+
+    @property
+    def types(self) -> List[str]:
+        return self.engine.ordered_types(s.type for s in self.spans)
+
+    def _emit(self, buffer: str, pos: int, limit: Optional[int], base: int) -> Tuple[str, int]:
+        """
+        Redact buffer[pos:] up to `limit` (None = end of input). Returns the
+        output text and the buffer position up to which input is consumed.
+        """
+        pieces: List[str] = []
+        cut = len(buffer) if limit is None else limit
+        for start, end, name in self.engine.iter_matches(buffer, pos):
+            if limit is not None and end > limit:
+                cut = min(start, limit)
+                break
+            pieces.append(buffer[pos:start])
+            pieces.append(self.engine.tokens[name])
+            self.spans.append(RedactionSpan(base + start, base + end, name))
+            pos = end
+        cut = max(cut, pos)
+        pieces.append(buffer[pos:cut])
+        return "".join(pieces), cut
+
+    def __iter__(self) -> Iterator[str]:
+        buffer = ""
+        base = 0  # offset of buffer[0] in the whole input
+        pos = 0   # first buffer position not yet emitted
+        for chunk in self.chunks:
+            buffer += chunk
+            limit = len(buffer) - self.overlap
+            if limit <= pos:
+                continue
+            out, pos = self._emit(buffer, pos, limit, base)
+            # Keep one character before `pos` so word boundaries still see it
+            keep = max(pos - 1, 0)
+            buffer, base, pos = buffer[keep:], base + keep, pos - keep
+            if out:
+                yield out
+        out, _ = self._emit(buffer, pos, None, base)
+        if out:
+            yield out
+
+
+# Process-wide engine over SENSITIVE_PATTERNS
+default_engine = RedactionEngine()
+
+
 def redact_text(text: str) -> tuple[str, list[str]]:
     """
     Scan the input text for known sensitive patterns and replace them with
@@ -8,17 +303,4 @@ def redact_text(text: str) -> tuple[str, list[str]]:
 
     Example token: [REDACTED_ACCOUNT], [REDACTED_CARD], etc.
     """
-    applied = []
-    redacted = text
-
-    for name, pattern in SENSITIVE_PATTERNS.items():
-        # Compile with case‑insensitive flag where appropriate
-        flags = re.IGNORECASE if name == "email" else 0
-        regex = re.compile(pattern, flags)
-
-        if regex.search(redacted):
-            token = f"[REDACTED_{name.upper()}]"
-            redacted = regex.sub(token, redacted)
-            applied.append(name)
-
-    return redacted, applied
+    return default_engine.redact(text)
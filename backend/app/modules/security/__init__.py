@@ -1,4 +1,5 @@
 from .config import SecurityConfig
 from .utils import validate_upload, schedule_auto_delete
+from .upload import UploadSink, UploadTooLarge
 
-__all__ = ["SecurityConfig", "validate_upload", "schedule_auto_delete"]
+__all__ = ["SecurityConfig", "validate_upload", "schedule_auto_delete", "UploadSink", "UploadTooLarge"]
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 class SecurityConfig:
     # Maximum allowed upload size in bytes (5 MiB)
     MAX_UPLOAD_SIZE = 5 * 1024 * 1024
@@ -7,3 +10,9 @@ class SecurityConfig:
 
     # Auto‑delete delay in seconds (1 hour)
     AUTO_DELETE_DELAY = 60 * 60
+
+    # Expired temp files deleted per retention sweep batch
+    RETENTION_SWEEP_BATCH = 500
+
+    # Directory for uploads awaiting asynchronous processing
+    UPLOAD_DIR = os.getenv("UPLOAD_DIR", tempfile.gettempdir())
@@ -0,0 +1,80 @@
+import hashlib
+import os
+import tempfile
+from typing import BinaryIO, Optional
+
+from .config import SecurityConfig
+
+# Every PDF starts with this marker, within the first KiB of the file
+PDF_MAGIC = b"%PDF-"
+MAGIC_WINDOW = 1024
+
+
+class UploadTooLarge(ValueError):
+    """Raised as soon as an upload crosses SecurityConfig.MAX_UPLOAD_SIZE."""
+
+
+class UploadSink:
+    """
+    Receives an upload chunk by chunk and writes it straight to a private
+    temp file under SecurityConfig.UPLOAD_DIR, so memory use is constant
+    whatever the file size. While streaming it:
+    - enforces the size limit (raises UploadTooLarge the moment it is crossed),
+    - computes the SHA-256 of the content,
+    - sniffs the PDF magic bytes (raises ValueError if they are missing).
+    The caller owns the file: `finish()` hands it over, `discard()` deletes it.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, directory: Optional[str] = None):
+        self.max_size = max_size if max_size is not None else SecurityConfig.MAX_UPLOAD_SIZE
+        fd, self.path = tempfile.mkstemp(
+            suffix=".pdf", dir=directory or SecurityConfig.UPLOAD_DIR
+        )
+        self._file: BinaryIO = os.fdopen(fd, "w+b")
+        self._digest = hashlib.sha256()
+        self._head = b""
+        self.size = 0
+        self.is_pdf = False
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            raise UploadTooLarge(
+                f"File exceeds maximum size of {self.max_size} bytes"
+            )
+        if not self.is_pdf:
+            self._head += chunk[: MAGIC_WINDOW - len(self._head)]
+            if PDF_MAGIC in self._head:
+                self.is_pdf = True
+                self._head = b""
+            elif len(self._head) >= MAGIC_WINDOW:
+                raise ValueError("Upload is not a PDF document")
+        self._digest.update(chunk)
+        self._file.write(chunk)
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    def finish(self) -> BinaryIO:
+        """
+        Validate the completed upload and return the open file, rewound,
+        ready to be handed to pdfplumber without another copy.
+        """
+        if not self.is_pdf:
+            raise ValueError("Upload is not a PDF document")
+        self._file.flush()
+        self._file.seek(0)
+        return self._file
+
+    def close(self) -> None:
+        """Close the file handle, keeping the file on disk."""
+        self._file.close()
+
+    def discard(self) -> None:
+        """Close and delete the temp file."""
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -1,6 +1,4 @@
-import os
 import mimetypes
-import asyncio
 from datetime import datetime, timezone
 from .config import SecurityConfig
 
@@ -19,11 +17,11 @@ def validate_upload(file_path: str, file_size: int, mime_type: str) -> None:
 
 async def schedule_auto_delete(file_path: str) -> None:
     """
-    Asynchronously delete the file after AUTO_DELETE_DELAY seconds.
-    Deterministic – simply sleeps then removes the file.
+    Schedule deletion of the file AUTO_DELETE_DELAY seconds from now.
+    Returns once the deadline is persisted; the application-wide retention
+    sweeper removes the file, also after a restart.
     """
-    await asyncio.sleep(SecurityConfig.AUTO_DELETE_DELAY)
-    try:
-        os.remove(file_path)
-    except FileNotFoundError:
-        pass  # Already removed, safe to ignore
+    # Imported here: the sweeper lives in the service layer, above this module
+    from backend.app.services.retention_sweeper import retention_sweeper
+
+    await retention_sweeper.schedule(file_path)
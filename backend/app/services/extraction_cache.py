@@ -0,0 +1,92 @@
+"""
+Content-addressed cache for the expensive front half of the PDF pipeline.
+
+Entries are keyed by the SHA-256 of the uploaded file plus the pipeline
+version, so re-uploading the same statement skips pdfplumber, redaction
+and parsing. Only post-redaction, normalised transactions are stored –
+never the raw PDF or its extracted text (see RETENTION_POLICY).
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple
+
+from backend.app.core.lru import BoundedLRU
+from backend.app.modules.normalize.batch import TransactionBatch
+from backend.app.modules.normalize.schema import NormalizedTransaction
+
+_READ_CHUNK = 1024 * 1024
+
+
+def cache_key_for_digest(sha256_hex: str, pipeline_version: str) -> str:
+    """Return the cache key for a document whose SHA-256 is already known."""
+    return f"{sha256_hex}:{pipeline_version}"
+
+
+def file_sha256(file_path: str) -> str:
+    """
+    Return the hex SHA-256 of a file's bytes, read in chunks.
+    Raises OSError if the file cannot be read.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_READ_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def document_fingerprint(file_path: str, pipeline_version: str) -> str:
+    """
+    Return the cache key for a document: SHA-256 of its bytes suffixed
+    with the pipeline version that produced the entry.
+    Raises OSError if the file cannot be read.
+    """
+    return cache_key_for_digest(file_sha256(file_path), pipeline_version)
+
+
+@dataclass(frozen=True)
+class CachedExtraction:
+    """
+    Redacted, normalised parse output of one document. The pipeline stores
+    a TransactionBatch; any sequence of NormalizedTransaction is accepted.
+    """
+    redactions: Tuple[str, ...]
+    transactions: Sequence[NormalizedTransaction]
+
+    def approx_size(self) -> int:
+        """Rough in-memory footprint in bytes, used for size-based eviction."""
+        batch = self.transactions
+        if isinstance(batch, TransactionBatch):
+            return 64 + 96 * len(batch) + sum(
+                sum(map(len, column))
+                for column in (batch.ids, batch.dates, batch.descriptions, batch.categories)
+            )
+        return 64 + sum(
+            96 + len(t.id) + len(t.date) + len(t.description) + len(t.category)
+            for t in self.transactions
+        )
+
+
+class ExtractionCache(BoundedLRU[CachedExtraction]):
+    """
+    LRU cache of CachedExtraction bounded by both entry count and
+    approximate size in bytes.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        super().__init__(max_entries, max_size=max_bytes)
+
+    def put(self, key: str, value: CachedExtraction) -> None:
+        """Store an entry; one larger than the byte bound is not cached."""
+        super().put(key, value, value.approx_size())
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            size = self._size
+        stats = super().stats()
+        stats["bytes"] = size
+        return stats
+
+
+# Process-wide instance for callers that want caching across requests
+default_cache = ExtractionCache()
@@ -0,0 +1,291 @@
+"""
+Asynchronous ingestion queue.
+
+Uploads are recorded as an IngestJob row and a Document with status
+"queued"; the upload request returns immediately. Worker tasks on the
+event loop claim jobs and run the CPU-heavy `process_pdf` in an executor
+(a process pool by default), then persist the result. Document.status
+moves queued → processing → processed | failed.
+
+A job is claimed with one conditional UPDATE (queued → processing), so
+two workers – in this process or another one sharing the database – never
+run it together, and the result is only written while the claim still
+holds. A running job refreshes its heartbeat; at start-up and every
+`stale_after` seconds, processing jobs whose heartbeat has stopped (their
+process died) are requeued, and queued jobs are picked up. A job that
+fails unexpectedly (e.g. while persisting) is logged and re-queued while
+attempts remain, then failed.
+
+The extraction cache lives in this (parent) process: a document whose
+content hash (Document.content_sha256, computed as the upload streamed
+in) is already cached is persisted without dispatching to the pool, and
+results computed by the pool are added to the cache.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+from datetime import datetime, timedelta
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.app.db.repositories.document_repo import get_document, set_document_status
+from backend.app.db.repositories.job_repo import (
+    claim_job,
+    get_job,
+    heartbeat_job,
+    list_queued_jobs,
+    release_job,
+    requeue_stale_jobs,
+)
+from backend.app.db.repositories.summary_repo import add_documents_to_summaries
+from backend.app.db.repositories.transaction_repo import bulk_create_transactions
+from backend.app.db.session import get_async_sessionmaker
+from backend.app.services.extraction_cache import ExtractionCache, default_cache
+from backend.app.services.pipeline import lookup_cached, process_pdf, store_cached
+
+logger = logging.getLogger(__name__)
+
+
+class IngestQueue:
+    """
+    In-process job runner backed by the `ingest_job` table.
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        executor: Optional[Executor] = None,
+        concurrency: int = 2,
+        max_attempts: int = 3,
+        cache: Optional[ExtractionCache] = None,
+        stale_after: float = 600.0,
+    ):
+        self._session_factory = session_factory
+        self.cache = cache
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.stale_after = stale_after
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._watcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def session_factory(self):
+        return self._session_factory or get_async_sessionmaker()
+
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._workers and self._loop is loop:
+            return
+        self._loop = loop
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.concurrency)
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+        ]
+
+    async def start(self) -> int:
+        """
+        Start the worker tasks and re-enqueue unfinished jobs (queued, or
+        processing with a stale heartbeat), then keep doing so every
+        `stale_after` seconds. Returns the number of jobs enqueued at
+        start-up (0 if the job table is unavailable).
+        """
+        self._ensure_workers()
+        if self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch_stale())
+        return await self._resume()
+
+    async def _resume(self) -> int:
+        stale_before = datetime.utcnow() - timedelta(seconds=self.stale_after)
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    await requeue_stale_jobs(session, stale_before)
+                    jobs = await list_queued_jobs(session)
+        except SQLAlchemyError:
+            return 0
+        # A job enqueued twice is harmless: only one claim on it succeeds
+        for job in jobs:
+            self._queue.put_nowait(job.id)
+        return len(jobs)
+
+    async def _watch_stale(self) -> None:
+        while True:
+            await asyncio.sleep(self.stale_after)
+            await self._resume()
+
+    async def stop(self) -> None:
+        """Cancel the workers; unfinished jobs stay in the table for resume."""
+        tasks = self._workers + ([self._watcher] if self._watcher is not None else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._watcher = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def submit(self, job_id: str) -> None:
+        """Hand a committed job to the workers (starting them if needed)."""
+        self._ensure_workers()
+        self._queue.put_nowait(job_id)
+
+    async def join(self) -> None:
+        """Wait until every submitted job has been handled."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self.run_job(job_id)
+            except Exception:
+                # The claim itself failed; the job stays queued for resume
+                logger.exception("Could not claim ingest job %s", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _retry_or_fail(self, job_id: str, claimed_at: datetime, error: str) -> None:
+        """
+        After an unexpected error in a claimed job: put it (and its
+        document) back to queued while attempts remain, otherwise fail it.
+        """
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    job = await get_job(session, job_id)
+                    retry = job.attempts < self.max_attempts
+                    status = "queued" if retry else "failed"
+                    if not await release_job(session, job_id, claimed_at, status, error):
+                        return
+                    await set_document_status(session, job.document_id, status)
+                    file_path = job.file_path
+        except Exception:
+            # Left processing in the table; requeued once its heartbeat is stale
+            logger.exception("Could not record the failure of ingest job %s", job_id)
+            return
+        if retry:
+            self.submit(job_id)
+        else:
+            _remove(file_path)
+
+    async def _fail(self, job_id: str, claimed_at: datetime, document_id: str, error: str) -> bool:
+        async with self.session_factory() as session:
+            async with session.begin():
+                if not await release_job(session, job_id, claimed_at, "failed", error):
+                    return False
+                await set_document_status(session, document_id, "failed")
+        return True
+
+    async def _heartbeat(self, job_id: str, claimed_at: datetime) -> None:
+        while True:
+            await asyncio.sleep(self.stale_after / 3)
+            try:
+                async with self.session_factory() as session:
+                    async with session.begin():
+                        await heartbeat_job(session, job_id, claimed_at)
+            except SQLAlchemyError:
+                logger.exception("Could not refresh the heartbeat of ingest job %s", job_id)
+
+    async def run_job(self, job_id: str) -> None:
+        """
+        Process one job end to end. Returns at once if the job is not
+        queued, e.g. because another worker has already claimed it.
+        """
+        async with self.session_factory() as session:
+            async with session.begin():
+                claimed_at = await claim_job(session, job_id)
+                if claimed_at is None:
+                    return
+                job = await get_job(session, job_id)
+                exhausted = job.attempts > self.max_attempts
+                if not exhausted:
+                    await set_document_status(session, job.document_id, "processing")
+                file_path, family_id, document_id = job.file_path, job.family_id, job.document_id
+                document = await get_document(session, family_id, document_id)
+                content_sha256 = document.content_sha256 if document is not None else None
+
+        if exhausted:
+            if await self._fail(job_id, claimed_at, document_id, "retry limit reached"):
+                _remove(file_path)
+            return
+        try:
+            await self._process(
+                job_id, claimed_at, file_path, family_id, document_id, content_sha256
+            )
+        except Exception as exc:
+            logger.exception("Ingest job %s failed", job_id)
+            await self._retry_or_fail(job_id, claimed_at, type(exc).__name__)
+
+    async def _process(
+        self,
+        job_id: str,
+        claimed_at: datetime,
+        file_path: str,
+        family_id: str,
+        document_id: str,
+        content_sha256: Optional[str],
+    ) -> None:
+        if not os.path.exists(file_path):
+            await self._fail(job_id, claimed_at, document_id, "upload no longer available")
+            return
+
+        cacheable = self.cache is not None and content_sha256 is not None
+        result = lookup_cached(self.cache, content_sha256, columnar=True) if cacheable else None
+        if result is None:
+            loop = asyncio.get_running_loop()
+            heartbeat = asyncio.create_task(self._heartbeat(job_id, claimed_at))
+            try:
+                # Columnar result: one TransactionBatch to pickle back, not a dict per row
+                result = await loop.run_in_executor(
+                    self._executor, functools.partial(process_pdf, file_path, columnar=True)
+                )
+            except Exception as exc:
+                # Only the exception type is recorded – messages may echo document content
+                if await self._fail(job_id, claimed_at, document_id, type(exc).__name__):
+                    _remove(file_path)
+                return
+            finally:
+                heartbeat.cancel()
+            if cacheable:
+                store_cached(self.cache, content_sha256, result)
+
+        async with self.session_factory() as session:
+            async with session.begin():
+                # Rolled back with the inserts below if they fail
+                if not await release_job(session, job_id, claimed_at, "done"):
+                    logger.warning("Ingest job %s was reclaimed; discarding this run", job_id)
+                    return
+                await bulk_create_transactions(
+                    session, document_id, family_id, result["transactions_normalized"]
+                )
+                # Adds this document's totals to the months it covers
+                await add_documents_to_summaries(session, family_id, [document_id])
+                await set_document_status(session, document_id, "processed")
+        _remove(file_path)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# Application-wide queue, started and stopped by the FastAPI lifespan
+ingest_queue = IngestQueue(cache=default_cache)
@@ -2,7 +2,7 @@
 Pure pipeline orchestrator – code‑only, no side effects.
 
 The function stitches together the existing pure‑function modules:
-- PDF ingestion (extract_text_from_pdf)
+- PDF ingestion (extract_text_from_pdf), or CSV/OFX exports (process_document)
 - Privacy redaction & sanitisation
 - Dynamic parser selection (registry)
 - Normalisation
@@ -13,24 +13,46 @@ All operations are pure and return data structures; no DB writes,
 no external calls, and no exceptions are raised for unknown inputs.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Ingest
-from backend.app.modules.ingest.pdf_reader import extract_text_from_pdf
+from backend.app.modules.ingest.pdf_reader import (
+    PageScreenStats,
+    PdfSource,
+    extract_text_from_pdf,
+    iter_pdf_pages,
+)
 from backend.app.modules.ingest import registry
+from backend.app.modules.ingest.base import BaseDocumentParser
+from backend.app.modules.ingest.config import IngestConfig
+from backend.app.modules.ingest.layout import extract_table_transactions
 
 # Privacy
+from backend.app.modules.privacy.patterns import SENSITIVE_PATTERNS
 from backend.app.modules.privacy.redactor import redact_text
 from backend.app.modules.privacy.sanitizer import sanitize_transactions
 
 # Normalisation
-from backend.app.modules.normalize.normalizer import normalize_transactions
+from backend.app.modules.normalize.batch import TransactionBatch
+from backend.app.modules.normalize.normalizer import normalize_batch
 
 # Budget
 from backend.app.modules.budget.aggregator import aggregate_by_month
 from backend.app.modules.budget.analyzer import analyze_budget
 from dataclasses import asdict
 
+# Caching
+from backend.app.services.extraction_cache import (
+    CachedExtraction,
+    ExtractionCache,
+    cache_key_for_digest,
+    document_fingerprint,
+)
+
+# Bump whenever a change to redaction, parsing or normalisation would alter
+# the output for the same input file; invalidates ExtractionCache entries.
+PIPELINE_VERSION = "1"
+
 # Goals (optional – placeholder calls if implementations exist)
 try:
     from backend.app.modules.goals.projection import project_time_to_goal
@@ -73,42 +95,163 @@ def _goal_from_dict(goal: dict) -> Optional[SavingsGoal]:
         return None
 
 
-def process_pdf(
-    file_path: str,
-    family_id: Optional[str] = None,
-    goal: Optional[Dict] = None,
-) -> Dict:
+def _stream_pages(
+    pages: Iterable[str],
+) -> Tuple[TransactionBatch, List[str]]:
     """
-    Orchestrates the full PDF processing pipeline.
+    Redact, parse and normalise a document one page at a time.
 
-    Parameters
-    ----------
-    file_path: str
-        Path to the PDF file on the local filesystem.
-    family_id: str | None
-        Identifier of the family the document belongs to (currently unused,
-        kept for future DB wiring).
-    goal: dict | None
-        Optional goal definition – if supplied, the pipeline will attempt to
-        run a projection or simulation using the goal module (if available).
+    Only the current page's text is alive at any point once a parser has
+    been selected. Parser selection mirrors `registry.get_parser_for_text`
+    on the whole document: redacted pages are buffered until the document
+    head (IngestConfig.DISPATCH_HEAD_CHARS) is available, and only documents
+    whose head carries no parser signature are buffered to the end.
+    Returns (normalized_transactions, applied_redaction_types) identical to
+    the one-shot path, as no sensitive pattern or parser keyword can span
+    a page break.
+    """
+    normalized = TransactionBatch()
+    applied: set = set()
+    pending: List[str] = []
+    parser: Optional[BaseDocumentParser] = None
+    head_checked = False
 
-    Returns
-    -------
-    dict
-        {
-            "redactions": List[str],
-            "transactions_normalized": List[Dict],
-            "monthly_summary": Dict,
-            "budget_health": Dict,
-            "goal": Dict (optional)
-        }
+    def _consume(page_text: str) -> None:
+        raw = parser.extract(page_text) if parser else []
+        normalize_batch(sanitize_transactions(raw), normalized)
+
+    for page_text in pages:
+        redacted_page, redactions = redact_text(page_text)
+        applied.update(redactions)
+
+        if parser is None:
+            pending.append(redacted_page)
+            if head_checked:
+                continue
+            # The one-shot path strips the document before dispatch
+            buffered_text = "\n".join(pending).lstrip()
+            if len(buffered_text) < IngestConfig.DISPATCH_HEAD_CHARS:
+                continue
+            head_checked = True
+            parser = registry.get_parser_for_head(buffered_text)
+            if parser is None:
+                continue
+            for buffered in pending:
+                _consume(buffered)
+            pending.clear()
+            continue
+
+        _consume(redacted_page)
+
+    if pending:
+        parser = registry.get_parser_for_text("\n".join(pending).strip())
+        for buffered in pending:
+            _consume(buffered)
+
+    ordered = [name for name in SENSITIVE_PATTERNS if name in applied]
+    return normalized, ordered
+
+
+def _extract_normalized(
+    file_path: PdfSource,
+    stream: bool,
+    parallel: bool,
+    prescreen: bool = False,
+    stats: Optional[PageScreenStats] = None,
+) -> Tuple[TransactionBatch, List[str]]:
+    """
+    Run extraction, redaction, parsing, sanitisation and normalisation.
+    Returns (normalized_transactions, applied_redaction_types).
     """
-    raw_text = extract_text_from_pdf(file_path)
+    if stream:
+        return _stream_pages(iter_pdf_pages(file_path, prescreen, stats))
+    raw_text = extract_text_from_pdf(
+        file_path, parallel=parallel, prescreen=prescreen, stats=stats
+    )
     redacted_text, redactions = redact_text(raw_text)
     parser = registry.get_parser_for_text(redacted_text)
     raw_transactions: List[Dict] = parser.extract(redacted_text) if parser else []
     safe_transactions = sanitize_transactions(raw_transactions)
-    normalized_transactions = normalize_transactions(safe_transactions)
+    return normalize_batch(safe_transactions), redactions
+
+
+def _extract_structured(
+    text: str,
+    source_type: str,
+) -> Tuple[TransactionBatch, List[str]]:
+    """
+    Parse a structured (CSV/OFX) export, then redact each description.
+
+    Unlike PDF text, structured exports are parsed before redaction: the
+    raw file carries dates such as OFX DTPOSTED values (20240115120000)
+    that the account and card patterns would otherwise consume. Only the
+    date, description and amount are ever extracted, so identifiers like
+    ACCTID never leave the parser; free-text descriptions are redacted
+    exactly as page text would be.
+    Returns (normalized_transactions, applied_redaction_types).
+    """
+    parser = registry.get_parser_for_text(text.strip(), source_type)
+    raw_transactions: List[Dict] = parser.extract(text) if parser else []
+    return _normalize_fields(raw_transactions)
+
+
+def _normalize_fields(
+    raw_transactions: List[Dict],
+) -> Tuple[TransactionBatch, List[str]]:
+    """
+    Redact the description of each already-parsed transaction, then
+    sanitise and normalise. Used by the paths that extract fields directly
+    (structured exports, PDF tables) rather than parsing redacted text.
+    Returns (normalized_transactions, applied_redaction_types).
+    """
+    applied: set = set()
+    for txn in raw_transactions:
+        txn["description"], redactions = redact_text(txn["description"])
+        applied.update(redactions)
+    safe_transactions = sanitize_transactions(raw_transactions)
+    ordered = [name for name in SENSITIVE_PATTERNS if name in applied]
+    return normalize_batch(safe_transactions), ordered
+
+
+def _extract_layout(
+    file_path: PdfSource,
+    stream: bool,
+    parallel: bool,
+    prescreen: bool = False,
+    stats: Optional[PageScreenStats] = None,
+) -> Tuple[TransactionBatch, List[str]]:
+    """
+    Extract transactions from the PDF's table layout (see
+    `ingest.layout`), redacting only the description cells. Documents
+    without a recognisable table fall back to the text path.
+    """
+    layout_stats = PageScreenStats()
+    try:
+        raw_transactions = extract_table_transactions(
+            file_path, prescreen=prescreen, stats=layout_stats
+        )
+    except Exception:
+        raw_transactions = None
+    if raw_transactions is None:
+        if hasattr(file_path, "seek"):
+            file_path.seek(0)
+        return _extract_normalized(file_path, stream, parallel, prescreen, stats)
+    if stats is not None:
+        stats.merge(layout_stats)
+    return _normalize_fields(raw_transactions)
+
+
+def _assemble_result(
+    normalized_transactions: TransactionBatch,
+    redactions: List[str],
+    goal: Optional[Dict],
+    columnar: bool = False,
+) -> Dict:
+    """
+    Aggregate, analyse and (optionally) project a goal for parsed
+    transactions. With `columnar` the batch itself is returned as
+    "transactions_normalized" instead of a list of dicts.
+    """
     monthly_summary = aggregate_by_month(normalized_transactions)
     latest_summary = _latest_month_summary(monthly_summary)
     budget_health = analyze_budget(latest_summary) if latest_summary else {}
@@ -129,8 +272,212 @@ def process_pdf(
 
     return {
         "redactions": redactions,
-        "transactions_normalized": [asdict(t) for t in normalized_transactions],
+        "transactions_normalized": (
+            normalized_transactions if columnar else normalized_transactions.to_dicts()
+        ),
         "monthly_summary": monthly_summary,
         "budget_health": budget_health,
         **({"goal": goal_result} if goal_result else {}),
     }
+
+
+def _pipeline_version(
+    source_type: str = "pdf", layout: bool = False, prescreen: bool = False
+) -> str:
+    # Options that change the extraction output are part of the cache key
+    return (
+        PIPELINE_VERSION
+        + ("" if source_type == "pdf" else f"-{source_type}")
+        + ("-layout" if layout else "")
+        + ("-prescreen" if prescreen else "")
+    )
+
+
+def extraction_cache_key(
+    content_sha256: str,
+    source_type: str = "pdf",
+    layout: bool = False,
+    prescreen: bool = False,
+) -> str:
+    """Return the ExtractionCache key of a document processed with these options."""
+    return cache_key_for_digest(content_sha256, _pipeline_version(source_type, layout, prescreen))
+
+
+def _cached_batch(cached: CachedExtraction) -> TransactionBatch:
+    # Callers get their own batch, so changing it cannot alter the entry
+    transactions = cached.transactions
+    if isinstance(transactions, TransactionBatch):
+        return transactions.copy()
+    return TransactionBatch.from_transactions(transactions)
+
+
+def _cache_entry(redactions: List[str], batch: TransactionBatch) -> CachedExtraction:
+    # A snapshot: the batch handed back to the caller stays theirs to change
+    return CachedExtraction(tuple(redactions), batch.copy())
+
+
+def lookup_cached(
+    cache: ExtractionCache,
+    content_sha256: str,
+    source_type: str = "pdf",
+    goal: Optional[Dict] = None,
+    columnar: bool = False,
+) -> Optional[Dict]:
+    """
+    Return the `process_document` result of a document already in `cache`
+    (default options), or None on a miss, without reading the file. Lets
+    the process that owns the cache answer a repeat upload before handing
+    work to a pool, whose workers cannot see it.
+    """
+    cached = cache.get(extraction_cache_key(content_sha256, source_type))
+    if cached is None:
+        return None
+    return _assemble_result(_cached_batch(cached), list(cached.redactions), goal, columnar)
+
+
+def store_cached(
+    cache: ExtractionCache,
+    content_sha256: str,
+    result: Dict,
+    source_type: str = "pdf",
+) -> None:
+    """
+    Store a `columnar` result computed elsewhere (e.g. by a pool worker)
+    under the key `lookup_cached` reads.
+    """
+    cache.put(
+        extraction_cache_key(content_sha256, source_type),
+        _cache_entry(result["redactions"], result["transactions_normalized"]),
+    )
+
+
+def process_pdf(
+    file_path: PdfSource,
+    family_id: Optional[str] = None,
+    goal: Optional[Dict] = None,
+    stream: bool = False,
+    parallel: bool = False,
+    cache: Optional[ExtractionCache] = None,
+    content_sha256: Optional[str] = None,
+    layout: bool = False,
+    prescreen: bool = False,
+    columnar: bool = False,
+) -> Dict:
+    """
+    Orchestrates the full PDF processing pipeline.
+
+    Parameters
+    ----------
+    file_path: str | BinaryIO
+        Path to the PDF file on the local filesystem, or an open binary
+        file object (e.g. a streamed upload) handed straight to pdfplumber.
+    family_id: str | None
+        Identifier of the family the document belongs to (currently unused,
+        kept for future DB wiring).
+    goal: dict | None
+        Optional goal definition – if supplied, the pipeline will attempt to
+        run a projection or simulation using the goal module (if available).
+    stream: bool
+        When True, pages are extracted, redacted, parsed and normalised one
+        at a time (see `_stream_pages`) instead of materialising the whole
+        document text first. The result is the same as the one-shot path.
+    parallel: bool
+        When True (and `stream` is False), page text is extracted by a
+        process pool; small documents automatically stay serial.
+    cache: ExtractionCache | None
+        Optional content-addressed cache. A document whose bytes (and the
+        PIPELINE_VERSION) were seen before skips extraction, redaction and
+        parsing entirely.
+    content_sha256: str | None
+        SHA-256 of the document bytes if already known (computed while the
+        upload streamed in); avoids re-reading the file for the cache key
+        and is required to cache file-object sources.
+    layout: bool
+        When True, transactions are read from the statement's table layout
+        using word coordinates, with column maps cached per bank template
+        (see `ingest.layout`). Handles multi-column (debit/credit/balance)
+        statements that text-line parsing gets wrong; documents without a
+        table header fall back to the text path.
+    prescreen: bool
+        When True, each page is classified from its raw content stream
+        first and pages without transactions (T&Cs, marketing, blank
+        pages) are never text-extracted. The result then carries a
+        "page_screen" entry with pages seen/skipped and the time spent.
+    columnar: bool
+        When True, "transactions_normalized" is the TransactionBatch the
+        pipeline built (columns of arrays and encoded strings) rather than
+        one dict per transaction. Much smaller to hold and to pickle back
+        from a worker process; `bulk_create_transactions` accepts either.
+
+    Returns
+    -------
+    dict
+        {
+            "redactions": List[str],
+            "transactions_normalized": List[Dict] (TransactionBatch with `columnar`),
+            "monthly_summary": Dict,
+            "budget_health": Dict,
+            "goal": Dict (optional),
+            "page_screen": Dict (with `prescreen`, unless served from cache)
+        }
+    """
+    cache_key: Optional[str] = None
+    cached: Optional[CachedExtraction] = None
+    version = _pipeline_version(layout=layout, prescreen=prescreen)
+    if cache is not None:
+        try:
+            if content_sha256:
+                cache_key = cache_key_for_digest(content_sha256, version)
+            elif isinstance(file_path, str):
+                cache_key = document_fingerprint(file_path, version)
+            if cache_key is not None:
+                cached = cache.get(cache_key)
+        except OSError:
+            cache_key = None  # unreadable file – let extraction degrade as usual
+
+    stats: Optional[PageScreenStats] = None
+    if cached is not None:
+        normalized_transactions = _cached_batch(cached)
+        redactions = list(cached.redactions)
+    else:
+        stats = PageScreenStats() if prescreen else None
+        extract = _extract_layout if layout else _extract_normalized
+        normalized_transactions, redactions = extract(
+            file_path, stream, parallel, prescreen, stats
+        )
+        if cache_key is not None:
+            cache.put(cache_key, _cache_entry(redactions, normalized_transactions))
+    result = _assemble_result(normalized_transactions, redactions, goal, columnar)
+    if stats is not None:
+        result["page_screen"] = asdict(stats)
+    return result
+
+
+def process_document(
+    file_path: str,
+    family_id: Optional[str] = None,
+    goal: Optional[Dict] = None,
+    columnar: bool = False,
+    **pdf_options,
+) -> Dict:
+    """
+    Run the pipeline on a statement file of any supported format.
+
+    `.csv`, `.ofx` and `.qfx` files skip PDF extraction entirely and are
+    parsed straight from their text; anything else is handed to
+    `process_pdf` together with `pdf_options` (stream, parallel, cache, ...).
+    The result has the same shape as `process_pdf`; an unreadable file
+    yields an empty result rather than raising.
+    """
+    source_type = registry.source_type_for_path(file_path)
+    if source_type == "pdf":
+        return process_pdf(
+            file_path, family_id=family_id, goal=goal, columnar=columnar, **pdf_options
+        )
+    try:
+        with open(file_path, encoding="utf-8-sig", errors="replace", newline="") as fh:
+            text = fh.read()
+    except OSError:
+        text = ""
+    normalized_transactions, redactions = _extract_structured(text, source_type)
+    return _assemble_result(normalized_transactions, redactions, goal, columnar)
@@ -0,0 +1,199 @@
+"""
+Retention sweeper for temporary upload files.
+
+Every deletion deadline is recorded as a RetentionEntry row and held in an
+in-memory min-heap. A single background task sleeps until the earliest
+deadline (or until an earlier one is added), then deletes every expired
+file in batches of SecurityConfig.RETENTION_SWEEP_BATCH and drops their
+rows in one statement per batch. Because deadlines live in the database,
+deletions still pending at shutdown are reloaded at start-up and carried
+out late rather than lost.
+"""
+
+import asyncio
+import heapq
+import os
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.app.db.repositories.retention_repo import (
+    delete_entries,
+    list_pending_deletions,
+    schedule_deletion,
+)
+from backend.app.db.session import get_async_sessionmaker
+from backend.app.modules.security.config import SecurityConfig
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    """Epoch seconds → naive UTC datetime, as stored in the table."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def _to_timestamp(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _remove_files(paths: List[str]) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass  # already removed (e.g. by the ingest queue), safe to ignore
+
+
+class RetentionSweeper:
+    """
+    Single-task deleter of expired temp files backed by the
+    `retention_entry` table. Superseded deadlines of a path stay in the
+    heap and are skipped when they surface.
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        batch_size: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._session_factory = session_factory
+        self.batch_size = batch_size or SecurityConfig.RETENTION_SWEEP_BATCH
+        self._clock = clock
+        self._heap: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.swept = 0
+        self.last_sweep_lag = 0.0
+
+    @property
+    def session_factory(self):
+        return self._session_factory or get_async_sessionmaker()
+
+    async def start(self) -> int:
+        """
+        Start the background task and load the persisted deadlines.
+        Returns the number of reloaded entries (0 if the table is unavailable).
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._loop is not loop or self._task.done():
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        try:
+            async with self.session_factory() as session:
+                entries = await list_pending_deletions(session)
+        except SQLAlchemyError:
+            return 0
+        for entry in entries:
+            self.track(entry.file_path, entry.delete_after)
+        return len(entries)
+
+    async def stop(self) -> None:
+        """Cancel the background task; pending deadlines stay in the table."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def deadline(self, delay: Optional[float] = None) -> datetime:
+        """UTC deadline `delay` seconds from now (default AUTO_DELETE_DELAY)."""
+        delay = SecurityConfig.AUTO_DELETE_DELAY if delay is None else delay
+        return _to_datetime(self._clock() + delay)
+
+    def track(self, file_path: str, delete_after: datetime) -> None:
+        """
+        Hold a deadline that is already persisted (e.g. by the caller's own
+        transaction); wakes the sweeper if it is the new earliest one.
+        """
+        when = _to_timestamp(delete_after)
+        self._deadlines[file_path] = when
+        heapq.heappush(self._heap, (when, file_path))
+        if self._wakeup is not None and self._heap[0] == (when, file_path):
+            self._wakeup.set()
+
+    async def schedule(self, file_path: str, delay: Optional[float] = None) -> datetime:
+        """Persist and track a deletion `delay` seconds from now; returns the deadline."""
+        delete_after = self.deadline(delay)
+        async with self.session_factory() as session:
+            async with session.begin():
+                await schedule_deletion(session, file_path, delete_after)
+        self.track(file_path, delete_after)
+        return delete_after
+
+    def _head(self) -> Optional[Tuple[float, str]]:
+        """Earliest live deadline, dropping superseded heap entries on the way."""
+        heap = self._heap
+        while heap and self._deadlines.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _pop_due(self, now: float) -> List[Tuple[float, str]]:
+        due: List[Tuple[float, str]] = []
+        while len(due) < self.batch_size:
+            head = self._head()
+            if head is None or head[0] > now:
+                break
+            heapq.heappop(self._heap)
+            del self._deadlines[head[1]]
+            due.append(head)
+        return due
+
+    async def sweep(self) -> int:
+        """Delete every expired file, batch by batch; returns how many were handled."""
+        handled = 0
+        while True:
+            now = self._clock()
+            due = self._pop_due(now)
+            if not due:
+                return handled
+            self.last_sweep_lag = now - due[0][0]
+            paths = [path for _, path in due]
+            await asyncio.to_thread(_remove_files, paths)
+            try:
+                async with self.session_factory() as session:
+                    async with session.begin():
+                        await delete_entries(session, paths)
+            except SQLAlchemyError:
+                pass  # the files are gone; leftover rows are swept harmlessly after a restart
+            self.swept += len(paths)
+            handled += len(paths)
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            head = self._head()
+            timeout = None if head is None else head[0] - self._clock()
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                await self.sweep()
+            except Exception:
+                pass  # keep sweeping; undeleted entries are reloaded on restart
+
+    def depth(self) -> int:
+        """Number of files waiting for their deadline (or overdue)."""
+        return len(self._deadlines)
+
+    def lag(self) -> float:
+        """Seconds the earliest pending deadline is overdue (0 if none is)."""
+        head = self._head()
+        return max(self._clock() - head[0], 0.0) if head is not None else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "depth": self.depth(),
+            "lag_seconds": round(self.lag(), 3),
+            "last_sweep_lag_seconds": round(self.last_sweep_lag, 3),
+            "swept": self.swept,
+        }
+
+
+# Application-wide sweeper, started and stopped by the FastAPI lifespan
+retention_sweeper = RetentionSweeper()
@@ -0,0 +1,217 @@
+"""
+Bulk statement import.
+
+Processes every statement (PDF, CSV or OFX/QFX) in a directory with
+`process_document` across a process pool and persists the results for
+one family in a few large transactions: documents and transactions are
+written per batch of files, and each batch's transactions are added to
+the monthly summaries in the same transaction.
+
+Files are hashed first. Content already in the extraction cache is not
+sent to the pool, and files with identical content are processed once.
+
+Usage:
+    python -m backend.app.tools.bulk_import <dir> --family <id> [--workers N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, TextIO, Tuple
+
+from backend.app.db.repositories.document_repo import create_document
+from backend.app.db.repositories.family_repo import get_family_by_id
+from backend.app.db.repositories.summary_repo import apply_monthly_deltas, document_deltas
+from backend.app.db.repositories.transaction_repo import bulk_create_transactions
+from backend.app.db.session import get_async_sessionmaker
+from backend.app.modules.ingest import registry
+from backend.app.services.extraction_cache import ExtractionCache, default_cache, file_sha256
+from backend.app.services.pipeline import lookup_cached, process_document, store_cached
+
+ProcessedFile = Tuple[str, Dict, float]
+
+
+# Statement formats understood by `process_document`
+STATEMENT_EXTENSIONS = (".pdf", ".csv", ".ofx", ".qfx")
+
+
+def find_statements(directory: str) -> List[str]:
+    """Return the statement files directly inside `directory`, sorted by name."""
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(STATEMENT_EXTENSIONS)
+        and os.path.isfile(os.path.join(directory, name))
+    )
+
+
+def _process_file(path: str) -> ProcessedFile:
+    """Worker entry point: run the pipeline on one file and time it."""
+    start = time.perf_counter()
+    result = process_document(path, columnar=True)
+    return path, result, time.perf_counter() - start
+
+
+def _digest(path: str) -> Optional[str]:
+    try:
+        return file_sha256(path)
+    except OSError:
+        return None  # unreadable – left to the pipeline, which yields an empty result
+
+
+async def _persist_batch(
+    session_factory,
+    family_id: str,
+    batch: List[ProcessedFile],
+    months: Set[str],
+    digests: Dict[str, Optional[str]],
+) -> int:
+    """
+    Write one batch of documents and their transactions, and add them to
+    the monthly summaries, in a single transaction. Touched months are
+    added to `months`.
+    """
+    inserted = 0
+    async with session_factory() as session:
+        async with session.begin():
+            document_ids = []
+            for path, result, _ in batch:
+                doc = await create_document(
+                    session,
+                    family_id,
+                    os.path.basename(path),
+                    source_type=registry.source_type_for_path(path),
+                    content_sha256=digests[path],
+                )
+                inserted += await bulk_create_transactions(
+                    session, doc.id, family_id, result["transactions_normalized"]
+                )
+                document_ids.append(doc.id)
+            deltas = await document_deltas(session, family_id, document_ids)
+            await apply_monthly_deltas(session, family_id, deltas)
+            months.update(deltas)
+    return inserted
+
+
+async def run_import(
+    directory: str,
+    family_id: str,
+    workers: int = 1,
+    batch_size: int = 25,
+    session_factory=None,
+    out: TextIO = sys.stdout,
+    cache: Optional[ExtractionCache] = None,
+) -> Dict:
+    """
+    Import every statement file in `directory` for `family_id`. Results
+    are looked up in and added to `cache` when given.
+    Returns a stats dict (files, transactions, months, seconds).
+    Raises ValueError if the family does not exist.
+    """
+    session_factory = session_factory or get_async_sessionmaker()
+    async with session_factory() as session:
+        if await get_family_by_id(session, family_id) is None:
+            raise ValueError(f"Unknown family: {family_id}")
+
+    paths = find_statements(directory)
+    started = time.perf_counter()
+    months: Set[str] = set()
+    batch: List[ProcessedFile] = []
+    inserted = 0
+    done = 0
+
+    digests = {path: _digest(path) for path in paths}
+    cached: List[ProcessedFile] = []
+    # First file of each distinct content → the other files sharing it
+    duplicates: Dict[str, List[str]] = {}
+    first_of: Dict[Tuple[str, str], str] = {}
+    to_process: List[str] = []
+    for path in paths:
+        digest, source_type = digests[path], registry.source_type_for_path(path)
+        if digest is None:
+            to_process.append(path)
+            continue
+        first = first_of.get((digest, source_type))
+        if first is not None:
+            duplicates[first].append(path)
+            continue
+        result = (
+            lookup_cached(cache, digest, source_type, columnar=True) if cache is not None else None
+        )
+        if result is not None:
+            cached.append((path, result, 0.0))
+        else:
+            to_process.append(path)
+        first_of[(digest, source_type)] = path
+        duplicates[path] = []
+
+    async def collect(processed: ProcessedFile) -> None:
+        nonlocal batch, done, inserted
+        path, result, seconds = processed
+        for same in [path] + duplicates.get(path, []):
+            done += 1
+            batch.append((same, result, seconds))
+            print(
+                f"[{done}/{len(paths)}] {os.path.basename(same)}: "
+                f"{len(result['transactions_normalized'])} txns in {seconds:.2f}s",
+                file=out,
+            )
+        if len(batch) >= batch_size:
+            inserted += await _persist_batch(session_factory, family_id, batch, months, digests)
+            batch = []
+
+    for processed in cached:
+        await collect(processed)
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=max(workers, 1)) as pool:
+        futures = [loop.run_in_executor(pool, _process_file, path) for path in to_process]
+        for future in asyncio.as_completed(futures):
+            processed = await future
+            path, result, _ = processed
+            if cache is not None and digests[path] is not None:
+                store_cached(cache, digests[path], result, registry.source_type_for_path(path))
+            await collect(processed)
+    if batch:
+        inserted += await _persist_batch(session_factory, family_id, batch, months, digests)
+
+    elapsed = time.perf_counter() - started
+    rate = elapsed if elapsed > 0 else 1.0
+    print(
+        f"Imported {len(paths)} files, {inserted} transactions, {len(months)} months "
+        f"in {elapsed:.2f}s ({len(paths) / rate:.2f} files/s, {inserted / rate:.0f} txns/s)",
+        file=out,
+    )
+    return {
+        "files": len(paths), "transactions": inserted, "months": len(months), "seconds": elapsed,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-import statement files for a family.")
+    parser.add_argument("directory", help="Directory containing statement PDF, CSV or OFX files")
+    parser.add_argument("--family", required=True, help="Target family id")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=25, help="Files per DB transaction")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        print(f"Not a directory: {args.directory}", file=sys.stderr)
+        return 1
+    try:
+        asyncio.run(
+            run_import(
+                args.directory, args.family, workers=args.workers,
+                batch_size=args.batch_size, cache=default_cache,
+            )
+        )
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Fleet-wide category limit evaluation.
+
+Flags every family month whose spend in a limited category
+(`budget.thresholds.CATEGORY_LIMITS`, e.g. Housing at 0.35) exceeds that
+share of the month's income, and stores the result in the
+`category_limit_breach` table. Families are walked in id order, a chunk at
+a time: per chunk, one query over the monthly category rollups finds the
+breaches and they replace the chunk's stored ones in the same
+transaction. Memory is bounded by the chunk size; a time budget stops the
+run between chunks and reports where to resume.
+
+Usage:
+    python -m backend.app.tools.category_limits [--chunk-size N] [--time-budget SECONDS]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Dict, List, Optional, TextIO
+
+from backend.app.db.repositories.breach_repo import find_breaches, replace_breaches
+from backend.app.db.repositories.family_repo import list_family_ids
+from backend.app.db.session import get_async_sessionmaker
+from backend.app.modules.budget.thresholds import CATEGORY_LIMITS
+
+# Families per query and transaction
+CHUNK_SIZE = 1000
+
+
+async def run_evaluation(
+    session_factory=None,
+    limits: Optional[Dict[str, float]] = None,
+    chunk_size: int = CHUNK_SIZE,
+    time_budget: Optional[float] = None,
+    resume_after: Optional[str] = None,
+    out: Optional[TextIO] = None,
+) -> Dict:
+    """
+    Evaluate `limits` (default CATEGORY_LIMITS) for every family after
+    `resume_after`. With a `time_budget` (seconds) no new chunk is started
+    once it is spent; pass the returned `last_family_id` as `resume_after`
+    to carry on. Returns a stats dict (families, breaches, chunks, seconds,
+    complete, last_family_id).
+    """
+    session_factory = session_factory or get_async_sessionmaker()
+    limits = CATEGORY_LIMITS if limits is None else limits
+    started = time.perf_counter()
+    after = resume_after
+    families = breaches = chunks = 0
+    complete = False
+
+    while time_budget is None or time.perf_counter() - started < time_budget:
+        async with session_factory() as session:
+            async with session.begin():
+                ids = await list_family_ids(session, after=after, limit=chunk_size)
+                if not ids:
+                    complete = True
+                    break
+                found = await find_breaches(session, ids[0], ids[-1], limits)
+                breaches += await replace_breaches(session, ids[0], ids[-1], found)
+        families += len(ids)
+        chunks += 1
+        after = ids[-1]
+        if out is not None:
+            print(f"chunk {chunks}: {families} families, {breaches} breaches", file=out)
+
+    return {
+        "families": families,
+        "breaches": breaches,
+        "chunks": chunks,
+        "seconds": time.perf_counter() - started,
+        "complete": complete,
+        "last_family_id": after,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Flag category limit breaches for every family.")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Families per query")
+    parser.add_argument("--time-budget", type=float, default=None, help="Stop after N seconds")
+    parser.add_argument("--resume-after", default=None, help="Last family id of a previous run")
+    args = parser.parse_args(argv)
+
+    stats = asyncio.run(
+        run_evaluation(
+            chunk_size=args.chunk_size,
+            time_budget=args.time_budget,
+            resume_after=args.resume_after,
+            out=sys.stdout,
+        )
+    )
+    print(
+        f"Evaluated {stats['families']} families in {stats['seconds']:.2f}s: "
+        f"{stats['breaches']} breaches"
+    )
+    if not stats["complete"]:
+        print(f"Time budget spent; resume with --resume-after {stats['last_family_id']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Monthly aggregation of a family's full history: the per-row loop in
+`aggregate_by_month` against the NumPy group-by (factorize + bincount),
+for a TransactionBatch and for a list of row objects, across sizes – the
+crossover sets AGGREGATE_VECTORIZE_MIN_ROWS / _MIN_OBJECTS.
+
+Usage:
+    python -m benchmarks.bench_aggregate --rows 300000
+"""
+
+import argparse
+import time
+
+from backend.app.modules.budget.aggregator import (
+    AGGREGATE_VECTORIZE_MIN_OBJECTS,
+    AGGREGATE_VECTORIZE_MIN_ROWS,
+    aggregate_by_month,
+)
+from backend.app.modules.normalize.normalizer import normalize_batch
+from benchmarks.bench_vectorized_normalize import _raw
+
+
+def _bench(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"AGGREGATE_VECTORIZE_MIN_ROWS = {AGGREGATE_VECTORIZE_MIN_ROWS}, "
+        f"_MIN_OBJECTS = {AGGREGATE_VECTORIZE_MIN_OBJECTS}"
+    )
+    print(f"{'rows':>9} {'input':>6} {'loop':>11} {'bincount':>11} {'speed-up':>9}")
+    for rows in sorted({64, 128, 512, 1_000, 10_000, args.rows}):
+        batch = normalize_batch(_raw(rows))
+        repeat = max(args.repeat, 20_000 // rows)
+        for name, transactions in (("batch", batch), ("list", list(batch))):
+            expected = aggregate_by_month(transactions, vectorized=False)
+            assert aggregate_by_month(transactions, vectorized=True) == expected
+            slow = _bench(lambda: aggregate_by_month(transactions, vectorized=False), repeat)
+            fast = _bench(lambda: aggregate_by_month(transactions, vectorized=True), repeat)
+            print(
+                f"{rows:>9} {name:>6} {slow * 1e3:9.2f}ms {fast * 1e3:9.2f}ms {slow / fast:8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
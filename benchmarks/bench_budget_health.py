@@ -0,0 +1,112 @@
+"""
+Budget health over a family's history: one `analyze_budget` call (with
+its own summary and category queries) per month, as the UI had to do,
+against the health timeline's two bounded range queries and single
+`analyze_budget_series` pass.
+
+Usage:
+    python -m benchmarks.bench_budget_health --months 240 --categories 8
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.db.base import Base
+from backend.app.db.models import Family
+from backend.app.db.repositories.summary_repo import (
+    apply_monthly_deltas,
+    list_category_summaries,
+    list_monthly_summaries,
+)
+from backend.app.modules.budget.analyzer import analyze_budget, analyze_budget_series
+from tests.synthetic import DESCRIPTIONS
+
+FAMILY = "fam-bench"
+
+
+def _deltas(months: int, categories: int, seed: int = 7):
+    rng = random.Random(seed)
+    deltas = {}
+    for index in range(months):
+        month = f"{2000 + index // 12}-{index % 12 + 1:02d}"
+        totals = {name: rng.uniform(10, 900) for name in DESCRIPTIONS[:categories]}
+        deltas[month] = {
+            "income": rng.uniform(3000, 9000),
+            "expenses": sum(totals.values()),
+            "transactions": categories,
+            "categories": {
+                name: {"total": total, "transactions": 1} for name, total in totals.items()
+            },
+        }
+    return deltas
+
+
+async def _per_month(session, months):
+    results = []
+    for month in months:
+        (summary,) = await list_monthly_summaries(session, FAMILY, start=month, end=month)
+        rows = await list_category_summaries(session, FAMILY, month=month)
+        results.append(analyze_budget({
+            "income": summary.income,
+            "expenses": summary.expenses,
+            "categories": {row.category: row.total for row in rows},
+        }))
+    return results
+
+
+async def _timeline(session):
+    summaries = await list_monthly_summaries(session, FAMILY)
+    categories = {}
+    for row in await list_category_summaries(session, FAMILY):
+        categories.setdefault(row.month, {})[row.category] = row.total
+    return analyze_budget_series([
+        {"income": s.income, "expenses": s.expenses, "categories": categories.get(s.month, {})}
+        for s in reversed(summaries)
+    ])
+
+
+async def main_async(months: int, categories: int, repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    deltas = _deltas(months, categories)
+    async with factory() as session:
+        async with session.begin():
+            session.add(Family(id=FAMILY, name="Bench"))
+            await apply_monthly_deltas(session, FAMILY, deltas)
+
+    best = {"per-month calls": float("inf"), "timeline": float("inf")}
+    async with factory() as session:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            per_month = await _per_month(session, list(deltas))
+            best["per-month calls"] = min(best["per-month calls"], time.perf_counter() - start)
+            start = time.perf_counter()
+            timeline = await _timeline(session)
+            best["timeline"] = min(best["timeline"], time.perf_counter() - start)
+    await engine.dispose()
+
+    # Ties in largest_category aside, both read the same data
+    assert [h["savings_rate"] for h in per_month] == [h["savings_rate"] for h in timeline]
+    print(f"{months} months x {categories} categories")
+    for name, seconds in best.items():
+        print(f"{name:<16} {seconds * 1e3:8.1f}ms")
+    print(f"timeline: x{best['per-month calls'] / best['timeline']:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--months", type=int, default=240)
+    parser.add_argument("--categories", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.months, args.categories, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Categorizing transaction descriptions against large rule sets: the
+previous loop over every category and keyword against the compiled
+CategoryMatcher (Aho–Corasick automaton), at increasing keyword counts.
+
+The stock CATEGORY_RULES are appended after the synthetic categories, so
+real descriptions only match late in rule order – the worst case for the
+loop.
+
+Usage:
+    python -m benchmarks.bench_categorize --keywords 10000 --descriptions 20000
+"""
+
+import argparse
+import random
+import string
+import time
+from typing import Dict, List
+
+from backend.app.modules.normalize.category_rules import (
+    AUTOMATON_MIN_KEYWORDS,
+    CATEGORY_RULES,
+    CategoryMatcher,
+)
+from tests.synthetic import statement_lines
+
+KEYWORDS_PER_CATEGORY = 50
+
+
+def _legacy_categorize(rules: Dict[str, List[str]], description: str) -> str:
+    """The pre-optimisation implementation, kept here as the baseline."""
+    lowered = description.lower()
+    for category, keywords in rules.items():
+        for kw in keywords:
+            if kw in lowered:
+                return category
+    return "Other"
+
+
+def _rules(keywords: int, seed: int = 7) -> Dict[str, List[str]]:
+    rng = random.Random(seed)
+    rules: Dict[str, List[str]] = {}
+    for i in range(max(keywords - sum(map(len, CATEGORY_RULES.values())), 0)):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10)))
+        rules.setdefault(f"Synthetic {i // KEYWORDS_PER_CATEGORY}", []).append(word)
+    rules.update(CATEGORY_RULES)
+    return rules
+
+
+def _bench(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keywords", type=int, default=10_000)
+    parser.add_argument("--descriptions", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    descriptions = [line.split(" ", 1)[1] for line in statement_lines(args.descriptions)]
+    sizes = sorted({32, 64, 128, 1000, args.keywords})
+    print(f"{len(descriptions)} descriptions, best of {args.repeat}")
+    print(f"{'keywords':>9} {'loop':>11} {'automaton':>11} {'speed-up':>9}")
+    for size in sizes:
+        rules = _rules(size)
+        matcher = CategoryMatcher(rules, min_automaton_keywords=0)
+        expected = [_legacy_categorize(rules, d) for d in descriptions]
+        assert [matcher.match(d.lower()) or "Other" for d in descriptions] == expected
+
+        loop = _bench(lambda: [_legacy_categorize(rules, d) for d in descriptions], args.repeat)
+        automaton = _bench(lambda: [matcher.match(d.lower()) for d in descriptions], args.repeat)
+        per_item = 1e6 / len(descriptions)
+        print(
+            f"{sum(map(len, rules.values())):>9} {loop * per_item:9.2f}us "
+            f"{automaton * per_item:9.2f}us {loop / automaton:8.2f}x"
+        )
+    print(f"(CategoryMatcher uses the loop below {AUTOMATON_MIN_KEYWORDS} keywords)")
+
+
+if __name__ == "__main__":
+    main()
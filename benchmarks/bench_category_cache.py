@@ -0,0 +1,68 @@
+"""
+Categorizing recurring merchant descriptions with and without the
+CategorizationCache, for the stock rules and a large rule set.
+
+Descriptions repeat the synthetic merchants with varying store numbers
+("WOOLWORTHS SUPERMARKET 1234"), which the canonical key folds together.
+
+Usage:
+    python -m benchmarks.bench_category_cache --descriptions 200000 --keywords 10000
+"""
+
+import argparse
+import random
+import time
+
+from backend.app.modules.normalize.category_cache import CategorizationCache
+from backend.app.modules.normalize.category_rules import CATEGORY_RULES, CategoryMatcher, categorize
+from benchmarks.bench_categorize import _rules
+from tests.synthetic import DESCRIPTIONS
+
+
+def _bench(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--descriptions", type=int, default=200_000)
+    parser.add_argument("--keywords", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    descriptions = [
+        f"{rng.choice(DESCRIPTIONS)} {rng.randint(1, 9999):04d}" for _ in range(args.descriptions)
+    ]
+    distinct = len(set(descriptions))
+    print(f"{len(descriptions)} descriptions, {distinct} distinct, best of {args.repeat}")
+    rule_sets = (
+        ("stock rules", CATEGORY_RULES),
+        (f"{args.keywords} keywords", _rules(args.keywords)),
+    )
+    for label, rules in rule_sets:
+        matcher = CategoryMatcher(rules)
+        cache = CategorizationCache()
+        expected = [categorize(d, matcher, cache=None) for d in descriptions]
+        assert [categorize(d, matcher, cache) for d in descriptions] == expected
+
+        uncached = _bench(
+            lambda: [categorize(d, matcher, cache=None) for d in descriptions], args.repeat
+        )
+        cached = _bench(lambda: [categorize(d, matcher, cache) for d in descriptions], args.repeat)
+        per_item = 1e6 / len(descriptions)
+        stats = cache.stats()
+        print(
+            f"{label:>16}: uncached {uncached * per_item:6.2f}us  cached {cached * per_item:6.2f}us"
+            f"  x{uncached / cached:.2f}  ({stats['entries']} entries,"
+            f" hit rate {stats['hits'] / (stats['hits'] + stats['misses']):.1%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
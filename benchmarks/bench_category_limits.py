@@ -0,0 +1,134 @@
+"""
+Fleet-wide category limit evaluation: time and Python memory of the
+chunked job (one rollup query per chunk of families) over a large fleet,
+against a per-family loop (summaries and categories loaded and checked in
+Python for each family), timed on a sample and extrapolated.
+
+Usage:
+    python -m benchmarks.bench_category_limits --families 100000 --months 3
+"""
+
+import argparse
+import asyncio
+import datetime
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.db.base import Base
+from backend.app.db.models import Family, MonthlyCategorySummary, MonthlySummary
+from backend.app.db.repositories.family_repo import list_family_ids
+from backend.app.db.repositories.summary_repo import (
+    list_category_summaries,
+    list_monthly_summaries,
+)
+from backend.app.modules.budget.thresholds import CATEGORY_LIMITS
+from backend.app.tools.category_limits import CHUNK_SIZE, run_evaluation
+
+CATEGORIES = ("Housing", "Food", "Transport", "Other")
+SEED_BATCH = 20_000
+
+
+async def _seed(engine, families: int, months: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    family_rows, summary_rows, category_rows = [], [], []
+
+    async def flush(force=False):
+        for model, rows in (
+            (Family, family_rows), (MonthlySummary, summary_rows),
+            (MonthlyCategorySummary, category_rows),
+        ):
+            if rows and (force or len(rows) >= SEED_BATCH):
+                async with engine.begin() as conn:
+                    await conn.execute(insert(model.__table__), rows)
+                rows.clear()
+
+    for _ in range(families):
+        family_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        family_rows.append({"id": family_id, "name": "Bench", "created_at": now})
+        for index in range(months):
+            month = f"2024-{index % 12 + 1:02d}"
+            income = rng.uniform(2000, 9000)
+            totals = {name: income * rng.uniform(0.05, 0.45) for name in CATEGORIES}
+            summary_rows.append({
+                "id": str(uuid.UUID(int=rng.getrandbits(128))), "family_id": family_id,
+                "month": month, "income": income, "expenses": sum(totals.values()),
+                "savings": 0.0, "savings_rate": 0.0, "transaction_count": len(totals),
+                "generated_at": now,
+            })
+            category_rows.extend({
+                "id": str(uuid.UUID(int=rng.getrandbits(128))), "family_id": family_id,
+                "month": month, "category": name, "total": total, "expense_total": total,
+                "transaction_count": 1, "generated_at": now,
+            } for name, total in totals.items())
+        await flush()
+    await flush(force=True)
+
+
+async def _per_family(factory, family_ids) -> int:
+    """The approach the job avoids: a Python loop with queries per family."""
+    breaches = 0
+    async with factory() as session:
+        for family_id in family_ids:
+            incomes = {s.month: s.income for s in await list_monthly_summaries(session, family_id)}
+            for row in await list_category_summaries(session, family_id):
+                limit = CATEGORY_LIMITS.get(row.category)
+                if limit is not None and row.expense_total > incomes.get(row.month, 0.0) * limit:
+                    breaches += 1
+    return breaches
+
+
+async def main_async(families: int, months: int, chunk_size: int, sample: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "limits.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    start = time.perf_counter()
+    await _seed(engine, families, months)
+    print(f"seeded {families} families x {months} months in {time.perf_counter() - start:.1f}s")
+
+    stats = await run_evaluation(factory, chunk_size=chunk_size)
+    # Memory on a second run: tracing slows the job down. Runs are idempotent
+    tracemalloc.start()
+    await run_evaluation(factory, chunk_size=chunk_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"chunked job ({chunk_size}/chunk): {stats['seconds']:.2f}s, "
+        f"{stats['breaches']} breaches, peak {peak / 2 ** 20:.1f}MiB traced"
+    )
+
+    async with factory() as session:
+        sample_ids = await list_family_ids(session, limit=sample)
+    start = time.perf_counter()
+    await _per_family(factory, sample_ids)
+    per_family = (time.perf_counter() - start) / len(sample_ids) * families
+    print(
+        f"per-family loop: {per_family:.2f}s extrapolated from {len(sample_ids)} families "
+        f"(x{per_family / stats['seconds']:.1f})"
+    )
+    await engine.dispose()
+    os.remove(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--families", type=int, default=100_000)
+    parser.add_argument("--months", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--sample", type=int, default=2_000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.families, args.months, args.chunk_size, args.sample))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Nightly all-families analysis: the previous multi-pass
+FamilyFinanceAnalyzer.analyze against the single-pass accumulator, and
+`analyze_many` sharding families across a process pool. Every result is
+checked to serialise byte for byte like the baseline's.
+
+Usage:
+    python -m benchmarks.bench_family_analyzer --families 2000 --months 12 --rows 40
+"""
+
+import argparse
+import json
+import os
+import time
+
+from backend.app.modules.analysis.analyzer import FamilyFinanceAnalyzer
+from tests.analyzer_reference import legacy_analyze, transactions
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--families", type=int, default=2_000)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--rows", type=int, default=40, help="Transactions per family-month")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    txns = transactions(args.families, args.months, args.rows)
+    print(f"{len(txns)} transactions, {args.families} families, {args.workers} workers")
+    legacy, legacy_s = _timed(legacy_analyze, txns)
+    expected = json.dumps(legacy)
+    print(f"{'legacy':<16} {legacy_s:8.2f}s")
+    runs = (
+        ("single-pass", FamilyFinanceAnalyzer.analyze, {}),
+        ("analyze_many", FamilyFinanceAnalyzer.analyze_many, {"workers": args.workers}),
+    )
+    for name, fn, kwargs in runs:
+        result, seconds = _timed(fn, txns, **kwargs)
+        assert json.dumps(result) == expected, name
+        print(f"{name:<16} {seconds:8.2f}s  x{legacy_s / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Verifying a batch of transaction descriptions before they are persisted:
+the previous per-item, per-pattern `re.search` loop against the batched
+`find_unsafe` scan.
+
+Usage:
+    python -m benchmarks.bench_guardrails --items 100000 --unsafe-every 50
+"""
+
+import argparse
+import re
+import time
+from typing import List
+
+from backend.app.modules.privacy.guardrails import assert_safe_for_processing, find_unsafe
+from backend.app.modules.privacy.patterns import SENSITIVE_PATTERNS
+from benchmarks.bench_redaction import SENSITIVE_LINES
+from tests.synthetic import statement_lines
+
+
+def _legacy_assert_safe(data: str) -> bool:
+    """
+    The pre-optimisation guardrail, kept here as the timing baseline (it
+    matched emails case-sensitively, so it misses lower-case addresses).
+    """
+    for pattern in SENSITIVE_PATTERNS.values():
+        if re.search(pattern, data):
+            return False
+    return True
+
+
+def _descriptions(count: int, unsafe_every: int) -> List[str]:
+    # Statement lines without their leading date, as a parser would store them
+    items = [line.split(" ", 1)[1] for line in statement_lines(count)]
+    if unsafe_every:
+        for i in range(0, count, unsafe_every):
+            items[i] = SENSITIVE_LINES[(i // unsafe_every) % len(SENSITIVE_LINES)]
+    return items
+
+
+def _bench(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--unsafe-every", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    items = _descriptions(args.items, args.unsafe_every)
+    expected = [i for i, item in enumerate(items) if not assert_safe_for_processing(item)]
+    assert find_unsafe(items) == expected
+
+    legacy = _bench(
+        lambda: [i for i, item in enumerate(items) if not _legacy_assert_safe(item)],
+        args.repeat,
+    )
+    batched = _bench(lambda: find_unsafe(items), args.repeat)
+    print(f"{len(items)} descriptions, {len(expected)} unsafe, best of {args.repeat}")
+    print(f"legacy per-item loop : {legacy:7.3f}s  {len(items) / legacy:10.0f} items/s")
+    print(
+        f"find_unsafe          : {batched:7.3f}s  {len(items) / batched:10.0f} items/s"
+        f"  x{legacy / batched:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Layout-aware table extraction on a multi-column (Date | Description |
+Debit | Credit | Balance) statement: accuracy of text-line parsing versus
+word-coordinate extraction, and the cost of analysing every page versus
+reusing the cached per-template column map.
+
+Usage:
+    python -m benchmarks.bench_layout_extraction --pages 50
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from backend.app.modules.ingest.layout import ColumnMapCache, extract_table_transactions
+from backend.app.services.pipeline import process_pdf
+from tests.synthetic import build_table_statement_pdf, statement_lines
+
+ROWS_PER_PAGE = 60
+
+
+def _expected(count: int):
+    rows = []
+    for line in statement_lines(count):
+        date, rest = line.split(" ", 1)
+        description, amount = rest.rsplit(" ", 1)
+        rows.append((date, description, float(amount)))
+    return rows
+
+
+def _accuracy(transactions, expected) -> float:
+    got = [(t["date"], t["description"], t["amount"]) for t in transactions]
+    correct = sum(1 for a, b in zip(got, expected) if a == b)
+    return correct / len(expected)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=50)
+    args = parser.parse_args()
+
+    expected = _expected(args.pages * ROWS_PER_PAGE)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_table_statement_pdf(
+            os.path.join(tmp, "table.pdf"), args.pages, ROWS_PER_PAGE
+        )
+
+        text_result, text_s = _timed(lambda: process_pdf(path))
+        print(
+            f"text lines          : {text_s:7.3f}s  accuracy "
+            f"{_accuracy(text_result['transactions_normalized'], expected):6.1%}"
+        )
+
+        cold_cache = ColumnMapCache()
+        cold, cold_s = _timed(lambda: extract_table_transactions(path, cache=None))
+        print(f"layout, no cache    : {cold_s:7.3f}s  analyses {args.pages}")
+
+        first, first_s = _timed(lambda: extract_table_transactions(path, cache=cold_cache))
+        print(
+            f"layout, first doc   : {first_s:7.3f}s  analyses "
+            f"{cold_cache.stats()['detections']}"
+        )
+        warm, warm_s = _timed(lambda: extract_table_transactions(path, cache=cold_cache))
+        print(
+            f"layout, cached map  : {warm_s:7.3f}s  analyses "
+            f"{cold_cache.stats()['detections']}  accuracy {_accuracy(warm, expected):6.1%}"
+        )
+        assert cold == first == warm
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Merchant dimension: cost of resolving merchants per document (one bulk
+lookup) and of grouping spend per merchant by the compact merchant_id
+instead of the full description string.
+
+Usage:
+    python -m benchmarks.bench_merchants --documents 20 --rows 2000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.db.base import Base
+from backend.app.db.models import Merchant, Transaction
+from backend.app.db.repositories.transaction_repo import bulk_create_transactions
+from tests.synthetic import DESCRIPTIONS
+
+
+async def _query(factory, stmt, repeat: int) -> float:
+    best = float("inf")
+    async with factory() as session:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            (await session.execute(stmt)).all()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main_async(documents: int, rows: int, repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    rng = random.Random(7)
+    insert_seconds = 0.0
+    for doc in range(documents):
+        txns = [
+            {
+                "date": f"2024-{rng.randint(1, 12):02d}-01",
+                "description": f"{rng.choice(DESCRIPTIONS)} {rng.randint(1, 9999):04d}",
+                "amount": -rng.randint(1, 500),
+            }
+            for _ in range(rows)
+        ]
+        start = time.perf_counter()
+        async with factory() as session:
+            async with session.begin():
+                await bulk_create_transactions(session, f"doc-{doc}", "fam-bench", txns)
+        insert_seconds += time.perf_counter() - start
+
+    by_description = (
+        select(Transaction.description, func.sum(Transaction.amount))
+        .group_by(Transaction.description)
+    )
+    by_merchant = (
+        select(Transaction.merchant_id, func.sum(Transaction.amount))
+        .group_by(Transaction.merchant_id)
+    )
+    description_s = await _query(factory, by_description, repeat)
+    merchant_s = await _query(factory, by_merchant, repeat)
+    async with factory() as session:
+        merchants = await session.scalar(select(func.count()).select_from(Merchant))
+        groups = len((await session.execute(by_description)).all())
+    await engine.dispose()
+
+    total = documents * rows
+    print(f"{total} transactions in {documents} documents, {merchants} merchants")
+    print(f"insert incl. merchant resolution : {total / insert_seconds:9.0f} rows/s")
+    print(f"GROUP BY description ({groups:>5} groups): {description_s * 1000:7.1f}ms")
+    print(
+        f"GROUP BY merchant_id ({merchants:>5} groups): {merchant_s * 1000:7.1f}ms"
+        f"  x{description_s / merchant_s:.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.documents, args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Refreshing a family's monthly summaries after one more statement: the
+full recompute (load every transaction, `aggregate_by_month`, upsert
+every month) against the incremental path (one grouped query over the
+new document, applied as deltas), as the family's history grows.
+
+Usage:
+    python -m benchmarks.bench_monthly_deltas --documents 60 --rows 500
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.db.base import Base
+from backend.app.db.models import Family, MonthlySummary, Transaction
+from backend.app.db.repositories.summary_repo import add_documents_to_summaries
+from backend.app.db.repositories.transaction_repo import bulk_create_transactions
+from backend.app.modules.budget.aggregator import aggregate_by_month
+from tests.synthetic import DESCRIPTIONS
+
+FAMILY = "fam-bench"
+
+
+async def _full_recompute(session) -> None:
+    """The approach incremental deltas replace: rebuild every month."""
+    rows = (await session.execute(
+        select(Transaction.date, Transaction.direction, Transaction.amount, Transaction.category)
+        .where(Transaction.family_id == FAMILY)
+    )).all()
+    for month, data in aggregate_by_month(rows).items():
+        income, expenses = data["income"], data["expenses"]
+        savings = income - expenses
+        values = dict(
+            income=income,
+            expenses=expenses,
+            savings=savings,
+            savings_rate=savings / income if income > 0 else 0.0,
+            generated_at=datetime.utcnow(),
+        )
+        summary = await session.scalar(
+            select(MonthlySummary)
+            .where(MonthlySummary.family_id == FAMILY, MonthlySummary.month == month)
+        )
+        if summary is None:
+            session.add(MonthlySummary(family_id=FAMILY, month=month, **values))
+        else:
+            for name, value in values.items():
+                setattr(summary, name, value)
+    await session.flush()
+
+
+def _statement(rng: random.Random, month: int, rows: int):
+    return [
+        {
+            "date": f"{2020 + month // 12}-{month % 12 + 1:02d}-{rng.randint(1, 28):02d}",
+            "description": rng.choice(DESCRIPTIONS),
+            "amount": rng.choice([-1, 1]) * rng.randint(1, 900),
+        }
+        for _ in range(rows)
+    ]
+
+
+async def main_async(documents: int, rows: int, repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    rng = random.Random(7)
+
+    async with factory() as session:
+        async with session.begin():
+            session.add(Family(id=FAMILY, name="Bench"))
+    print(f"{'history':>10} {'full recompute':>15} {'deltas':>10} {'speed-up':>9}")
+    for doc in range(documents):
+        document_id = f"doc-{doc}"
+        async with factory() as session:
+            async with session.begin():
+                await bulk_create_transactions(
+                    session, document_id, FAMILY, _statement(rng, doc, rows)
+                )
+                await add_documents_to_summaries(session, FAMILY, [document_id])
+        if (doc + 1) % max(documents // 4, 1):
+            continue
+        full = delta = float("inf")
+        for _ in range(repeat):
+            # Timed inside a transaction that is rolled back, so history is unchanged
+            async with factory() as session:
+                async with session.begin():
+                    start = time.perf_counter()
+                    await _full_recompute(session)
+                    full = min(full, time.perf_counter() - start)
+                    await session.rollback()
+            async with factory() as session:
+                async with session.begin():
+                    start = time.perf_counter()
+                    await add_documents_to_summaries(session, FAMILY, [document_id])
+                    delta = min(delta, time.perf_counter() - start)
+                    await session.rollback()
+        history = (doc + 1) * rows
+        print(f"{history:>10} {full * 1e3:13.1f}ms {delta * 1e3:8.1f}ms {full / delta:8.1f}x")
+
+    async with factory() as session:
+        months = (await session.scalars(select(MonthlySummary))).all()
+        assert sum(m.transaction_count for m in months) == documents * rows
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=60)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.documents, args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Wall time of process_pdf with and without the page pre-screen on a
+statement padded with terms-and-conditions pages, plus the pre-screen's
+own cost.
+
+Usage:
+    python -m benchmarks.bench_page_prescreen --pages 10 --filler-pages 30
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from backend.app.services.pipeline import process_pdf
+from tests.synthetic import build_statement_pdf
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--filler-pages", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_statement_pdf(
+            os.path.join(tmp, "s.pdf"), args.pages, filler_pages=args.filler_pages
+        )
+        start = time.perf_counter()
+        full = process_pdf(path)
+        full_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        screened = process_pdf(path, prescreen=True)
+        screened_s = time.perf_counter() - start
+
+    assert screened["transactions_normalized"] == full["transactions_normalized"]
+    stats = screened["page_screen"]
+    print(f"full extraction : {full_s:7.3f}s  ({stats['pages']} pages)")
+    print(
+        f"with pre-screen : {screened_s:7.3f}s  skipped {stats['skipped']} pages, "
+        f"screening took {stats['screen_seconds'] * 1000:.1f} ms"
+    )
+    print(f"speed-up        : x{full_s / screened_s:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Parser dispatch cost with many registered parsers: the legacy
+"first can_parse over the whole text" loop versus the signature index.
+
+Usage:
+    python -m benchmarks.bench_parser_dispatch --parsers 60 --lines 20000
+"""
+
+import argparse
+import time
+from typing import List
+
+from backend.app.modules.ingest import registry
+from backend.app.modules.ingest.base import BaseDocumentParser
+from tests.synthetic import statement_text
+
+
+class _SyntheticBankParser(BaseDocumentParser):
+    def __init__(self, number: int):
+        self.KEYWORDS = {f"bank{number:03d} statement", f"bank{number:03d} pty ltd"}
+
+    def can_parse(self, text: str) -> bool:
+        lowered = text.lower()
+        return any(keyword in lowered for keyword in self.KEYWORDS)
+
+    def extract(self, text: str) -> List[dict]:
+        return []
+
+
+def _legacy(text: str, parsers: List[BaseDocumentParser]):
+    for parser in parsers:
+        if parser.can_parse(text):
+            return parser
+    return None
+
+
+def _bench(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parsers", type=int, default=60)
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    synthetic = [_SyntheticBankParser(n) for n in range(args.parsers)]
+    parsers = synthetic + list(registry.PARSERS)  # generic parser matched last
+    registry.PARSERS[:] = parsers
+    text = statement_text(args.lines)
+    print(f"{len(parsers)} parsers, document {len(text) / 1024:.0f} KiB")
+
+    registry.get_signature_index()  # build once, outside the timing
+    legacy = _bench(lambda: _legacy(text, parsers), args.repeat)
+    indexed = _bench(lambda: registry.get_parser_for_text(text), args.repeat)
+    assert _legacy(text, parsers) is registry.get_parser_for_text(text)
+    print(f"legacy loop   : {legacy * 1e3:9.3f} ms")
+    print(f"signature idx : {indexed * 1e3:9.3f} ms  ({legacy / indexed:.0f}x faster)")
+
+    build = _bench(lambda: registry.SignatureIndex(parsers), args.repeat)
+    print(f"index build   : {build * 1e3:9.3f} ms (once per registry change)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Speed-up of process-pool page extraction versus worker count.
+
+Usage:
+    python -m benchmarks.bench_pdf_parallel --pages 60
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from backend.app.modules.ingest.pdf_reader import extract_pages_parallel
+from tests.synthetic import build_statement_pdf
+
+
+def _time(path: str, workers: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_pages_parallel(path, max_workers=workers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--lines-per-page", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1))) or [1]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_statement_pdf(
+            os.path.join(tmp, "statement.pdf"), args.pages, args.lines_per_page
+        )
+        print(f"{args.pages} pages, {cores} CPU cores available")
+        serial = _time(path, 1, args.repeat)
+        print(f"workers= 1: {serial:7.3f}s  speed-up 1.00x")
+        for workers in counts[1:]:
+            elapsed = _time(path, workers, args.repeat)
+            print(f"workers={workers:2d}: {elapsed:7.3f}s  speed-up {serial / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Peak-memory comparison of the one-shot and page-streaming PDF pipelines.
+
+Each mode runs in a fresh interpreter so that `ru_maxrss` (which never
+decreases within a process) reflects that mode alone.
+
+Usage:
+    python -m benchmarks.bench_pdf_streaming --pages 300
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from tests.synthetic import build_statement_pdf
+
+
+def _run_mode(path: str, stream: bool) -> dict:
+    from backend.app.services.pipeline import process_pdf
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    result = process_pdf(path, stream=stream)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "mode": "stream" if stream else "one-shot",
+        "seconds": round(elapsed, 3),
+        "peak_rss_kib": peak,
+        "rss_growth_kib": peak - baseline,
+        "transactions": len(result["transactions_normalized"]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--lines-per-page", type=int, default=60)
+    parser.add_argument("--child", choices=["stream", "one-shot"], help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_run_mode(args.path, stream=args.child == "stream")))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_statement_pdf(
+            os.path.join(tmp, "statement.pdf"), args.pages, args.lines_per_page
+        )
+        print(f"{args.pages} pages, {os.path.getsize(path) / 1024:.0f} KiB PDF")
+        for mode in ("one-shot", "stream"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_pdf_streaming",
+                 "--child", mode, "--path", path],
+                check=True, capture_output=True, text=True,
+            )
+            row = json.loads(out.stdout.strip().splitlines()[-1])
+            print(
+                f"{row['mode']:>9}: {row['seconds']:>7.3f}s  "
+                f"peak RSS {row['peak_rss_kib'] / 1024:7.1f} MiB  "
+                f"(+{row['rss_growth_kib'] / 1024:.1f} MiB during run, "
+                f"{row['transactions']} txns)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Adversarial (ReDoS) inputs for sensitive-data matching.
+
+For each input family the text size is doubled repeatedly and the time of
+the previous per-pattern regex loop, the combined regex engine and the
+linear engine is recorded. A linear matcher roughly doubles its time with
+the input; a quadratic one quadruples it. Linear-engine times are the best
+of `--repeat` runs, and a single noisy doubling is tolerated: with --check
+the script exits non-zero if the linear engine grows faster than
+`--max-growth` on two consecutive doublings of one family, or exceeds
+`--max-seconds` on any input.
+
+Usage:
+    python -m benchmarks.bench_redos --max-size 256000 --check
+"""
+
+import argparse
+import re
+import sys
+import time
+from typing import Callable, Dict
+
+from backend.app.modules.privacy.patterns import SENSITIVE_PATTERNS
+from backend.app.modules.privacy.redactor import RedactionEngine
+
+# Family name -> builder of an input of roughly `n` characters
+ADVERSARIAL: Dict[str, Callable[[int], str]] = {
+    "dash-separated digits": lambda n: "1-" * (n // 2) + "x",
+    "dotted local part, late @": lambda n: "a." * (n // 2) + "@",
+    "long local part, bad domain": lambda n: "a" * n + "@b",
+    "many @ without domain": lambda n: "a@" * (n // 2),
+    "digits with wide gaps": lambda n: ("1" + " " * 64) * (n // 65) + "x",
+    "12-digit groups": lambda n: ("1 " * 12 + "a ") * (n // 26),
+    "digit run with letter": lambda n: "7" * n + "z",
+    "uppercase run": lambda n: "GB" + "A" * n,
+}
+
+LEGACY_MAX_SIZE = 16_000  # the old loop is quadratic on some families
+
+
+def _legacy_search(text: str) -> None:
+    """The previous per-pattern loop (as used by assert_safe_for_processing)."""
+    for name, pattern in SENSITIVE_PATTERNS.items():
+        flags = re.IGNORECASE if name == "email" else 0
+        re.compile(pattern, flags).sub("", text)
+
+
+def _time(fn, text: str, repeat: int = 1) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min-size", type=int, default=4_000)
+    parser.add_argument("--max-size", type=int, default=256_000)
+    parser.add_argument("--max-growth", type=float, default=3.0)
+    parser.add_argument("--max-seconds", type=float, default=2.0)
+    parser.add_argument("--repeat", type=int, default=5, help="best-of runs for the linear engine")
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    linear = RedactionEngine()
+    combined = RedactionEngine(linear=False)
+    failures = []
+    for family, build in ADVERSARIAL.items():
+        print(f"\n{family}")
+        print(f"{'chars':>9} {'legacy':>10} {'combined':>10} {'linear':>10} {'growth':>7}")
+        previous = None
+        over = 0  # consecutive doublings above --max-growth
+        size = args.min_size
+        while size <= args.max_size:
+            text = build(size)
+            legacy_s = _time(_legacy_search, text) if size <= LEGACY_MAX_SIZE else None
+            combined_s = _time(combined.scan, text) if size <= LEGACY_MAX_SIZE * 2 else None
+            linear_s = _time(linear.scan, text, args.repeat)
+            # Growth is only meaningful once timings leave the noise floor
+            growth = linear_s / previous if previous and previous > 1e-3 else None
+            print(
+                f"{len(text):>9} "
+                f"{'-' if legacy_s is None else f'{legacy_s * 1000:8.1f}ms':>10} "
+                f"{'-' if combined_s is None else f'{combined_s * 1000:8.1f}ms':>10} "
+                f"{linear_s * 1000:8.1f}ms "
+                f"{'-' if growth is None else f'x{growth:.2f}':>7}"
+            )
+            over = over + 1 if growth is not None and growth > args.max_growth else 0
+            if over == 2:
+                failures.append(
+                    f"{family}: x{growth:.2f} growth twice in a row at {len(text)} chars"
+                )
+            if linear_s > args.max_seconds:
+                failures.append(f"{family}: {linear_s:.2f}s at {len(text)} chars")
+            previous = linear_s
+            size *= 2
+
+    if failures:
+        print("\nlinear engine bound exceeded:\n  " + "\n  ".join(failures))
+        if args.check:
+            sys.exit(1)
+    else:
+        print("\nlinear engine stayed within bounds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Memory held by pending temp-file deletions: one sleeping asyncio task per
+file (the previous `schedule_auto_delete`) against the RetentionSweeper
+heap, plus the time one sweep takes to delete every expired file.
+
+Usage:
+    python -m benchmarks.bench_retention --files 20000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.db.base import Base
+from backend.app.db.repositories.retention_repo import schedule_deletion
+from backend.app.services.retention_sweeper import RetentionSweeper
+
+
+async def _legacy_delete(file_path: str, delay: float) -> None:
+    """The pre-optimisation per-file task, kept here as the baseline."""
+    await asyncio.sleep(delay)
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+async def _task_memory(paths) -> int:
+    tracemalloc.start()
+    tasks = [asyncio.create_task(_legacy_delete(path, 3600)) for path in paths]
+    await asyncio.sleep(0)  # let every task reach its sleep
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return size
+
+
+def _heap_memory(sweeper: RetentionSweeper, paths) -> int:
+    tracemalloc.start()
+    deadline = sweeper.deadline(3600)
+    for path in paths:
+        sweeper.track(path, deadline)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+async def main_async(files: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f"upload-{i}.pdf") for i in range(files)]
+        for path in paths:
+            open(path, "wb").close()
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        tasks_bytes = await _task_memory(paths)
+        heap_bytes = _heap_memory(RetentionSweeper(session_factory=factory), paths)
+
+        sweeper = RetentionSweeper(session_factory=factory)
+        async with factory() as session:
+            async with session.begin():
+                deadline = sweeper.deadline(-1)
+                for path in paths:
+                    await schedule_deletion(session, path, deadline)
+        for path in paths:
+            sweeper.track(path, deadline)
+        started = time.perf_counter()
+        swept = await sweeper.sweep()
+        elapsed = time.perf_counter() - started
+        await engine.dispose()
+        assert swept == files and not os.listdir(directory)
+
+    print(f"{files} pending deletions")
+    print(f"sleeping tasks : {tasks_bytes / 1024 / 1024:7.1f} MiB")
+    print(f"sweeper heap   : {heap_bytes / 1024 / 1024:7.1f} MiB  x{tasks_bytes / heap_bytes:.1f} less")
+    print(f"one sweep      : {elapsed:7.3f}s  {files / elapsed:9.0f} files/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.files))
+
+
+if __name__ == "__main__":
+    main()
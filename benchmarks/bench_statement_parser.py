@@ -0,0 +1,72 @@
+"""
+Throughput (lines/sec) of BankStatementParserV1 extraction against the
+previous per-line implementation on a large synthetic statement.
+
+Usage:
+    python -m benchmarks.bench_statement_parser --lines 100000
+"""
+
+import argparse
+import re
+import time
+from typing import Dict, List
+
+from backend.app.modules.ingest.bank_statement_parser_v1 import BankStatementParserV1
+from tests.synthetic import statement_text
+
+
+def _legacy_extract(text: str) -> List[Dict]:
+    """The pre-optimisation implementation, kept here as the baseline."""
+    results: List[Dict] = []
+    line_regex = re.compile(
+        r"""(?P<date>\d{4}[-/]\d{2}[-/]\d{2})\s+   # date
+            (?P<description>.+?)\s+                # description
+            (?P<amount>-?\d+(?:\.\d{2})?)          # amount, optional minus
+        """,
+        re.VERBOSE,
+    )
+    for line in text.splitlines():
+        match = line_regex.search(line)
+        if match:
+            results.append(
+                {
+                    "date": match.group("date"),
+                    "description": match.group("description").strip(),
+                    "amount": float(match.group("amount")),
+                }
+            )
+    return results
+
+
+def _bench(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = statement_text(args.lines)
+    line_count = text.count("\n") + 1
+    statement_parser = BankStatementParserV1()
+    assert statement_parser.extract(text) == _legacy_extract(text)
+
+    cases = {
+        "legacy per-line": lambda: _legacy_extract(text),
+        "extract()": lambda: statement_parser.extract(text),
+        "iter_extract()": lambda: sum(1 for _ in statement_parser.iter_extract(text)),
+    }
+    for name, fn in cases.items():
+        elapsed = _bench(fn, args.repeat)
+        print(f"{name:>16}: {elapsed:7.3f}s  {line_count / elapsed:12,.0f} lines/sec")
+
+
+if __name__ == "__main__":
+    main()
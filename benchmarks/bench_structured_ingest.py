@@ -0,0 +1,62 @@
+"""
+Per-transaction cost of the structured (CSV, OFX) ingestion path against
+the PDF path for the same synthetic transactions.
+
+Usage:
+    python -m benchmarks.bench_structured_ingest --transactions 6000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from backend.app.services.pipeline import process_document
+from tests.synthetic import build_statement_pdf, statement_csv, statement_ofx
+
+LINES_PER_PAGE = 60
+
+
+def _bench(path: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process_document(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transactions", type=int, default=6000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = max(1, args.transactions // LINES_PER_PAGE)
+    count = pages * LINES_PER_PAGE
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {
+            "pdf": build_statement_pdf(os.path.join(tmp, "s.pdf"), pages, LINES_PER_PAGE),
+            "csv": os.path.join(tmp, "s.csv"),
+            "ofx": os.path.join(tmp, "s.ofx"),
+        }
+        with open(paths["csv"], "w", newline="") as fh:
+            fh.write(statement_csv(count))
+        with open(paths["ofx"], "w") as fh:
+            fh.write(statement_ofx(count))
+
+        print(f"{count} transactions, best of {args.repeat}")
+        baseline = None
+        for name in ("pdf", "csv", "ofx"):
+            found = len(process_document(paths[name])["transactions_normalized"])
+            seconds = _bench(paths[name], args.repeat)
+            per_txn = seconds / max(found, 1) * 1e6
+            baseline = baseline or per_txn
+            print(
+                f"{name:>4}: {seconds:8.3f}s  {per_txn:8.1f} µs/txn  "
+                f"x{baseline / per_txn:6.1f}  ({found} parsed)"
+            )
+
+
+if __name__ == "__main__":
+    main()
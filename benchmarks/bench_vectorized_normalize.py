@@ -0,0 +1,58 @@
+"""
+Normalising raw transactions: the per-row reference loop against the
+NumPy-vectorized path, across batch sizes, to place the crossover
+(VECTORIZE_MIN_ROWS) and measure bulk-backfill throughput.
+
+Usage:
+    python -m benchmarks.bench_vectorized_normalize --rows 200000
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+from backend.app.modules.normalize.normalizer import VECTORIZE_MIN_ROWS, normalize_batch
+from backend.app.modules.normalize.vectorized import normalize_batch_vectorized
+from tests.synthetic import statement_lines
+
+
+def _raw(rows: int) -> List[Dict]:
+    raw = []
+    for line in statement_lines(rows):
+        date, rest = line.split(" ", 1)
+        description, amount = rest.rsplit(" ", 1)
+        raw.append({"date": date, "description": description, "amount": amount})
+    return raw
+
+
+def _bench(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = sorted({8, 16, 32, 64, 256, 1_000, 10_000, args.rows})
+    print(f"VECTORIZE_MIN_ROWS = {VECTORIZE_MIN_ROWS}")
+    print(f"{'rows':>9} {'scalar':>12} {'vectorized':>12} {'speed-up':>9}")
+    for rows in sizes:
+        raw = _raw(rows)
+        scalar = normalize_batch(raw, vectorized=False)
+        assert normalize_batch_vectorized(raw).to_dicts() == scalar.to_dicts()
+        # Small batches are timed over more runs to get above timer noise
+        repeat = max(args.repeat, 20_000 // rows)
+        slow = _bench(lambda: normalize_batch(raw, vectorized=False), repeat)
+        fast = _bench(lambda: normalize_batch_vectorized(raw), repeat)
+        print(f"{rows:>9} {slow * 1e3:10.3f}ms {fast * 1e3:10.3f}ms {slow / fast:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
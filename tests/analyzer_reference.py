@@ -0,0 +1,87 @@
+"""
+Reference FamilyFinanceAnalyzer implementation and transaction generator.
+
+`legacy_analyze` is the multi-pass analysis that the single-pass
+accumulator replaced; tests check the current analyzer against it, and
+bench_family_analyzer times both.
+"""
+
+import random
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from backend.app.modules.analysis.constants import CHILD_SPEND_KEYWORDS, FIXED_EXPENSE_KEYWORDS
+
+DESCRIPTIONS = [
+    "RENT PAYMENT", "ELECTRIC BILL", "WOOLWORTHS SUPERMARKET", "KIDS TOY SHOP",
+    "CITY SCHOOL TUITION", "NETFLIX SUBSCRIPTION", "CORNER CAFE", "FUEL STATION",
+    "HOME INSURANCE", "BABY DIAPER DEPOT", "UBER TRIP", None,
+]
+
+
+@dataclass(slots=True)
+class MemberTransaction:
+    """The fields the analyzer reads, without model validation overhead."""
+    member: str
+    date: date
+    amount: float
+    description: Optional[str]
+
+
+def legacy_analyze(transactions) -> List[Dict[str, Any]]:
+    """The pre-optimisation implementation, the reference for equivalence checks."""
+    def is_fixed(description):
+        lowered = description.lower()
+        return any(word in lowered for word in FIXED_EXPENSE_KEYWORDS)
+
+    def is_child_related(description):
+        lowered = description.lower()
+        return any(word in lowered for word in CHILD_SPEND_KEYWORDS)
+
+    groups = defaultdict(list)
+    for tx in transactions:
+        groups[(tx.member, tx.date.strftime("%Y-%m"))].append(tx)
+    summaries = []
+    for (family, month), txs in groups.items():
+        income = sum(tx.amount for tx in txs if tx.amount > 0)
+        expenses = -sum(tx.amount for tx in txs if tx.amount < 0)
+        fixed = sum(-tx.amount for tx in txs if tx.amount < 0 and is_fixed(tx.description or ""))
+        variable = expenses - fixed
+        surplus = income - expenses
+        savings_rate = (surplus / income * 100) if income else 0.0
+        child_spend = sum(
+            -tx.amount for tx in txs if tx.amount < 0 and is_child_related(tx.description or "")
+        )
+        child_spend_pct = (child_spend / expenses * 100) if expenses else 0.0
+        summaries.append({
+            "family": family,
+            "month": month,
+            "income": round(income, 2),
+            "fixed_expenses": round(fixed, 2),
+            "variable_expenses": round(variable, 2),
+            "surplus": round(surplus, 2),
+            "savings_rate": round(savings_rate, 2),
+            "child_spend_pct": round(child_spend_pct, 2),
+        })
+    return summaries
+
+
+def transactions(families: int, months: int, rows: int, seed: int = 7) -> List[MemberTransaction]:
+    """Interleaved families, as rows come back from a table scan ordered by date."""
+    rng = random.Random(seed)
+    result = []
+    for month in range(months):
+        for _ in range(rows):
+            for family in range(families):
+                result.append(MemberTransaction(
+                    member=f"family-{family}",
+                    date=date(2020 + month // 12, month % 12 + 1, rng.randint(1, 28)),
+                    amount=rng.choice([
+                        rng.randint(1, 900) / 1.0, -rng.randint(1, 90000) / 100, 0,
+                        -rng.randint(1, 400),
+                    ]),
+                    description=rng.choice(DESCRIPTIONS),
+                ))
+    return result
@@ -0,0 +1,245 @@
+"""
+Synthetic statement fixtures shared by the test suite and the benchmark
+scripts.
+
+Everything here is deterministic (seeded) and uses fake data only –
+no real account numbers, names or merchants are ever generated.
+"""
+
+import random
+from typing import List
+
+DESCRIPTIONS = [
+    "WOOLWORTHS SUPERMARKET",
+    "UBER TRIP",
+    "NETFLIX.COM",
+    "RENT PAYMENT",
+    "ELECTRIC BILL",
+    "CITY PHARMACY",
+    "SALARY ACME PTY",
+    "CORNER CAFE",
+    "FUEL STATION",
+    "TRANSFER TO SAVINGS",
+]
+
+
+def statement_lines(count: int, seed: int = 7, start_year: int = 2021) -> List[str]:
+    """
+    Return `count` lines shaped like `DATE DESCRIPTION AMOUNT`, the format
+    understood by BankStatementParserV1.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        year = start_year + (i // 3000) % 5
+        month = (i // 250) % 12 + 1
+        day = i % 28 + 1
+        description = rng.choice(DESCRIPTIONS)
+        if description.startswith("SALARY"):
+            amount = f"{rng.randint(3000, 6000)}.00"
+        else:
+            amount = f"-{rng.randint(1, 900)}.{rng.randint(0, 99):02d}"
+        lines.append(f"{year:04d}-{month:02d}-{day:02d} {description} {amount}")
+    return lines
+
+
+def statement_text(count: int, seed: int = 7) -> str:
+    """Return a full synthetic statement (header + transaction lines)."""
+    header = ["Account statement", "Opening balance 1000.00", "Transaction history"]
+    return "\n".join(header + statement_lines(count, seed=seed))
+
+
+def statement_csv(count: int, seed: int = 7) -> str:
+    """
+    Return a CSV export (Date,Description,Debit,Credit) carrying the same
+    transactions as `statement_lines`, with day-first dates.
+    """
+    rows = ["Date,Description,Debit,Credit"]
+    for line in statement_lines(count, seed=seed):
+        date, rest = line.split(" ", 1)
+        description, amount = rest.rsplit(" ", 1)
+        year, month, day = date.split("-")
+        debit, credit = (amount[1:], "") if amount.startswith("-") else ("", amount)
+        rows.append(f"{day}/{month}/{year},{description},{debit},{credit}")
+    return "\n".join(rows) + "\n"
+
+
+def statement_ofx(count: int, seed: int = 7) -> str:
+    """
+    Return an OFX 1.x (SGML) export carrying the same transactions as
+    `statement_lines`. The account id is a fixed fake value.
+    """
+    parts = [
+        "OFXHEADER:100",
+        "DATA:OFXSGML",
+        "VERSION:102",
+        "",
+        "<OFX>",
+        "<BANKMSGSRSV1><STMTTRNRS><STMTRS>",
+        "<BANKACCTFROM><ACCTID>000000000000<ACCTTYPE>CHECKING</BANKACCTFROM>",
+        "<BANKTRANLIST>",
+    ]
+    for i, line in enumerate(statement_lines(count, seed=seed)):
+        date, rest = line.split(" ", 1)
+        description, amount = rest.rsplit(" ", 1)
+        kind = "DEBIT" if amount.startswith("-") else "CREDIT"
+        parts.append(
+            f"<STMTTRN><TRNTYPE>{kind}<DTPOSTED>{date.replace('-', '')}120000"
+            f"<TRNAMT>{amount}<FITID>{i}<NAME>{description}</STMTTRN>"
+        )
+    parts += ["</BANKTRANLIST>", "</STMTRS></STMTTRNRS></BANKMSGSRSV1>", "</OFX>"]
+    return "\n".join(parts) + "\n"
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _write_pdf(path: str, page_streams: List[List[str]]) -> str:
+    """
+    Write a minimal single-font (Helvetica) PDF whose pages carry the given
+    content-stream operators, and return the path.
+    """
+    objects: List[bytes] = []
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(b"")  # pages tree, filled in below
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    kids = []
+    for ops in page_streams:
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        )
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids),
+        len(kids),
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    with open(path, "wb") as fh:
+        fh.write(out)
+    return path
+
+
+def build_statement_pdf(
+    path: str,
+    pages: int,
+    lines_per_page: int = 60,
+    seed: int = 7,
+    filler_pages: int = 0,
+) -> str:
+    """
+    Write a minimal, text-only PDF statement to `path` and return the path.
+
+    Each page carries a header line followed by `lines_per_page`
+    transaction lines. `filler_pages` appends prose-only pages (terms and
+    conditions style) that contain no transactions.
+    """
+    lines = statement_lines(pages * lines_per_page, seed=seed)
+    page_lines: List[List[str]] = []
+    for p in range(pages):
+        chunk = lines[p * lines_per_page:(p + 1) * lines_per_page]
+        page_lines.append([f"Transaction history page {p + 1} balance"] + chunk)
+    for f in range(filler_pages):
+        page_lines.append(
+            [f"Terms and conditions section {f + 1}"]
+            + ["Please read these terms carefully before using your account."] * 40
+        )
+
+    page_streams = []
+    for content in page_lines:
+        ops = ["BT", "/F1 8 Tf", "10 TL", "30 810 Td"]
+        for line in content:
+            ops.append(f"({_escape(line)}) Tj T*")
+        ops.append("ET")
+        page_streams.append(ops)
+    return _write_pdf(path, page_streams)
+
+
+# Helvetica advance widths (per 1000 em) for the characters used in amounts
+_NUMERIC_WIDTHS = {".": 278, ",": 278, "-": 333}
+
+
+def _numeric_width(text: str, size: float) -> float:
+    return sum(_NUMERIC_WIDTHS.get(ch, 556) for ch in text) * size / 1000
+
+
+def _cell(text: str, x: float, y: float, size: float = 8, right: bool = False) -> str:
+    if right:
+        x -= _numeric_width(text, size)
+    return f"BT /F1 {size:g} Tf 1 0 0 1 {x:.2f} {y:.2f} Tm ({_escape(text)}) Tj ET"
+
+
+# Right edges of the numeric columns in `build_table_statement_pdf`
+TABLE_DEBIT_RIGHT = 400
+TABLE_CREDIT_RIGHT = 470
+TABLE_BALANCE_RIGHT = 560
+
+
+def build_table_statement_pdf(
+    path: str,
+    pages: int,
+    rows_per_page: int = 60,
+    seed: int = 7,
+    title: str = "Sample Bank statement",
+    filler_pages: int = 0,
+) -> str:
+    """
+    Write a multi-column PDF statement (Date | Description | Debit | Credit
+    | Balance) with every cell placed at absolute coordinates and amounts
+    right-aligned, as bank-generated statements are laid out. Transactions
+    are those of `statement_lines`; debits are shown unsigned. Each page
+    opens with `title`; `filler_pages` appends terms-and-conditions pages
+    whose fee lines carry dates and amounts but no table header.
+    """
+    lines = statement_lines(pages * rows_per_page, seed=seed)
+    balance = 1000.0
+    page_streams = []
+    for p in range(pages):
+        ops = [
+            _cell(f"{title} page {p + 1} of {pages}", 30, 810),
+            _cell("Date", 30, 790),
+            _cell("Description", 90, 790),
+            _cell("Debit", TABLE_DEBIT_RIGHT, 790, right=True),
+            _cell("Credit", TABLE_CREDIT_RIGHT, 790, right=True),
+            _cell("Balance", TABLE_BALANCE_RIGHT, 790, right=True),
+        ]
+        y = 778
+        for line in lines[p * rows_per_page:(p + 1) * rows_per_page]:
+            date, rest = line.split(" ", 1)
+            description, amount = rest.rsplit(" ", 1)
+            balance += float(amount)
+            ops.append(_cell(date, 30, y))
+            ops.append(_cell(description, 90, y))
+            if amount.startswith("-"):
+                ops.append(_cell(amount[1:], TABLE_DEBIT_RIGHT, y, right=True))
+            else:
+                ops.append(_cell(amount, TABLE_CREDIT_RIGHT, y, right=True))
+            ops.append(_cell(f"{balance:.2f}", TABLE_BALANCE_RIGHT, y, right=True))
+            y -= 12
+        page_streams.append(ops)
+    for f in range(filler_pages):
+        ops = [_cell(f"Terms and conditions section {f + 1}", 30, 790)]
+        for i in range(20):
+            ops.append(_cell("01/03/2024 Monthly fee from", 30, 770 - 12 * i))
+            ops.append(_cell("5.00", TABLE_DEBIT_RIGHT, 770 - 12 * i, right=True))
+        page_streams.append(ops)
+    return _write_pdf(path, page_streams)
@@ -0,0 +1,18 @@
+from backend.app.modules.ingest.bank_statement_parser_v1 import BankStatementParserV1
+
+
+def test_extract_takes_one_transaction_per_line():
+    text = (
+        "Opening balance\n"
+        "2024-01-02 CORNER CAFE -4.50 2024-01-03 IGNORED 9\r\n"
+        "2024/01/05   SALARY ACME   3000.00\n"
+        "2024-01-06\n"
+        "NETFLIX -15.99\n"
+    )
+    parser = BankStatementParserV1()
+    expected = [
+        {"date": "2024-01-02", "description": "CORNER CAFE", "amount": -4.5},
+        {"date": "2024/01/05", "description": "SALARY ACME", "amount": 3000.0},
+    ]
+    assert parser.extract(text) == expected
+    assert list(parser.iter_extract(text)) == expected
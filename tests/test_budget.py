@@ -49,3 +49,53 @@ def test_aggregate_and_analyze():
     assert isinstance(analysis["expense_ratio"], float)
     assert isinstance(analysis["health_score"], float)
     assert analysis["status"] in ("healthy", "warning", "risky", "critical")
+
+
+def test_vectorized_aggregation_matches_loop():
+    pytest.importorskip("numpy")
+    import random
+    from backend.app.modules.normalize.normalizer import normalize_batch
+
+    rng = random.Random(5)
+    raw = [
+        {
+            "date": f"2023-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "description": rng.choice(["Salary", "Groceries", "Uber", "Rent", "Misc"]),
+            "amount": rng.choice([-1, 1]) * rng.uniform(0, 3000),
+        }
+        for _ in range(1000)
+    ]
+    batch = normalize_batch(raw)
+    expected = aggregate_by_month(batch, vectorized=False)
+    # Same months, categories, insertion order and float sums
+    for transactions in (batch, list(batch)):
+        result = aggregate_by_month(transactions, vectorized=True)
+        assert result == expected
+        assert list(result) == list(expected)
+        assert all(
+            list(result[m]["categories"]) == list(expected[m]["categories"]) for m in expected
+        )
+    rows = list(batch)[:3]
+    rows[1].date = None  # malformed dates are skipped on both paths
+    assert aggregate_by_month(rows, vectorized=True) == aggregate_by_month(rows, vectorized=False)
+
+
+def test_budget_series_matches_per_month_analysis():
+    pytest.importorskip("numpy")
+    import random
+    from backend.app.modules.budget.analyzer import analyze_budget_series
+
+    rng = random.Random(9)
+    values = [0, -5, 100.0, 2999.99, 3000.0, float("nan"), float("inf"), 1e-300]
+    summaries = [
+        {
+            "income": rng.choice(values + [rng.uniform(-10, 9000)]),
+            "expenses": rng.choice(values + [rng.uniform(0, 9000)]),
+            "categories": rng.choice([{}, {"Food": 2.0, "Rent": 2.0}, {"Food": 1.0}]),
+        }
+        for _ in range(500)
+    ]
+    # repr keeps NaN and -0.0 distinguishable
+    expected = repr([analyze_budget(s) for s in summaries])
+    assert repr(analyze_budget_series(summaries, vectorized=True)) == expected
+    assert repr(analyze_budget_series(summaries, vectorized=False)) == expected
@@ -0,0 +1,112 @@
+import io
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from tests.synthetic import build_statement_pdf, statement_csv
+from backend.app.db.models import Document, MonthlySummary, Transaction
+from backend.app.db.repositories.family_repo import create_family
+from backend.app.services.extraction_cache import ExtractionCache, file_sha256
+from backend.app.tools import bulk_import
+from backend.app.tools.bulk_import import run_import
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_persists_all_files(tmp_path, async_engine):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        async with session.begin():
+            family = await create_family(session, name="Bulk")
+    for n in range(3):
+        build_statement_pdf(str(tmp_path / f"s{n}.pdf"), pages=1, lines_per_page=4, seed=n)
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    stats = await run_import(
+        str(tmp_path), family.id, workers=2, batch_size=2,
+        session_factory=factory, out=io.StringIO(),
+    )
+    assert stats["files"] == 3
+    assert stats["transactions"] == 12
+
+    async with factory() as session:
+        docs = await session.scalar(
+            select(func.count()).select_from(Document).where(Document.family_id == family.id)
+        )
+        txns = await session.scalar(
+            select(func.count()).select_from(Transaction).where(Transaction.family_id == family.id)
+        )
+        summary = await session.scalar(
+            select(MonthlySummary).where(MonthlySummary.family_id == family.id)
+        )
+    assert (docs, txns) == (3, 12)
+    assert summary.month == "2021-01"
+
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_records_source_type(tmp_path, async_engine):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        async with session.begin():
+            family = await create_family(session, name="Bulk formats")
+    build_statement_pdf(str(tmp_path / "s.pdf"), pages=1, lines_per_page=4)
+    (tmp_path / "s.csv").write_text(statement_csv(4, seed=2))
+
+    await run_import(str(tmp_path), family.id, session_factory=factory, out=io.StringIO())
+    async with factory() as session:
+        rows = (await session.execute(
+            select(Document.filename, Document.source_type).where(Document.family_id == family.id)
+        )).all()
+    assert sorted(rows) == [("s.csv", "csv"), ("s.pdf", "pdf")]
+
+@pytest.mark.asyncio
+async def test_bulk_import_rejects_unknown_family(tmp_path, async_engine):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    with pytest.raises(ValueError):
+        await run_import(str(tmp_path), "missing", session_factory=factory, out=io.StringIO())
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_processes_repeated_content_once(tmp_path, async_engine, monkeypatch):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        async with session.begin():
+            family = await create_family(session, name="Bulk repeat")
+    original = build_statement_pdf(str(tmp_path / "a.pdf"), pages=1, lines_per_page=4)
+    shutil.copyfile(original, tmp_path / "b.pdf")
+    build_statement_pdf(str(tmp_path / "c.pdf"), pages=1, lines_per_page=4, seed=3)
+    processed = []
+    process = bulk_import._process_file
+
+    def recording_process(path):
+        processed.append(path)
+        return process(path)
+
+    # Threads instead of processes, so the recording wrapper is what runs
+    monkeypatch.setattr(bulk_import, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(bulk_import, "_process_file", recording_process)
+
+    cache = ExtractionCache()
+    stats = await run_import(
+        str(tmp_path), family.id, session_factory=factory, out=io.StringIO(), cache=cache
+    )
+    assert (stats["files"], stats["transactions"]) == (3, 12)
+    assert sorted(processed) == [str(tmp_path / "a.pdf"), str(tmp_path / "c.pdf")]
+
+    # A second import of the same files is served entirely from the cache
+    processed.clear()
+    await run_import(
+        str(tmp_path), family.id, session_factory=factory, out=io.StringIO(), cache=cache
+    )
+    assert processed == []
+    assert cache.stats()["hits"] == 2
+
+    async with factory() as session:
+        digests = (await session.scalars(
+            select(Document.content_sha256).where(Document.family_id == family.id)
+        )).all()
+    assert digests.count(file_sha256(original)) == 4
+
@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.app.db.repositories.breach_repo import list_breaches
+from backend.app.db.repositories.document_repo import create_document
+from backend.app.db.repositories.family_repo import create_family
+from backend.app.db.repositories.summary_repo import (
+    add_documents_to_summaries,
+    apply_monthly_deltas,
+    list_category_summaries,
+)
+from backend.app.db.repositories.transaction_repo import bulk_create_transactions
+from backend.app.tools.category_limits import run_evaluation
+
+
+def _month(income, **categories):
+    return {
+        "income": income,
+        "expenses": sum(categories.values()),
+        "transactions": len(categories),
+        "categories": {
+            name: {"total": total, "expenses": total, "transactions": 1}
+            for name, total in categories.items()
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_breaches_are_flagged_per_chunk_and_replaced(async_engine):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        async with session.begin():
+            over = await create_family(session, name="Over")
+            within = await create_family(session, name="Within")
+            await apply_monthly_deltas(session, over.id, {
+                "2024-01": _month(4000.0, Housing=1500.0, Food=700.0, Other=2000.0),
+                "2024-02": _month(0.0, Transport=50.0),
+            })
+            await apply_monthly_deltas(session, within.id, {
+                "2024-01": _month(4000.0, Housing=1400.0, Food=800.0, Transport=600.0),
+            })
+
+    # A zero budget starts no chunk; resuming from its cursor finishes the run
+    stats = await run_evaluation(factory, time_budget=0)
+    assert (stats["complete"], stats["families"], stats["last_family_id"]) == (False, 0, None)
+    stats = await run_evaluation(factory, chunk_size=1, resume_after=stats["last_family_id"])
+    assert stats["complete"] and stats["chunks"] == stats["families"] >= 2
+
+    async with factory() as session:
+        breaches = await list_breaches(session, over.id)
+        assert await list_breaches(session, within.id) == []
+    assert [(b.month, b.category, b.limit_share) for b in breaches] == [
+        ("2024-02", "Transport", 0.15),
+        ("2024-01", "Housing", 0.35),
+    ]
+    assert breaches[1].share == pytest.approx(0.375) and breaches[0].share is None
+
+    # Re-evaluating replaces rather than duplicates, and drops resolved breaches
+    async with factory() as session:
+        async with session.begin():
+            await apply_monthly_deltas(session, over.id, {"2024-01": _month(1000.0)})
+    await run_evaluation(factory)
+    async with factory() as session:
+        breaches = await list_breaches(session, over.id)
+    assert [(b.month, b.category) for b in breaches] == [("2024-02", "Transport")]
+
+
+@pytest.mark.asyncio
+async def test_refunds_do_not_count_as_spend(async_engine):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        async with session.begin():
+            family = await create_family(session, name="Refunds")
+            doc = await create_document(session, family.id, "statement.csv")
+            await bulk_create_transactions(session, doc.id, family.id, [
+                {"date": "2024-03-01", "description": "SALARY ACME PTY", "amount": 2000.0},
+                {"date": "2024-03-05", "description": "GROCERY STORE", "amount": -300.0},
+                {"date": "2024-03-09", "description": "GROCERY STORE REFUND", "amount": 200.0},
+            ])
+            await add_documents_to_summaries(session, family.id, [doc.id])
+
+    await run_evaluation(factory)
+    async with factory() as session:
+        food = await list_category_summaries(session, family.id, "2024-03")
+        assert await list_breaches(session, family.id) == []
+    # Food moved 500 in total, 300 of it spent: within 20% of the 2200 income
+    assert [(c.category, c.total, c.expense_total) for c in food if c.category == "Food"] == [
+        ("Food", 500.0, 300.0)
+    ]
@@ -0,0 +1,72 @@
+import random
+
+from backend.app.modules.normalize import category_rules
+from backend.app.modules.normalize.category_cache import CategorizationCache
+from backend.app.modules.normalize.category_rules import CategoryMatcher, categorize
+
+
+def _loop(rules, lowered):
+    for category, keywords in rules.items():
+        for kw in keywords:
+            if kw in lowered:
+                return category
+    return None
+
+
+def test_automaton_keeps_first_rule_wins():
+    rng = random.Random(1)
+    words = ["ab", "abc", "bc", "c", "cab", "bca", "aaa", "ba"]
+    for _ in range(200):
+        rules = {f"cat{i}": rng.sample(words, rng.randint(1, 3)) for i in range(rng.randint(1, 5))}
+        matcher = CategoryMatcher(rules, min_automaton_keywords=0)
+        assert matcher.automaton is not None
+        for _ in range(20):
+            text = "".join(rng.choice("abc ") for _ in range(rng.randint(0, 12)))
+            assert matcher.match(text) == _loop(rules, text)
+
+
+def test_categorize_follows_rule_changes(monkeypatch):
+    assert categorize("UBER EATS order") == ("Food", 0.6)  # Food listed before Transport
+    assert categorize("Bakery") == ("Other", 0.3)
+    rules = dict(category_rules.CATEGORY_RULES, Food=["bakery"])
+    monkeypatch.setattr(category_rules, "CATEGORY_RULES", rules)
+    assert categorize("Bakery") == ("Food", 0.6)
+    rules["Food"].append("uber eats")
+    assert categorize("UBER EATS order") == ("Food", 0.6)
+
+
+def test_categorize_follows_in_place_keyword_edits(monkeypatch):
+    rules = {category: list(kws) for category, kws in category_rules.CATEGORY_RULES.items()}
+    monkeypatch.setattr(category_rules, "CATEGORY_RULES", rules)
+    fingerprint = category_rules.get_category_matcher().fingerprint
+    assert categorize("ALDI 0042") == ("Other", 0.3)
+    rules["Food"][0] = "aldi"  # same list, same length
+    assert categorize("ALDI 0042") == ("Food", 0.6)
+    assert category_rules.get_category_matcher().fingerprint != fingerprint
+
+
+def test_cache_counts_and_expires_entries():
+    now = [0.0]
+    cache = CategorizationCache(max_entries=2, ttl_seconds=60, clock=lambda: now[0])
+    matcher = CategoryMatcher({"Food": ["woolworths"], "Shops": ["7-eleven"]})
+    assert matcher.canonical("WOOLWORTHS 1234") == "woolworths 1234"  # a keyword has digits
+    for description in ("Woolworths", "WOOLWORTHS", "Cinema", "7-Eleven"):
+        categorize(description, matcher, cache)
+    assert cache.stats() == {
+        "hits": 1, "misses": 3, "evictions": 1, "invalidations": 0, "entries": 2,
+    }
+    now[0] = 61
+    assert categorize("7-ELEVEN", matcher, cache) == ("Shops", 0.6)
+    assert cache.evictions == 2 and cache.misses == 4
+
+
+def test_cache_is_invalidated_by_rule_changes(monkeypatch):
+    cache = CategorizationCache()
+    assert categorize("WOOLWORTHS 1234", cache=cache) == ("Other", 0.3)
+    assert categorize("Woolworths 0042", cache=cache) == ("Other", 0.3)
+    assert cache.hits == 1  # digit runs share one canonical key
+    monkeypatch.setattr(
+        category_rules, "CATEGORY_RULES", dict(category_rules.CATEGORY_RULES, Food=["woolworths"])
+    )
+    assert categorize("WOOLWORTHS 1234", cache=cache) == ("Food", 0.6)
+    assert cache.invalidations == 1
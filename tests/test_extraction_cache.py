@@ -0,0 +1,47 @@
+from tests.synthetic import build_statement_pdf
+from backend.app.services import pipeline
+from backend.app.services.extraction_cache import CachedExtraction, ExtractionCache
+from backend.app.modules.normalize.schema import NormalizedTransaction
+
+
+def test_repeat_upload_skips_extraction(tmp_path, monkeypatch):
+    path = build_statement_pdf(str(tmp_path / "s.pdf"), pages=2, lines_per_page=4)
+    cache = ExtractionCache()
+    first = pipeline.process_pdf(path, cache=cache)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("extraction should be skipped on a cache hit")
+
+    monkeypatch.setattr(pipeline, "_extract_normalized", _fail)
+    second = pipeline.process_pdf(path, cache=cache)
+    assert second == first
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_by_entry_count():
+    cache = ExtractionCache(max_entries=2)
+    txn = NormalizedTransaction("i", "2024-01-01", "CAFE", -1.0, "expense", "Food")
+    entry = CachedExtraction((), (txn,))
+    cache.put("a", entry)
+    cache.put("b", entry)
+    assert cache.get("a") is entry  # "b" becomes least recently used
+    cache.put("c", entry)
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 2
+
+
+def test_cached_batches_are_not_shared_with_callers(tmp_path):
+    path = build_statement_pdf(str(tmp_path / "s.pdf"), pages=1, lines_per_page=4)
+    cache = ExtractionCache()
+    first = pipeline.process_pdf(path, cache=cache, columnar=True)["transactions_normalized"]
+    expected = first.to_dicts()
+    first.append("x", "2024-01-01", "EXTRA", -1.0, "expense", "Other")
+
+    hit = pipeline.process_pdf(path, cache=cache, columnar=True)["transactions_normalized"]
+    assert hit.to_dicts() == expected
+    hit.amounts[0] = 0.0
+    hit.categories.append("Changed")
+    again = pipeline.process_pdf(path, cache=cache, columnar=True)["transactions_normalized"]
+    assert again.to_dicts() == expected
@@ -0,0 +1,45 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from backend.app.modules.analysis import FamilyFinanceAnalyzer
+from backend.app.modules.normalize.schemas import NormalizedTransaction
+from tests.analyzer_reference import legacy_analyze, transactions
+
+
+def _tx(member, day, amount, description):
+    return NormalizedTransaction(
+        date=day, amount=amount, category="x", member=member, recurring=False,
+        description=description,
+    )
+
+
+def test_analyze_single_pass_summary():
+    txs = [
+        _tx("a", date(2024, 1, 2), 3000.0, "Salary"),
+        _tx("a", date(2024, 1, 3), -1200.0, "RENT payment"),
+        _tx("a", date(2024, 1, 9), -300.0, "School tuition"),
+        _tx("b", date(2024, 1, 9), -50.0, None),
+        _tx("a", date(2024, 2, 1), -80.0, "Kids toy"),
+    ]
+    assert FamilyFinanceAnalyzer.analyze(txs) == [
+        {"family": "a", "month": "2024-01", "income": 3000.0, "fixed_expenses": 1200.0,
+         "variable_expenses": 300.0, "surplus": 1500.0, "savings_rate": 50.0,
+         "child_spend_pct": 20.0},
+        {"family": "b", "month": "2024-01", "income": 0, "fixed_expenses": 0,
+         "variable_expenses": 50.0, "surplus": -50.0, "savings_rate": 0.0,
+         "child_spend_pct": 0.0},
+        {"family": "a", "month": "2024-02", "income": 0, "fixed_expenses": 0,
+         "variable_expenses": 80.0, "surplus": -80.0, "savings_rate": 0.0,
+         "child_spend_pct": 100.0},
+    ]
+
+
+def test_analyze_and_analyze_many_are_byte_identical_to_reference():
+    txs = transactions(families=7, months=3, rows=15, seed=11)
+    expected = json.dumps(legacy_analyze(txs))
+    assert json.dumps(FamilyFinanceAnalyzer.analyze(txs)) == expected
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        sharded = FamilyFinanceAnalyzer.analyze_many(txs, workers=3, executor=pool)
+    assert json.dumps(sharded) == expected
+    assert FamilyFinanceAnalyzer.analyze_many([], workers=2) == []
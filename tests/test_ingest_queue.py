@@ -0,0 +1,226 @@
+import asyncio
+import os
+import shutil
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from tests.synthetic import build_statement_pdf
+from backend.app.api import routes
+from backend.app.db.models import IngestJob, Membership, Transaction
+from backend.app.db.repositories.document_repo import create_document, get_document
+from backend.app.db.repositories.family_repo import create_family
+from backend.app.db.repositories.job_repo import (
+    claim_job,
+    create_job,
+    get_job,
+    get_latest_job_for_document,
+)
+from backend.app.main import app
+from backend.app.services import ingest_queue
+from backend.app.services.extraction_cache import ExtractionCache, file_sha256
+from backend.app.services.ingest_queue import IngestQueue
+
+
+async def _queued_document(factory, file_path, content_sha256=None):
+    async with factory() as session:
+        async with session.begin():
+            family = await create_family(session, name="Queue")
+            doc = await create_document(
+                session, family.id, "s.pdf", status="queued", content_sha256=content_sha256
+            )
+            job = await create_job(session, doc.id, family.id, file_path)
+    return family.id, doc.id, job.id
+
+
+@pytest.mark.asyncio
+async def test_queue_resumes_and_processes_jobs(tmp_path, async_engine):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    ok_path = build_statement_pdf(str(tmp_path / "ok.pdf"), pages=1, lines_per_page=3)
+    family_id, doc_id, _ = await _queued_document(factory, ok_path)
+    _, missing_doc_id, _ = await _queued_document(factory, str(tmp_path / "gone.pdf"))
+
+    queue = IngestQueue(session_factory=factory, executor=ThreadPoolExecutor(1), concurrency=1)
+    assert await queue.start() >= 2  # both jobs picked up from the table
+    await queue.join()
+    await queue.stop()
+
+    async with factory() as session:
+        assert (await get_document(session, family_id, doc_id)).status == "processed"
+        txns = await session.scalar(
+            select(func.count()).select_from(Transaction).where(Transaction.document_id == doc_id)
+        )
+        failed_job = await get_latest_job_for_document(session, missing_doc_id)
+    assert txns == 3
+    assert failed_job.status == "failed"
+    assert not os.path.exists(ok_path)  # temp upload removed once processed
+
+
+@pytest.mark.asyncio
+async def test_job_run_twice_is_persisted_once(tmp_path, async_engine, monkeypatch):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    dispatched = []
+    process = ingest_queue.process_pdf
+
+    def counting_process(*args, **kwargs):
+        dispatched.append(args[0])
+        return process(*args, **kwargs)
+
+    monkeypatch.setattr(ingest_queue, "process_pdf", counting_process)
+    path = build_statement_pdf(str(tmp_path / "twice.pdf"), pages=1, lines_per_page=3)
+    family_id, doc_id, job_id = await _queued_document(factory, path)
+
+    # Two queues stand in for two app processes sharing the database
+    queues = [
+        IngestQueue(session_factory=factory, executor=ThreadPoolExecutor(1), concurrency=1)
+        for _ in range(2)
+    ]
+    await asyncio.gather(*(queue.run_job(job_id) for queue in queues))
+    await queues[0].run_job(job_id)
+    for queue in queues:
+        await queue.stop()
+
+    async with factory() as session:
+        txns = await session.scalar(
+            select(func.count()).select_from(Transaction).where(Transaction.document_id == doc_id)
+        )
+        job = await get_job(session, job_id)
+        document = await get_document(session, family_id, doc_id)
+    assert dispatched == [path]
+    assert txns == 3
+    assert (job.status, job.attempts, document.status) == ("done", 1, "processed")
+
+
+@pytest.mark.asyncio
+async def test_only_stale_processing_jobs_are_resumed(tmp_path, async_engine, monkeypatch):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    path = build_statement_pdf(str(tmp_path / "stale.pdf"), pages=1, lines_per_page=3)
+    family_id, doc_id, job_id = await _queued_document(factory, path)
+    async with factory() as session:
+        async with session.begin():
+            stale_claim = await claim_job(session, job_id)
+
+    queue = IngestQueue(session_factory=factory, executor=ThreadPoolExecutor(1), concurrency=1)
+    monkeypatch.setattr(queue, "run_job", lambda job_id: asyncio.sleep(0))
+    await queue.start()
+    resumed = [queue._queue.get_nowait() for _ in range(queue.depth())]
+    await queue.stop()
+    assert job_id not in resumed  # its worker is still alive
+
+    async with factory() as session:
+        async with session.begin():
+            job = await get_job(session, job_id)
+            job.updated_at = datetime.utcnow() - timedelta(hours=1)
+    queue = IngestQueue(session_factory=factory, executor=ThreadPoolExecutor(1), concurrency=1)
+    await queue.start()
+    await queue.join()
+    await queue.stop()
+
+    async with factory() as session:
+        job = await get_job(session, job_id)
+        assert (await get_document(session, family_id, doc_id)).status == "processed"
+    assert (job.status, job.attempts) == ("done", 2)
+    assert job.claimed_at != stale_claim
+
+
+@pytest.mark.asyncio
+async def test_persist_errors_retry_then_fail(tmp_path, async_engine, monkeypatch):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    persist = ingest_queue.bulk_create_transactions
+    calls = []
+
+    async def flaky_persist(session, document_id, *args):
+        calls.append(document_id)
+        if document_id == broken_doc_id or calls.count(document_id) == 1:
+            raise RuntimeError("persist failed")
+        return await persist(session, document_id, *args)
+
+    monkeypatch.setattr(ingest_queue, "bulk_create_transactions", flaky_persist)
+    flaky_path = build_statement_pdf(str(tmp_path / "flaky.pdf"), pages=1, lines_per_page=3)
+    broken_path = build_statement_pdf(str(tmp_path / "broken.pdf"), pages=1, lines_per_page=3)
+    family_id, flaky_doc_id, flaky_job_id = await _queued_document(factory, flaky_path)
+    broken_family_id, broken_doc_id, broken_job_id = await _queued_document(factory, broken_path)
+
+    queue = IngestQueue(
+        session_factory=factory, executor=ThreadPoolExecutor(1), concurrency=1, max_attempts=2
+    )
+    queue.submit(flaky_job_id)
+    queue.submit(broken_job_id)
+    await queue.join()
+    await queue.stop()
+
+    async with factory() as session:
+        assert (await get_document(session, family_id, flaky_doc_id)).status == "processed"
+        assert (await get_document(session, broken_family_id, broken_doc_id)).status == "failed"
+        flaky_job = await get_latest_job_for_document(session, flaky_doc_id)
+        broken_job = await get_latest_job_for_document(session, broken_doc_id)
+    assert (flaky_job.status, flaky_job.attempts) == ("done", 2)
+    assert (broken_job.status, broken_job.error) == ("failed", "RuntimeError")
+    assert calls.count(broken_doc_id) == 2
+    assert not os.path.exists(broken_path)
+
+
+@pytest.mark.asyncio
+async def test_repeat_upload_is_served_from_cache(tmp_path, async_engine, monkeypatch):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    dispatched = []
+    process = ingest_queue.process_pdf
+
+    def counting_process(*args, **kwargs):
+        dispatched.append(args[0])
+        return process(*args, **kwargs)
+
+    monkeypatch.setattr(ingest_queue, "process_pdf", counting_process)
+    first_path = build_statement_pdf(str(tmp_path / "first.pdf"), pages=1, lines_per_page=3)
+    repeat_path = str(tmp_path / "repeat.pdf")
+    shutil.copyfile(first_path, repeat_path)
+    sha = file_sha256(first_path)
+    _, first_doc_id, first_job_id = await _queued_document(factory, first_path, sha)
+    family_id, repeat_doc_id, repeat_job_id = await _queued_document(factory, repeat_path, sha)
+
+    cache = ExtractionCache()
+    queue = IngestQueue(
+        session_factory=factory, executor=ThreadPoolExecutor(1), concurrency=1, cache=cache
+    )
+    await queue.run_job(first_job_id)
+    await queue.run_job(repeat_job_id)
+    await queue.stop()
+
+    assert dispatched == [first_path]
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+    async with factory() as session:
+        assert (await get_document(session, family_id, repeat_doc_id)).status == "processed"
+        txns = await session.scalar(
+            select(func.count()).select_from(Transaction)
+            .where(Transaction.document_id == repeat_doc_id)
+        )
+    assert txns == 3
+    assert not os.path.exists(repeat_path)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        health = (await client.get("/health")).json()
+    assert set(health["extraction_cache"]) >= {"hits", "misses"}
+
+@pytest.mark.asyncio
+async def test_upload_returns_queued_document(db_session, monkeypatch):
+    submitted = []
+    monkeypatch.setattr(routes.ingest_queue, "submit", submitted.append)
+    family = await create_family(db_session, name="Upload")
+    db_session.add(Membership(user_id="u1", family_id=family.id))
+    await db_session.commit()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post(
+            f"/api/documents/upload?family_id={family.id}",
+            files={"file": ("s.pdf", b"%PDF-1.4\n", "application/pdf")},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["status"] == "queued"
+        status = await client.get(f"/api/documents/{family.id}/{body['id']}/status")
+    assert status.json()["status"] == "queued"
+    assert len(submitted) == 1
@@ -0,0 +1,98 @@
+import pdfplumber
+
+from backend.app.modules.ingest.layout import (
+    ColumnMapCache,
+    detect_column_map,
+    extract_table_transactions,
+    group_lines,
+    read_words,
+)
+from backend.app.services.pipeline import process_pdf
+from tests.synthetic import build_statement_pdf, build_table_statement_pdf, statement_lines
+
+
+def _word(text, x0, top):
+    return {"text": text, "x0": x0, "x1": x0 + 6 * len(text), "top": top}
+
+
+def test_detect_column_map_assigns_debit_and_credit():
+    words = [
+        _word("Date", 10, 10), _word("Details", 80, 10),
+        _word("Withdrawals", 300, 10), _word("Deposits", 400, 10),
+        _word("05/02/2024", 10, 30), _word("CORNER", 80, 30), _word("CAFE", 124, 31),
+        _word("4.50", 342, 30),
+        _word("06/02/2024", 10, 50), _word("SALARY", 80, 50), _word("3,000.00", 400, 50),
+    ]
+    column_map = detect_column_map(group_lines(words))
+    assert column_map.rows(group_lines(words)) == [
+        {"date": "2024-02-05", "description": "CORNER CAFE", "amount": -4.5},
+        {"date": "2024-02-06", "description": "SALARY", "amount": 3000.0},
+    ]
+
+
+def test_column_map_is_analysed_once_per_template(tmp_path):
+    first = build_table_statement_pdf(str(tmp_path / "a.pdf"), pages=3, rows_per_page=10)
+    second = build_table_statement_pdf(str(tmp_path / "b.pdf"), pages=2, rows_per_page=10, seed=3)
+    cache = ColumnMapCache()
+
+    rows = extract_table_transactions(first, cache=cache)
+    extract_table_transactions(second, cache=cache)
+
+    expected = []
+    for line in statement_lines(30):
+        date, rest = line.split(" ", 1)
+        description, amount = rest.rsplit(" ", 1)
+        expected.append({"date": date, "description": description, "amount": float(amount)})
+    assert rows == expected
+    assert cache.stats()["detections"] == 1
+    assert cache.stats()["hits"] == 4
+
+
+def test_column_map_is_shared_across_customers(tmp_path):
+    first = build_table_statement_pdf(str(tmp_path / "a.pdf"), pages=2, rows_per_page=10)
+    second = build_table_statement_pdf(
+        str(tmp_path / "b.pdf"), pages=2, rows_per_page=10, title="Ms J Doe, 1 High St"
+    )
+    cache = ColumnMapCache()
+
+    extract_table_transactions(first, cache=cache)
+    rows = extract_table_transactions(second, cache=cache)
+
+    assert len(rows) == 20
+    assert cache.stats()["detections"] == 1
+
+
+def test_pages_without_a_table_are_not_analysed(tmp_path):
+    path = build_table_statement_pdf(
+        str(tmp_path / "t.pdf"), pages=2, rows_per_page=10, filler_pages=3
+    )
+    cache = ColumnMapCache()
+
+    # The fee lines on the terms pages are not read as transactions
+    assert len(extract_table_transactions(path, cache=cache)) == 20
+    assert len(extract_table_transactions(path, cache=cache)) == 20
+    assert cache.stats()["detections"] == 1
+
+
+def test_read_words_matches_full_word_extraction(tmp_path):
+    path = build_table_statement_pdf(str(tmp_path / "t.pdf"), pages=1, rows_per_page=10)
+    with pdfplumber.open(path) as pdf:
+        page = pdf.pages[0]
+        quick, full = read_words(page), page.extract_words()
+    assert [w["text"] for w in quick] == [w["text"] for w in full]
+    for a, b in zip(quick, full):
+        assert abs(a["x0"] - b["x0"]) < 0.01 and abs(a["x1"] - b["x1"]) < 0.01
+        assert abs(a["top"] - b["top"]) < 0.01
+
+
+def test_layout_mode_falls_back_to_text_without_a_table(tmp_path):
+    path = build_statement_pdf(str(tmp_path / "s.pdf"), pages=1, lines_per_page=10)
+    assert extract_table_transactions(path, cache=None) is None
+    assert process_pdf(path, layout=True) == process_pdf(path)
+
+
+def test_layout_mode_reads_debits_as_expenses(tmp_path):
+    path = build_table_statement_pdf(str(tmp_path / "t.pdf"), pages=1, rows_per_page=20)
+    transactions = process_pdf(path, layout=True)["transactions_normalized"]
+    expected = [float(line.rsplit(" ", 1)[1]) for line in statement_lines(20)]
+    assert [t["amount"] for t in transactions] == expected
@@ -0,0 +1,17 @@
+from backend.app.core.lru import BoundedLRU
+
+
+def test_bounded_lru_evicts_by_count_size_and_age():
+    now = [0.0]
+    cache = BoundedLRU(max_entries=3, max_size=10, ttl_seconds=5, clock=lambda: now[0])
+    cache.put("a", 1, size=4)
+    cache.put("b", 2, size=4)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3, size=4)  # 12 > 10: "b" goes
+    assert cache.get("b") is None
+    cache.put("huge", 4, size=11)  # larger than the bound on its own
+    assert cache.get("huge") is None
+
+    now[0] = 6.0
+    assert cache.get("a") is None  # expired
+    assert cache.stats() == {"hits": 1, "misses": 3, "evictions": 2, "entries": 1}
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.app.db.models import Merchant
+from backend.app.db.repositories import merchant_repo
+from backend.app.db.repositories.transaction_repo import bulk_create_transactions, list_transactions
+from backend.app.modules.normalize import category_rules
+from backend.app.modules.normalize.category_rules import CategoryMatcher
+from backend.app.modules.normalize.merchants import MERCHANT_KEY_LENGTH, merchant_key
+
+
+def test_merchant_key_masks_store_numbers():
+    assert merchant_key("WOOLWORTHS 1234 Sydney") == "woolworths # sydney"
+    assert merchant_key("Woolworths 0042 SYDNEY") == "woolworths # sydney"
+    # Digits are kept when a keyword has them: "7-eleven" is not "8-eleven"
+    matcher = CategoryMatcher({"Shops": ["7-eleven"]})
+    assert merchant_key("7-ELEVEN", matcher) != merchant_key("8-ELEVEN", matcher)
+    long_key = merchant_key("x" * 200)
+    assert len(long_key) == MERCHANT_KEY_LENGTH
+    assert long_key != merchant_key("x" * 199)
+
+
+@pytest.mark.asyncio
+async def test_merchants_never_merge_differently_categorized_descriptions(
+    db_session, monkeypatch
+):
+    monkeypatch.setattr(
+        category_rules, "CATEGORY_RULES", dict(category_rules.CATEGORY_RULES, Shops=["7-eleven"])
+    )
+    descriptions = {
+        "7-ELEVEN 204": "Shops",
+        "8-ELEVEN 204": "Other",
+        "UBER EATS 55": "Food",
+        "UBER  EATS 55": "Transport",  # no "uber eats" keyword match with two spaces
+    }
+    txns = [
+        {"date": "2024-06-01", "description": description, "amount": -5.0}
+        for description in descriptions
+    ]
+    await bulk_create_transactions(db_session, "doc-m3", "fam-merchant-keys", txns)
+
+    rows = await list_transactions(db_session, "fam-merchant-keys")
+    assert {row.description: row.category for row in rows} == descriptions
+    assert len({row.merchant_id for row in rows}) == 4
+    await db_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_transactions_share_merchants_with_one_lookup(db_session, async_engine, monkeypatch):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        txns = [
+            {"date": "2024-02-01", "description": f"NETFLIX.COM {ref}", "amount": -15.99}
+            for ref in ("1001", "2002", "3003")
+        ] + [{"date": "2024-02-02", "description": "Corner Bakery", "amount": -8.0}]
+        await bulk_create_transactions(db_session, "doc-m1", "fam-merchant", txns)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+    # One lookup, then one read-back of the keys it inserted
+    assert sum(1 for s in statements if s.startswith("SELECT") and "merchant" in s) == 2
+
+    rows = await list_transactions(db_session, "fam-merchant")
+    assert len({row.merchant_id for row in rows}) == 2
+    assert {row.category for row in rows} == {"Entertainment", "Other"}
+    count = await db_session.scalar(
+        select(func.count()).select_from(Merchant).where(Merchant.key == "netflix.com #")
+    )
+    assert count == 1
+
+    # New rules re-resolve the known merchant instead of keeping a stale category
+    monkeypatch.setattr(
+        category_rules, "CATEGORY_RULES", dict(category_rules.CATEGORY_RULES, Food=["bakery"])
+    )
+    await bulk_create_transactions(
+        db_session, "doc-m2", "fam-merchant",
+        [{"date": "2024-03-02", "description": "CORNER BAKERY", "amount": -6.0}],
+    )
+    rows = await list_transactions(db_session, "fam-merchant", month="2024-03")
+    assert rows[0].category == "Food"
+    await db_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_imports_share_new_merchant(async_engine, monkeypatch):
+    # Both transactions look the new merchant up before either inserts it
+    barrier = asyncio.Barrier(2)
+    lookup = merchant_repo.get_merchants
+    waited = set()
+
+    async def racing_lookup(session, keys):
+        found = await lookup(session, keys)
+        if id(session) not in waited:
+            waited.add(id(session))
+            await barrier.wait()
+        return found
+
+    monkeypatch.setattr(merchant_repo, "get_merchants", racing_lookup)
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def import_statement(document_id, extra):
+        async with factory() as session:
+            txns = [
+                {"date": "2024-05-01", "description": "LUNAR NOODLE BAR 17", "amount": -21.0},
+                {"date": "2024-05-02", "description": extra, "amount": -4.0},
+            ]
+            await bulk_create_transactions(session, document_id, "fam-race", txns)
+            await session.commit()
+
+    await asyncio.gather(
+        import_statement("doc-race-1", "Kiosk Alpha"),
+        import_statement("doc-race-2", "Kiosk Beta"),
+    )
+
+    async with factory() as session:
+        rows = await list_transactions(session, "fam-race")
+        count = await session.scalar(
+            select(func.count()).select_from(Merchant).where(Merchant.key == "lunar noodle bar #")
+        )
+    assert len(rows) == 4
+    assert count == 1
+    shared = {row.merchant_id for row in rows if row.description.startswith("LUNAR")}
+    assert len(shared) == 1
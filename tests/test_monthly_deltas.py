@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.app.db.models import Membership, MonthlySummary
+from backend.app.db.repositories.document_repo import create_document
+from backend.app.db.repositories.family_repo import create_family
+from backend.app.db.repositories.summary_repo import (
+    add_documents_to_summaries,
+    list_category_summaries,
+    list_monthly_summaries,
+    remove_documents_from_summaries,
+)
+from backend.app.db.repositories.transaction_repo import bulk_create_transactions
+from backend.app.main import app
+
+JANUARY = [
+    {"date": "2024-01-03", "description": "NETFLIX.COM", "amount": -15.99},
+    {"date": "2024-01-15", "description": "SALARY ACME PTY", "amount": 4200.0},
+]
+JANUARY_FEBRUARY = [
+    {"date": "2024-01-20", "description": "CITY PHARMACY", "amount": -40.0},
+    {"date": "2024-02-01", "description": "NETFLIX.COM", "amount": -15.99},
+]
+
+
+async def _ingest(session, family_id, rows):
+    doc = await create_document(session, family_id, "statement.csv")
+    await bulk_create_transactions(session, doc.id, family_id, rows)
+    await add_documents_to_summaries(session, family_id, [doc.id])
+    return doc.id
+
+
+async def _months(session, family_id):
+    return {
+        s.month: (s.income, s.expenses, s.savings, s.transaction_count)
+        for s in await list_monthly_summaries(session, family_id)
+    }
+
+
+@pytest.mark.asyncio
+async def test_statements_sharing_a_month_add_up_and_reverse(db_session):
+    family = await create_family(db_session, name="Deltas")
+    first = await _ingest(db_session, family.id, JANUARY)
+    second = await _ingest(db_session, family.id, JANUARY_FEBRUARY)
+
+    months = await _months(db_session, family.id)
+    assert months["2024-01"] == pytest.approx((4200.0, 55.99, 4144.01, 3))
+    assert months["2024-02"] == pytest.approx((0.0, 15.99, -15.99, 1))
+    january = {
+        c.category: c.total for c in await list_category_summaries(db_session, family.id, "2024-01")
+    }
+    assert january == pytest.approx({"Other": 4200.0, "Healthcare": 40.0, "Entertainment": 15.99})
+
+    # Removing the second statement leaves exactly the first one's totals
+    await remove_documents_from_summaries(db_session, family.id, [second])
+    months = await _months(db_session, family.id)
+    assert list(months) == ["2024-01"]
+    assert months["2024-01"] == pytest.approx((4200.0, 15.99, 4184.01, 2))
+    categories = await list_category_summaries(db_session, family.id)
+    assert {c.category for c in categories} == {"Other", "Entertainment"}
+
+    await remove_documents_from_summaries(db_session, family.id, [first])
+    assert await _months(db_session, family.id) == {}
+    assert await list_category_summaries(db_session, family.id) == []
+    await db_session.rollback()
+
+
+
+@pytest.mark.asyncio
+async def test_concurrent_ingests_of_a_new_month_add_up(async_engine):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        family = await create_family(session, name="Concurrent")
+        await session.commit()
+
+    async def ingest(rows):
+        async with factory() as session:
+            await _ingest(session, family.id, rows)
+            await session.commit()
+
+    await asyncio.gather(ingest(JANUARY), ingest(JANUARY_FEBRUARY))
+    async with factory() as session:
+        months = await _months(session, family.id)
+        january = await list_category_summaries(session, family.id, "2024-01")
+    assert months["2024-01"] == pytest.approx((4200.0, 55.99, 4144.01, 3))
+    assert months["2024-02"] == pytest.approx((0.0, 15.99, -15.99, 1))
+    assert len(january) == 3
+
+@pytest.mark.asyncio
+async def test_delete_document_route_reverses_summaries(db_session):
+    family = await create_family(db_session, name="Delete")
+    db_session.add(Membership(user_id="u1", family_id=family.id))
+    await _ingest(db_session, family.id, JANUARY)
+    removed = await _ingest(db_session, family.id, JANUARY_FEBRUARY)
+    queued = await create_document(db_session, family.id, "pending.pdf", status="queued")
+    await db_session.commit()
+
+    base = f"/api/documents/{family.id}"
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        busy = await client.delete(f"{base}/{queued.id}")
+        missing = await client.delete(f"{base}/nope")
+        ok = await client.delete(f"{base}/{removed}")
+
+    assert (busy.status_code, missing.status_code) == (409, 404)
+    assert ok.json() == {"deleted": True, "months_updated": 2}
+    family_id = family.id
+    db_session.expire_all()
+    stmt = select(MonthlySummary).where(MonthlySummary.family_id == family_id)
+    summaries = (await db_session.scalars(stmt)).all()
+    assert [(s.month, s.transaction_count) for s in summaries] == [("2024-01", 2)]
+    assert summaries[0].expenses == pytest.approx(15.99)
+
+
+@pytest.mark.asyncio
+async def test_health_timeline_is_bounded_and_matches_analyze_budget(db_session):
+    from backend.app.modules.budget.analyzer import analyze_budget
+
+    family = await create_family(db_session, name="Health")
+    db_session.add(Membership(user_id="u1", family_id=family.id))
+    await _ingest(db_session, family.id, JANUARY + JANUARY_FEBRUARY + [
+        {"date": "2024-03-05", "description": "RENT PAYMENT", "amount": -900.0},
+    ])
+    await db_session.commit()
+
+    base = f"/api/summary/{family.id}/health"
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        full = (await client.get(base)).json()
+        bounded = (await client.get(base, params={"from": "2024-02", "to": "2024-03"})).json()
+        invalid = await client.get(base, params={"from": "2024-2"})
+
+    assert [m["month"] for m in full] == ["2024-01", "2024-02", "2024-03"]
+    assert bounded == full[1:]
+    assert invalid.status_code == 422
+    january = analyze_budget({
+        "income": 4200.0, "expenses": 55.99,
+        "categories": {"Other": 4200.0, "Healthcare": 40.0, "Entertainment": 15.99},
+    })
+    assert full[0] == pytest.approx(
+        {"month": "2024-01", "income": 4200.0, "expenses": 55.99, **january}
+    )
+    assert full[2]["status"] == "risky" and full[2]["largest_category"] == "Housing"
@@ -0,0 +1,38 @@
+import pdfplumber
+
+from backend.app.modules.ingest.pdf_reader import (
+    PAGE_PROSE,
+    PAGE_TRANSACTIONS,
+    PageScreenStats,
+    classify_page,
+    extract_text_from_pdf,
+)
+from backend.app.services.pipeline import process_pdf
+from tests.synthetic import build_statement_pdf, build_table_statement_pdf
+
+
+def test_classify_page_separates_prose_from_transactions(tmp_path):
+    path = build_statement_pdf(str(tmp_path / "s.pdf"), pages=2, lines_per_page=5, filler_pages=2)
+    with pdfplumber.open(path) as pdf:
+        classes = [classify_page(page) for page in pdf.pages]
+    assert classes == [PAGE_TRANSACTIONS] * 2 + [PAGE_PROSE] * 2
+
+    stats = PageScreenStats()
+    text = extract_text_from_pdf(path, prescreen=True, stats=stats)
+    assert "Terms and conditions" not in text
+    assert (stats.pages, stats.skipped) == (4, 2)
+
+
+def test_prescreen_keeps_pipeline_output(tmp_path):
+    path = build_statement_pdf(str(tmp_path / "s.pdf"), pages=2, lines_per_page=10, filler_pages=3)
+    full = process_pdf(path)
+    for options in ({}, {"stream": True}):
+        screened = process_pdf(path, prescreen=True, **options)
+        assert screened["transactions_normalized"] == full["transactions_normalized"]
+        assert screened["page_screen"]["skipped"] == 3
+    assert "page_screen" not in full
+
+    table = build_table_statement_pdf(str(tmp_path / "t.pdf"), pages=2, rows_per_page=5)
+    screened = process_pdf(table, layout=True, prescreen=True)
+    assert len(screened["transactions_normalized"]) == 10
+    assert screened["page_screen"]["skipped"] == 0
@@ -0,0 +1,34 @@
+from backend.app.modules.ingest import registry
+from backend.app.modules.ingest.base import BaseDocumentParser
+from backend.app.modules.ingest.bank_statement_parser_v1 import BankStatementParserV1
+from backend.app.modules.ingest.config import IngestConfig
+
+
+class _KeywordParser(BaseDocumentParser):
+    def __init__(self, keywords, fingerprints=()):
+        self.KEYWORDS = set(keywords)
+        self.FINGERPRINTS = tuple(fingerprints)
+
+    def can_parse(self, text):
+        return any(kw in text.lower() for kw in self.KEYWORDS)
+
+    def extract(self, text):
+        return []
+
+
+def test_best_scoring_parser_wins(monkeypatch):
+    generic = BankStatementParserV1()
+    acme = _KeywordParser({"acme bank", "acme"}, fingerprints=[r"BSB \d{3}-\d{3}"])
+    monkeypatch.setattr(registry, "PARSERS", [generic, acme])
+    text = "ACME BANK statement\nBSB 123-456\nOpening balance 10.00"
+    # generic scores 1 (balance); acme scores 2 keywords + 2 for the fingerprint
+    assert registry.get_parser_for_text(text) is acme
+    assert registry.get_parser_for_text("balance only") is generic
+
+
+def test_head_miss_falls_back_to_full_text(monkeypatch):
+    monkeypatch.setattr(IngestConfig, "DISPATCH_HEAD_CHARS", 16)
+    text = "x" * 100 + "\nclosing balance"
+    assert registry.get_parser_for_head(text) is None
+    assert isinstance(registry.get_parser_for_text(text), BankStatementParserV1)
+    assert registry.get_parser_for_text("nothing to see") is None
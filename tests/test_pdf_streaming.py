@@ -0,0 +1,32 @@
+from tests.synthetic import build_statement_pdf
+from backend.app.modules.ingest.pdf_reader import extract_text_from_pdf, iter_pdf_pages
+from backend.app.services.pipeline import process_pdf
+
+
+def test_iter_pdf_pages_matches_one_shot_text(tmp_path):
+    path = build_statement_pdf(str(tmp_path / "s.pdf"), pages=3, lines_per_page=5)
+    pages = list(iter_pdf_pages(path))
+    assert len(pages) == 3
+    assert "\n".join(pages).strip() == extract_text_from_pdf(path)
+
+
+def test_iter_pdf_pages_missing_file_yields_nothing(tmp_path):
+    assert list(iter_pdf_pages(str(tmp_path / "missing.pdf"))) == []
+
+
+def test_streaming_process_pdf_matches_one_shot(tmp_path):
+    path = build_statement_pdf(str(tmp_path / "s.pdf"), pages=4, lines_per_page=8)
+    one_shot = process_pdf(path)
+    streamed = process_pdf(path, stream=True)
+    assert streamed == one_shot
+    assert len(streamed["transactions_normalized"]) == 32
+
+
+def test_parallel_extraction_preserves_page_order(tmp_path, monkeypatch):
+    from backend.app.modules.ingest.config import IngestConfig
+    from backend.app.modules.ingest.pdf_reader import extract_pages_parallel
+
+    monkeypatch.setattr(IngestConfig, "PDF_PARALLEL_MIN_PAGES", 2)
+    path = build_statement_pdf(str(tmp_path / "s.pdf"), pages=5, lines_per_page=3)
+    assert extract_pages_parallel(path, max_workers=2) == list(iter_pdf_pages(path))
+    assert extract_text_from_pdf(path, parallel=True) == extract_text_from_pdf(path)
@@ -0,0 +1,93 @@
+import random
+import time
+
+import pytest
+
+from backend.app.db.repositories.transaction_repo import bulk_create_transactions, list_transactions
+from backend.app.modules.privacy.guardrails import assert_safe_for_processing, find_unsafe
+from backend.app.modules.privacy.redactor import RedactionEngine, RedactionSpan, redact_text
+
+
+def test_redact_text_reports_spans_and_types():
+    engine = RedactionEngine()
+    text = "Card 4111 1111 1111 1111, acct 12345678, mail Fake.Person@Example.com"
+    redacted, types, spans = engine.redact_with_spans(text)
+    assert redacted == (
+        "Card [REDACTED_CARD_NUMBER], acct [REDACTED_ACCOUNT_NUMBER], mail [REDACTED_EMAIL]"
+    )
+    assert types == ["account_number", "card_number", "email"]
+    assert spans[1] == RedactionSpan(31, 39, "account_number")
+    assert [text[s.start:s.end] for s in spans][2] == "Fake.Person@Example.com"
+    assert redact_text(text) == (redacted, types)
+    assert redact_text("nothing here") == ("nothing here", [])
+
+
+def test_overlapping_matches_keep_the_leftmost():
+    # Substituting pattern by pattern used to redact the digits first and
+    # leave the rest of the address behind
+    assert redact_text("john.12345678@example.com") == ("[REDACTED_EMAIL]", ["email"])
+
+
+def test_stream_matches_one_shot_redaction():
+    rng = random.Random(3)
+    alphabet = "0123456789 -.@abGB\n"
+    engine = RedactionEngine()
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 300)))
+        cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, 6)))
+        chunks = [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+        stream = engine.redact_stream(chunks, overlap=64)
+        assert "".join(stream) == engine.redact(text)[0]
+        assert stream.spans == engine.scan(text)
+        assert stream.types == engine.redact(text)[1]
+
+
+def test_linear_engine_matches_regex_engine():
+    rng = random.Random(11)
+    alphabet = "0123456789 -._%+@aZkıK\n"
+    linear, reference = RedactionEngine(), RedactionEngine(linear=False)
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 200)))
+        assert linear.scan(text) == reference.scan(text)
+
+
+def test_adversarial_email_input_is_linear():
+    # Each of these takes minutes with the backtracking email regex
+    engine = RedactionEngine()
+    started = time.perf_counter()
+    for text in ("1-" * 100_000, "a." * 100_000 + "@", "a@" * 100_000):
+        assert all(span.type != "email" for span in engine.scan(text))
+    assert time.perf_counter() - started < 5.0
+
+
+def test_guardrail_uses_redaction_patterns():
+    assert assert_safe_for_processing("Transfer to savings")
+    assert not assert_safe_for_processing("contact fake.person@example.com")
+    assert not assert_safe_for_processing("card 4111 1111 1111 1111")
+
+
+def test_batch_guardrail_matches_single_checks():
+    rng = random.Random(5)
+    alphabet = "0123456789 -.@abGB"
+    items = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        for _ in range(2000)
+    ]
+    # Digits split across neighbouring items must not join into a match
+    items += ["1234", "5678", "4111 1111 1111", "1111", "fake.person@", "example.com", None]
+    expected = [i for i, item in enumerate(items) if not assert_safe_for_processing(item or "")]
+    assert find_unsafe(items) == expected
+    assert RedactionEngine().offending_indices(items, batch_size=7) == expected
+    assert find_unsafe([]) == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_redacts_unsafe_descriptions(db_session):
+    txns = [
+        {"date": "2024-01-02", "description": "Coffee", "amount": -4.5},
+        {"date": "2024-01-03", "description": "Transfer to 123456789", "amount": -10.0},
+    ]
+    assert await bulk_create_transactions(db_session, "doc-guard", "fam-guard", txns) == 2
+    stored = {t.description for t in await list_transactions(db_session, "fam-guard")}
+    assert stored == {"Coffee", "Transfer to [REDACTED_ACCOUNT_NUMBER]"}
+    await db_session.rollback()
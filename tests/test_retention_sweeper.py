@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.app.db.models import RetentionEntry
+from backend.app.services.retention_sweeper import RetentionSweeper
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_sweeper_deletes_expired_files_in_batches(tmp_path, async_engine):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    clock = FakeClock()
+    sweeper = RetentionSweeper(session_factory=factory, batch_size=2, clock=clock)
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"upload-{i}.pdf"
+        path.write_bytes(b"%PDF-")
+        paths.append(str(path))
+        await sweeper.schedule(str(path), delay=10 if i < 3 else 100)
+    await sweeper.schedule(paths[0], delay=50)  # moved back; the old deadline is skipped
+    assert sweeper.depth() == 5
+
+    clock.now += 20
+    assert sweeper.lag() == 10
+    assert await sweeper.sweep() == 2
+    assert [p for p in paths if (tmp_path / p).exists()] == [paths[0], paths[3], paths[4]]
+    assert sweeper.stats() == {
+        "depth": 3, "lag_seconds": 0.0, "last_sweep_lag_seconds": 10.0, "swept": 2,
+    }
+    async with factory() as session:
+        remaining = await session.scalar(
+            select(func.count()).select_from(RetentionEntry)
+            .where(RetentionEntry.file_path.in_(paths))
+        )
+    assert remaining == 3
+
+
+@pytest.mark.asyncio
+async def test_pending_deletions_survive_restart(tmp_path, async_engine):
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    clock = FakeClock()
+    path = tmp_path / "orphan.pdf"
+    path.write_bytes(b"%PDF-")
+
+    first = RetentionSweeper(session_factory=factory, clock=clock)
+    await first.schedule(str(path), delay=60)
+    # Process restarts before the deadline
+    clock.now += 3600
+    second = RetentionSweeper(session_factory=factory, clock=clock)
+    assert await second.start() >= 1
+    await second.sweep()
+    await second.stop()
+    assert not path.exists()
+    async with factory() as session:
+        assert await session.get(RetentionEntry, str(path)) is None
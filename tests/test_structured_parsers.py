@@ -0,0 +1,96 @@
+import time
+
+from backend.app.modules.ingest.csv_statement_parser import CsvStatementParser
+from backend.app.modules.ingest.fields import parse_amount
+from backend.app.modules.ingest.ofx_statement_parser import OfxStatementParser
+from backend.app.modules.ingest import registry
+from backend.app.services.pipeline import process_document, process_pdf
+from tests.synthetic import build_statement_pdf, statement_csv, statement_ofx
+
+
+def test_csv_parser_reads_debit_credit_columns():
+    text = (
+        "Account export\n"
+        "Date;Description;Debit;Credit;Balance\n"
+        '05/02/2024;"CORNER CAFE; CITY";4.50;;995.50\n'
+        "06/02/2024;SALARY ACME;;3000.00;3995.50\n"
+        "Closing balance;;;;3995.50\n"
+    )
+    assert CsvStatementParser().extract(text) == [
+        {"date": "2024-02-05", "description": "CORNER CAFE; CITY", "amount": -4.5},
+        {"date": "2024-02-06", "description": "SALARY ACME", "amount": 3000.0},
+    ]
+
+
+def test_parse_amount_reads_decimal_comma_and_point():
+    assert parse_amount("1.234,56") == 1234.56
+    assert parse_amount("-12,50") == -12.5
+    assert parse_amount("1,234.56") == 1234.56
+    assert parse_amount("1,234") == 1234.0
+    assert parse_amount("1,234", decimal=",") == 1.234
+    # Separators that do not form a consistent number are rejected
+    assert parse_amount("1.234.56") is None
+    assert parse_amount("1,23,4") is None
+
+
+def test_csv_parser_reads_decimal_comma_exports():
+    text = (
+        "Date;Description;Amount\n"
+        "05/02/2024;CORNER CAFE;-12,50\n"
+        "06/02/2024;SALARY ACME;2.500,00\n"
+        "07/02/2024;MARKET;-1,234\n"
+    )
+    assert [row["amount"] for row in CsvStatementParser().extract(text)] == [
+        -12.5,
+        2500.0,
+        -1.234,
+    ]
+
+
+def test_ofx_parser_reads_sgml_transactions():
+    text = (
+        "OFXHEADER:100\n<OFX><BANKTRANLIST>\n"
+        "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20240105120000[-5:EST]"
+        "<TRNAMT>-12.30<FITID>99<NAME>FUEL &amp; GO</STMTTRN>\n"
+        "<STMTTRN><DTPOSTED>20240106<TRNAMT>50<MEMO>REFUND\n"
+        "</BANKTRANLIST></OFX>\n"
+    )
+    assert OfxStatementParser().extract(text) == [
+        {"date": "2024-01-05", "description": "FUEL & GO", "amount": -12.3},
+        {"date": "2024-01-06", "description": "REFUND", "amount": 50.0},
+    ]
+    # Only parsers declaring the "ofx" source type are considered
+    assert isinstance(registry.get_parser_for_text(text, "ofx"), OfxStatementParser)
+
+
+def test_csv_dispatch_is_linear_on_header_like_lines():
+    csv_parser = registry.get_parser_for_text(statement_csv(5), "csv")
+    assert isinstance(csv_parser, CsvStatementParser)
+    # A single line of repeated "date," once took seconds per few KB
+    started = time.perf_counter()
+    assert registry.get_parser_for_text("date," * 20_000, "csv") is None
+    assert time.perf_counter() - started < 1.0
+
+
+def test_process_document_matches_pdf_path(tmp_path):
+    pdf = build_statement_pdf(str(tmp_path / "s.pdf"), pages=1, lines_per_page=30)
+    (tmp_path / "s.csv").write_text(statement_csv(30))
+    (tmp_path / "s.ofx").write_text(statement_ofx(30))
+
+    expected = process_pdf(pdf)["monthly_summary"]
+    assert process_document(str(tmp_path / "s.csv"))["monthly_summary"] == expected
+    assert process_document(str(tmp_path / "s.ofx"))["monthly_summary"] == expected
+
+
+def test_process_document_redacts_descriptions(tmp_path):
+    path = tmp_path / "s.csv"
+    path.write_text(
+        "Date,Description,Amount\n"
+        "2024-03-01,TRANSFER TO 123456789,-20.00\n"
+        "2024-03-02,NOTE jane@example.com,-5.00\n"
+    )
+    result = process_document(str(path))
+    descriptions = [t["description"] for t in result["transactions_normalized"]]
+    assert "123456789" not in " ".join(descriptions)
+    assert "jane@example.com" not in " ".join(descriptions)
+    assert result["redactions"] == ["account_number", "email"]
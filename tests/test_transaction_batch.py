@@ -0,0 +1,40 @@
+import pickle
+from dataclasses import asdict
+
+from backend.app.modules.budget.aggregator import aggregate_by_month
+from backend.app.modules.normalize.batch import TransactionBatch
+from backend.app.modules.normalize.normalizer import normalize_batch, normalize_transactions
+from backend.app.services.pipeline import process_document
+
+RAW = [
+    {"date": "2024-01-03", "description": "NETFLIX.COM", "amount": -15.99},
+    {"date": "2024-01-15", "description": "SALARY ACME PTY", "amount": 4200.0},
+    {"date": "2024-02-01", "description": "NETFLIX.COM", "amount": -15.99},
+    {"date": "2024-02-09", "description": "Corner Bakery", "amount": "-8.50"},
+]
+
+
+def test_batch_matches_row_objects():
+    batch = normalize_batch(RAW)
+    rows = normalize_transactions(RAW)
+    assert list(batch) == rows and batch[3] == rows[3]
+    assert batch.to_dicts() == [asdict(t) for t in rows]
+    assert aggregate_by_month(batch) == aggregate_by_month(rows)
+    assert batch.categories.values == ["Entertainment", "Other"]  # one string per category
+    restored = pickle.loads(pickle.dumps(batch))
+    assert restored.to_dicts() == batch.to_dicts()
+    restored.append("x", "2024-03-01", "Cafe", -3.0, "expense", "Food")
+    assert restored.categories.values == ["Entertainment", "Other", "Food"]
+
+
+def test_columnar_pipeline_result(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text("Date,Description,Amount\n" + "".join(
+        f"{t['date']},{t['description']},{t['amount']}\n" for t in RAW
+    ))
+    rows = process_document(str(path))
+    columnar = process_document(str(path), columnar=True)
+    assert isinstance(columnar["transactions_normalized"], TransactionBatch)
+    assert len(columnar["transactions_normalized"]) == 4
+    assert columnar["transactions_normalized"].to_dicts() == rows["transactions_normalized"]
+    assert columnar["monthly_summary"] == rows["monthly_summary"]
@@ -0,0 +1,63 @@
+import hashlib
+import os
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from tests.synthetic import build_statement_pdf
+from backend.app.api import routes
+from backend.app.db.models import Membership
+from backend.app.db.repositories.document_repo import get_document
+from backend.app.db.repositories.family_repo import create_family
+from backend.app.main import app
+from backend.app.modules.security.config import SecurityConfig
+from backend.app.modules.security.upload import UploadSink, UploadTooLarge
+from backend.app.services.pipeline import process_pdf
+
+
+def test_sink_rejects_the_moment_limit_is_crossed(tmp_path):
+    sink = UploadSink(max_size=10, directory=str(tmp_path))
+    sink.write(b"%PDF-1.4\n")
+    with pytest.raises(UploadTooLarge):
+        sink.write(b"xx")
+    sink.discard()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sink_sniffs_magic_across_chunks(tmp_path):
+    sink = UploadSink(directory=str(tmp_path))
+    for chunk in (b"%P", b"DF-1.7\n", b"rest"):
+        sink.write(chunk)
+    fh = sink.finish()
+    assert fh.read() == b"%PDF-1.7\nrest"
+    assert sink.sha256 == hashlib.sha256(b"%PDF-1.7\nrest").hexdigest()
+    sink.discard()
+
+
+def test_process_pdf_accepts_file_object(tmp_path):
+    path = build_statement_pdf(str(tmp_path / "s.pdf"), pages=1, lines_per_page=3)
+    with open(path, "rb") as fh:
+        assert process_pdf(fh) == process_pdf(path)
+
+
+@pytest.mark.asyncio
+async def test_upload_streams_hashes_and_rejects(db_session, monkeypatch, tmp_path):
+    monkeypatch.setattr(routes.ingest_queue, "submit", lambda job_id: None)
+    monkeypatch.setattr(SecurityConfig, "UPLOAD_DIR", str(tmp_path))
+    family = await create_family(db_session, name="Stream")
+    db_session.add(Membership(user_id="u1", family_id=family.id))
+    await db_session.commit()
+    url = f"/api/documents/upload?family_id={family.id}"
+    payload = b"%PDF-1.4\n" + b"0" * 100
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        ok = await client.post(url, files={"file": ("s.pdf", payload, "application/pdf")})
+        not_pdf = await client.post(url, files={"file": ("s.pdf", b"hello", "application/pdf")})
+        monkeypatch.setattr(SecurityConfig, "MAX_UPLOAD_SIZE", 50)
+        too_big = await client.post(url, files={"file": ("s.pdf", payload, "application/pdf")})
+
+    assert ok.status_code == 200
+    assert (not_pdf.status_code, too_big.status_code) == (400, 413)
+    doc = await get_document(db_session, family.id, ok.json()["id"])
+    assert doc.content_sha256 == hashlib.sha256(payload).hexdigest()
+    assert len(os.listdir(tmp_path)) == 1  # rejected uploads leave nothing behind
@@ -0,0 +1,58 @@
+import math
+import random
+
+import pytest
+
+from backend.app.modules.normalize import vectorized
+from backend.app.modules.normalize.batch import TransactionBatch
+from backend.app.modules.normalize.normalizer import VECTORIZE_MIN_ROWS, normalize_batch
+
+pytest.importorskip("numpy")
+
+DESCRIPTIONS = ["NETFLIX.COM", "SALARY ACME PTY", "Corner Bakery", "UBER 123", "city pharmacy"]
+AMOUNTS = [0, -0.0, 999.99, 1000, -1000, "-2500.50", 4200.0, 1e20, "inf", "-inf", "nan", -7.25]
+
+
+def _rows(batch):
+    # NaN amounts/confidences compare unequal to themselves; compare their repr
+    return [
+        {k: repr(v) if isinstance(v, float) and math.isnan(v) else v for k, v in row.items()}
+        for row in batch.to_dicts()
+    ]
+
+
+def test_vectorized_matches_scalar_reference():
+    rng = random.Random(3)
+    raw = [
+        {
+            "date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "description": rng.choice(DESCRIPTIONS),
+            "amount": rng.choice(AMOUNTS),
+        }
+        for _ in range(500)
+    ] + [{}, {"amount": "3"}]
+    scalar = normalize_batch(raw, vectorized=False)
+    fast = vectorized.normalize_batch_vectorized(raw)
+    assert _rows(fast) == _rows(scalar)
+    # Same dictionary encoding, not just the same decoded rows
+    for column in ("directions", "categories", "subcategories"):
+        assert getattr(fast, column).values == getattr(scalar, column).values
+        assert getattr(fast, column).codes == getattr(scalar, column).codes
+
+
+def test_vectorized_appends_to_existing_batch():
+    head = [{"date": "2024-01-01", "description": "Corner Bakery", "amount": 12.0}]
+    tail = [{"date": "2024-01-02", "description": "NETFLIX.COM", "amount": -15.99}] * 3
+    expected = normalize_batch(tail, normalize_batch(head, vectorized=False), vectorized=False)
+    batch = vectorized.normalize_batch_vectorized(tail, normalize_batch(head, vectorized=False))
+    assert batch.to_dicts() == expected.to_dicts()
+    assert batch.directions.values == ["income", "expense"]
+    assert len(vectorized.normalize_batch_vectorized([], batch)) == 4
+
+
+def test_dispatch_and_month_keys():
+    raw = [{"date": "2024-03-09", "description": "UBER", "amount": -9.0}] * VECTORIZE_MIN_ROWS
+    assert normalize_batch(raw).to_dicts() == normalize_batch(raw, vectorized=False).to_dicts()
+    assert isinstance(normalize_batch(raw[:1]), TransactionBatch)
+    codes, months = vectorized.month_keys(["2024-03-09", "2024", None, "2024-03-01", ""])
+    assert codes.tolist() == [0, 1, -1, 0, 2] and months == ["2024-03", "2024", ""]